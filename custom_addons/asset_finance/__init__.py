@@ -1,2 +1,21 @@
+import logging
+
+import psycopg2
+
+from . import controllers
 from . import models
-from . import wizard
\ No newline at end of file
+from . import wizard
+
+_logger = logging.getLogger(__name__)
+
+
+def pre_init_hook(env):
+    """Enable pg_trgm so the quick search columns get trigram GIN indexes"""
+    try:
+        with env.cr.savepoint():
+            env.cr.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    except psycopg2.Error:
+        _logger.warning("Could not create the pg_trgm extension, search indexes fall back to btree. "
+                        "Run CREATE EXTENSION pg_trgm as a superuser and update the module.")
+    else:
+        env.registry.has_trigram = True
@@ -1,10 +1,10 @@
 {
     'name': 'Asset Financing Management',
-    'version': '1.0.5',
+    'version': '1.0.11',
     'category': 'Accounting/Leasing',
     'summary': 'Manage Asset Financing, HP, and Leasing Contracts',
     'author': 'Mofisoft PTE. LTD.',
-    'depends': ['base', 'account', 'sale', 'purchase', 'fleet'],
+    'depends': ['base', 'account', 'sale', 'purchase', 'fleet', 'muk_web_refresh'],
     'data': [
         'security/security.xml',
         'security/ir_model.xml',
@@ -16,6 +16,7 @@
         'data/account_chart_data.xml',
         'data/account_config_data.xml',
         'data/mail_templates.xml',
+        'data/dunning_data.xml',
 
         # --- 1. DEFINE ACTIONS FIRST ---
         'views/dashboard_views.xml',
@@ -39,7 +40,12 @@
         'views/partner_menus.xml',
         'views/access_rights_views.xml',       # Adds 'Security' to 'menu_finance_config'
         'views/res_config_settings_views.xml', # Adds 'Settings' to 'menu_finance_config'
+        'views/job_run_views.xml',             # Adds 'Job Runs' to 'menu_finance_config'
+        'views/job_queue_views.xml',           # Adds 'Background Jobs' to 'menu_finance_operations'
+        'views/dunning_views.xml',             # Adds 'Dunning Ladder' to 'menu_finance_config'
+        'views/collection_queue_views.xml',    # Adds 'Collection Queue' to 'menu_finance_operations'
         'views/report_views.xml',
+        'views/contract_ledger_views.xml',     # Adds 'Contract Ledger' to 'menu_finance_reports'
         
         'reports/finance_reports.xml',
         'reports/finance_contract_template.xml',
@@ -47,8 +53,11 @@
     'assets': {
         'web.assets_backend': [
             'asset_finance/static/src/scss/dashboard.scss',
+            'asset_finance/static/src/dashboard/finance_dashboard.js',
+            'asset_finance/static/src/dashboard/finance_dashboard.xml',
         ],
     },
+    'pre_init_hook': 'pre_init_hook',
     'installable': True,
     'application': True,
     'license': 'LGPL-3',
@@ -0,0 +1,3 @@
+from . import dashboard
+from . import quick_search
+from . import quotation
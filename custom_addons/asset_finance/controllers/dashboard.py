@@ -0,0 +1,49 @@
+import hashlib
+import json
+
+from odoo import http
+from odoo.http import request
+
+
+class FinanceDashboardController(http.Controller):
+    """
+    Per-widget JSON endpoints for the finance dashboard.
+
+    Each widget group (kpis, mtd, aging, trend) is served separately so the
+    client can fetch them in parallel and render each card as soon as its own
+    query returns, instead of waiting for the slowest compute.
+
+    Responses carry a strong ETag computed from the payload. The browser
+    revalidates with If-None-Match and gets a body-less 304 when nothing
+    changed; within the configured max-age it does not call the server at all.
+    """
+
+    WIDGETS = ('kpis', 'mtd', 'aging', 'trend')
+
+    @http.route('/asset_finance/dashboard/<string:widget>', type='http', auth='user', methods=['GET'], readonly=True)
+    def dashboard_widget(self, widget, **kwargs):
+        if widget not in self.WIDGETS:
+            return request.not_found()
+
+        Dashboard = request.env['finance.dashboard']
+        Dashboard.check_access('read')
+
+        payload = json.dumps(Dashboard.get_widget_data(widget), default=str, sort_keys=True)
+        etag = '"%s"' % hashlib.sha1(payload.encode()).hexdigest()
+        headers = [
+            ('ETag', etag),
+            ('Cache-Control', 'private, max-age=%d' % self._get_cache_max_age()),
+            ('Vary', 'Cookie'),
+        ]
+
+        if request.httprequest.if_none_match.contains(etag.strip('"')):
+            return request.make_response('', headers=headers, status=304)
+
+        return request.make_response(payload, headers=headers + [('Content-Type', 'application/json')])
+
+    def _get_cache_max_age(self):
+        param = request.env['ir.config_parameter'].sudo().search([('key', '=', 'asset_finance.dashboard_cache_seconds')], limit=1)
+        try:
+            return int(param.value or 60) if param else 60
+        except ValueError:
+            return 60
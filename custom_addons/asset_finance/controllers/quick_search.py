@@ -0,0 +1,29 @@
+import json
+
+from odoo import http
+from odoo.http import request
+
+
+class FinanceQuickSearchController(http.Controller):
+    """Finance quick search box and caller lookup, answered as JSON"""
+
+    @http.route('/asset_finance/quick_search', type='http', auth='user', methods=['GET'], readonly=True)
+    def quick_search(self, q='', limit=10, **kwargs):
+        try:
+            limit = max(1, min(int(limit), 50))
+        except ValueError:
+            limit = 10
+        results = request.env['finance.quick.search'].search_records(q, limit=limit)
+        return request.make_response(
+            json.dumps({'results': results}, default=str),
+            headers=[('Content-Type', 'application/json'), ('Cache-Control', 'no-store')],
+        )
+
+    @http.route('/asset_finance/phone_lookup', type='http', auth='user', methods=['GET'], readonly=True)
+    def phone_lookup(self, number='', **kwargs):
+        """Partners matching a caller's number, with all their finance contracts"""
+        partners = request.env['res.partner'].finance_phone_lookup(number)
+        return request.make_response(
+            json.dumps({'partners': partners}, default=str),
+            headers=[('Content-Type', 'application/json'), ('Cache-Control', 'no-store')],
+        )
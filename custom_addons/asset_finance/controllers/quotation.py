@@ -0,0 +1,11 @@
+from odoo import http
+from odoo.http import request
+
+
+class FinanceQuotationController(http.Controller):
+    """Record-free instant quotes for dealer and officer calculators"""
+
+    @http.route('/asset_finance/quotation', type='jsonrpc', auth='user', methods=['POST'], readonly=True)
+    def quotation(self, scenarios, with_schedule=False, **kwargs):
+        """Quote a batch of scenarios, see finance.quotation.quote; nothing is written"""
+        return {'quotes': request.env['finance.quotation'].quote(scenarios, with_schedule=bool(with_schedule))}
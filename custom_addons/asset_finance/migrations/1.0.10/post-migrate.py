@@ -0,0 +1,34 @@
+import logging
+
+from odoo import api, SUPERUSER_ID
+
+_logger = logging.getLogger(__name__)
+
+
+def migrate(cr, version):
+    """
+    Late charges and misc fees are now derived from the contract ledger: post
+    an adjustment entry for the contracts whose columns drifted from it
+    """
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    cr.execute("""
+        SELECT c.id
+        FROM finance_contract c
+        LEFT JOIN LATERAL (
+            SELECT l.penalty_balance, l.fee_balance
+            FROM finance_contract_ledger l
+            WHERE l.contract_id = c.id
+            ORDER BY l.date DESC, l.id DESC
+            LIMIT 1
+        ) l ON TRUE
+        WHERE c.ac_status != 'draft'
+          AND (COALESCE(c.balance_late_charges, 0) != COALESCE(l.penalty_balance, 0)
+               OR COALESCE(c.balance_misc_fee, 0) != COALESCE(l.fee_balance, 0))
+    """)
+    contracts = env['finance.contract'].browse([row[0] for row in cr.fetchall()])
+    for contract in contracts:
+        contract.write({
+            'balance_late_charges': contract.balance_late_charges,
+            'balance_misc_fee': contract.balance_misc_fee,
+        })
+    _logger.info("Posted ledger adjustments for %s contracts", len(contracts))
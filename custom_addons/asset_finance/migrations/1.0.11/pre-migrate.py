@@ -0,0 +1,18 @@
+from odoo import api, SUPERUSER_ID
+from odoo.tools.sql import make_index_name
+
+
+def migrate(cr, version):
+    """
+    The quick search matches partners on complete_name by substring: drop the
+    core btree index so the update recreates it as a trigram one
+    """
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    if not env.registry.has_trigram:
+        return
+    cr.execute("""
+        SELECT indexname FROM pg_indexes
+        WHERE indexname = %s AND indexdef NOT ILIKE '%%USING gin%%'
+    """, [make_index_name('res_partner', 'complete_name')])
+    for indexname, in cr.fetchall():
+        cr.execute(f'DROP INDEX IF EXISTS "{indexname}"')
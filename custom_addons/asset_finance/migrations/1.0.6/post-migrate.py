@@ -0,0 +1,12 @@
+import logging
+
+from odoo import api, SUPERUSER_ID
+
+_logger = logging.getLogger(__name__)
+
+
+def migrate(cr, version):
+    """Open the contract ledger of the existing contracts with their current balances"""
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    count = env['finance.contract.ledger']._seed_opening_entries()
+    _logger.info("Opened the contract ledger of %s contracts", count)
@@ -0,0 +1,7 @@
+from odoo import api, SUPERUSER_ID
+
+
+def migrate(cr, version):
+    """Solve the effective rates of the existing contracts in one vectorized pass"""
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    env['finance.contract']._recompute_effective_rates()
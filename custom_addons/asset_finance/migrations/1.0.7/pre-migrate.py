@@ -0,0 +1,7 @@
+def migrate(cr, version):
+    """Create the effective rate columns so the upgrade does not compute them record by record"""
+    cr.execute("""
+        ALTER TABLE finance_contract
+            ADD COLUMN IF NOT EXISTS eir_rate numeric,
+            ADD COLUMN IF NOT EXISTS apr_rate numeric
+    """)
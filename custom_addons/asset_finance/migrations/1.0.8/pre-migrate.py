@@ -0,0 +1,14 @@
+def migrate(cr, version):
+    """Let the upgrade reload the notice templates, rewritten in the inline template syntax"""
+    cr.execute("""
+        UPDATE ir_model_data
+        SET noupdate = FALSE
+        WHERE module = 'asset_finance'
+          AND model = 'mail.template'
+          AND name IN %s
+    """, [(
+        'email_template_payment_reminder',
+        'email_template_overdue_notice',
+        'email_template_4th_schedule',
+        'email_template_settlement_quotation',
+    )])
@@ -0,0 +1,30 @@
+from odoo import api, SUPERUSER_ID
+from odoo.tools.sql import make_index_name
+
+from odoo.addons.asset_finance import pre_init_hook
+
+# quick search columns, indexed with btree when pg_trgm was missing
+TRIGRAM_COLUMNS = [
+    ('finance_asset', 'registration_no'),
+    ('finance_asset', 'chassis_no'),
+    ('finance_contract', 'agreement_no'),
+    ('finance_contract', 'asset_reg_no'),
+    ('res_partner', 'nric'),
+]
+
+
+def migrate(cr, version):
+    """
+    Enable pg_trgm on databases installed before the pre_init_hook, and drop
+    the btree fallback indexes so the update recreates them as trigram ones
+    """
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    pre_init_hook(env)
+    if not env.registry.has_trigram:
+        return
+    cr.execute("""
+        SELECT indexname FROM pg_indexes
+        WHERE indexname = ANY(%s) AND indexdef NOT ILIKE '%%USING gin%%'
+    """, [[make_index_name(table, column) for table, column in TRIGRAM_COLUMNS]])
+    for indexname, in cr.fetchall():
+        cr.execute(f'DROP INDEX IF EXISTS "{indexname}"')
@@ -1,3 +1,5 @@
+from . import job_run
+from . import job_queue
 from . import master
 from . import term
 from . import asset
@@ -8,6 +10,14 @@ from . import contract_financial
 from . import contract_collection
 from . import contract_accounting
 from . import contract_line
+from . import contract_ledger
+from . import contract_eir
+from . import dunning
+from . import collection_queue
+from . import live_refresh
+from . import quick_search
+from . import quotation
+from . import screening
 from . import account_payment
 from . import account_config
 from . import product
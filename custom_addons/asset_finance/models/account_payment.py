@@ -55,8 +55,8 @@ class AccountPayment(models.Model):
                 'amount': penalty_amount,
             }))
             remaining_amount -= penalty_amount
+            # balance_late_charges follows the allocation ledger entry
             contract.total_late_paid += penalty_amount
-            contract.balance_late_charges -= penalty_amount
 
         # Step 2 & 3: Allocate to Installments (overdue first, then current)
         if remaining_amount > 0:
@@ -104,6 +104,17 @@ class AccountPayment(models.Model):
         # Write all allocations at once
         if allocation_lines:
             self.payment_allocation_ids = allocation_lines
+            installment_paid = self.allocated_to_principal + self.allocated_to_interest
+            contract._post_ledger_entries([{
+                'contract_id': contract.id,
+                'date': self.date,
+                'event_type': 'allocation',
+                'name': self.name,
+                'payment_id': self.id,
+                'outstanding_amount': -installment_paid,
+                'arrears_amount': -installment_paid,
+                'penalty_amount': -self.allocated_to_penalties,
+            }])
 
         # Log allocation in chatter
         if contract:
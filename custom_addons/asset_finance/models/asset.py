@@ -31,8 +31,9 @@ class FinanceAsset(models.Model):
     # product_id = fields.Many2one('product.product', string="Equipment Product")
 
     # Smart Fields - All readonly, computed from vehicle_id
-    registration_no = fields.Char(string="Registration No / ID", compute='_compute_details', store=True, readonly=True, tracking=True)
-    chassis_no = fields.Char(string="Chassis No", compute='_compute_details', store=True, readonly=True)
+    registration_no = fields.Char(string="Registration No / ID", compute='_compute_details', store=True, readonly=True, tracking=True,
+                                  index='trigram')
+    chassis_no = fields.Char(string="Chassis No", compute='_compute_details', store=True, readonly=True, index='trigram')
     make = fields.Char(string="Make", compute='_compute_details', store=True, readonly=True)
     model = fields.Char(string="Model", compute='_compute_details', store=True, readonly=True)
 
@@ -64,9 +65,9 @@ class FinanceAsset(models.Model):
     # Computed field for easy identification
     display_name = fields.Char(compute='_compute_display_name', store=True)
 
-    @api.depends('asset_type', 'vehicle_id', 'vehicle_id.license_plate', 'vehicle_id.vin_sn', 'vehicle_id.model_id',
-                 'vehicle_id.engine_no', 'vehicle_id.engine_capacity', 'vehicle_id.year_manufacture',
-                 'vehicle_id.vehicle_condition', 'vehicle_id.color')
+    # Only (re)linking recomputes here: later edits of the vehicle, its model
+    # or brand are synced in batch by fleet.vehicle._sync_finance_assets
+    @api.depends('asset_type', 'vehicle_id')
     def _compute_details(self):
         for rec in self:
             if rec.asset_type == 'vehicle' and rec.vehicle_id:
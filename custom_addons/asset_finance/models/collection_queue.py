@@ -0,0 +1,280 @@
+import heapq
+
+from odoo import models, fields, api, _
+from odoo.exceptions import UserError
+
+from .job_run import finance_job, get_job_tracker
+
+# Weights of the priority score: (config parameter, default)
+SCORE_WEIGHTS = {
+    'days': ('asset_finance.collection_weight_days', 1.0),
+    'amount': ('asset_finance.collection_weight_amount', 1.0),
+    'status': ('asset_finance.collection_weight_status', 50.0),
+    'silence': ('asset_finance.collection_weight_silence', 0.5),
+}
+
+
+class FinanceCollectionQueue(models.Model):
+    """
+    Stored collector work queue: one row per overdue active contract.
+
+    Rows are upserted with set-based SQL, incrementally for the contracts
+    whose payments or overdue facts changed in the transaction (see
+    ``_mark_dirty``) and fully by a nightly rebuild, since overdue days grow
+    every day. Reading a collector's accounts is then a plain indexed scan
+    on (collector_id, priority_score).
+    """
+    _name = 'finance.collection.queue'
+    _description = 'Collection Work Queue'
+    _order = 'priority_score desc, id'
+    _rec_name = 'agreement_no'
+
+    contract_id = fields.Many2one('finance.contract', string="Contract", required=True, readonly=True,
+                                  ondelete='cascade')
+    collector_id = fields.Many2one('res.users', string="Collector", index=True,
+                                   domain=lambda self: [('all_group_ids', 'in', self.env.ref('asset_finance.group_collection_staff').id)])
+    company_id = fields.Many2one('res.company', string="Company", readonly=True, index=True)
+    currency_id = fields.Many2one('res.currency', readonly=True)
+
+    # --- Denormalized contract facts (refreshed by SQL) ---
+    agreement_no = fields.Char(string="Agreement No", readonly=True)
+    hirer_id = fields.Many2one('res.partner', string="Hirer", readonly=True)
+    asset_reg_no = fields.Char(string="Asset", readonly=True)
+    late_status = fields.Selection([
+        ('normal', 'Normal'),
+        ('attention', 'Attention'),
+        ('legal', 'Legal Action')
+    ], string="Status", readonly=True)
+    dunning_step_id = fields.Many2one('finance.dunning.step', string="Dunning Step", readonly=True)
+    overdue_days = fields.Integer(string="Days Overdue", readonly=True)
+    overdue_amount = fields.Monetary(string="Overdue Amount", readonly=True, currency_field='currency_id')
+    total_payable = fields.Monetary(string="Total Due", readonly=True, currency_field='currency_id')
+    last_payment_date = fields.Date(string="Last Payment", readonly=True)
+    priority_score = fields.Float(string="Priority", readonly=True, digits=(16, 1))
+    date_refreshed = fields.Datetime(string="Refreshed", readonly=True)
+
+    _contract_uniq = models.Constraint('unique(contract_id)', 'A contract can only be queued once!')
+    # "My accounts" reads: WHERE collector_id = uid ORDER BY priority_score DESC
+    _collector_priority_idx = models.Index('(collector_id, priority_score DESC)')
+
+    # --------------------------------------------------------
+    # INCREMENTAL REFRESH
+    # --------------------------------------------------------
+
+    @api.model
+    def _mark_dirty(self, contract_ids):
+        """Refresh the queue rows of ``contract_ids`` once, right before the transaction commits"""
+        contract_ids = [cid for cid in contract_ids if isinstance(cid, int)]
+        if not contract_ids:
+            return
+        dirty = self.env.cr.precommit.data.setdefault('finance.collection.queue.dirty', set())
+        if not dirty:
+            self.env.cr.precommit.add(self._flush_dirty)
+        dirty.update(contract_ids)
+
+    @api.model
+    def _flush_dirty(self):
+        contract_ids = self.env.cr.precommit.data.pop('finance.collection.queue.dirty', set())
+        if contract_ids:
+            self.sudo()._refresh(list(contract_ids))
+
+    @api.model
+    def _get_score_weights(self):
+        ICP = self.env['ir.config_parameter'].sudo()
+        weights = {}
+        for key, (param_key, default) in SCORE_WEIGHTS.items():
+            param = ICP.search([('key', '=', param_key)], limit=1)
+            weights[key] = float(param.value) if param else default
+        return weights
+
+    @api.model
+    def _refresh(self, contract_ids=None):
+        """
+        Upsert the queue rows of ``contract_ids`` (all contracts if None) and
+        drop the rows of contracts that are no longer overdue. The collector
+        assignment of existing rows is kept. Returns the number of queued rows.
+        """
+        self.env.flush_all()
+        param = self.env['ir.config_parameter'].sudo().search([('key', '=', 'asset_finance.grace_period_days')], limit=1)
+        grace_period = int(param.value) if param else 7
+        params = dict(self._get_score_weights(), today=fields.Date.today(), grace=grace_period,
+                      ids=contract_ids or [], all=contract_ids is None, uid=self.env.uid)
+        self.env.cr.execute("""
+            WITH overdue AS (
+                SELECT l.contract_id,
+                       GREATEST(0, (%(today)s::date - MIN(l.date_due)) - %(grace)s) AS overdue_days,
+                       SUM(m.amount_residual) AS overdue_amount
+                FROM finance_contract_line l
+                JOIN account_move m ON m.id = l.invoice_id
+                WHERE l.date_due < %(today)s
+                  AND m.payment_state NOT IN ('paid', 'in_payment')
+                  AND (%(all)s OR l.contract_id = ANY(%(ids)s))
+                GROUP BY l.contract_id
+            ), last_payment AS (
+                SELECT p.contract_id, MAX(p.date) AS last_payment_date
+                FROM account_payment p
+                WHERE p.state = 'posted' AND p.payment_type = 'inbound'
+                  AND p.contract_id IS NOT NULL
+                  AND (%(all)s OR p.contract_id = ANY(%(ids)s))
+                GROUP BY p.contract_id
+            ), facts AS (
+                SELECT c.id AS contract_id, c.company_id, c.currency_id, c.agreement_no, c.hirer_id,
+                       c.asset_reg_no, c.late_status, c.dunning_step_id,
+                       o.overdue_days, o.overdue_amount, lp.last_payment_date,
+                       COALESCE(c.total_payable, 0) AS total_payable
+                FROM finance_contract c
+                JOIN overdue o ON o.contract_id = c.id
+                LEFT JOIN last_payment lp ON lp.contract_id = c.id
+                WHERE c.ac_status = 'active' AND o.overdue_days > 0
+            )
+            INSERT INTO finance_collection_queue (
+                contract_id, company_id, currency_id, agreement_no, hirer_id, asset_reg_no,
+                late_status, dunning_step_id, overdue_days, overdue_amount, total_payable,
+                last_payment_date, priority_score, date_refreshed,
+                create_uid, create_date, write_uid, write_date
+            )
+            SELECT contract_id, company_id, currency_id, agreement_no, hirer_id, asset_reg_no,
+                   late_status, dunning_step_id, overdue_days, overdue_amount, total_payable,
+                   last_payment_date,
+                   %(days)s * overdue_days
+                     + %(amount)s * total_payable / 1000.0
+                     + %(status)s * CASE late_status WHEN 'legal' THEN 2 WHEN 'attention' THEN 1 ELSE 0 END
+                     + %(silence)s * COALESCE(%(today)s::date - last_payment_date, overdue_days),
+                   now() AT TIME ZONE 'UTC',
+                   %(uid)s, now() AT TIME ZONE 'UTC', %(uid)s, now() AT TIME ZONE 'UTC'
+            FROM facts
+            ON CONFLICT (contract_id) DO UPDATE SET
+                company_id = EXCLUDED.company_id,
+                currency_id = EXCLUDED.currency_id,
+                agreement_no = EXCLUDED.agreement_no,
+                hirer_id = EXCLUDED.hirer_id,
+                asset_reg_no = EXCLUDED.asset_reg_no,
+                late_status = EXCLUDED.late_status,
+                dunning_step_id = EXCLUDED.dunning_step_id,
+                overdue_days = EXCLUDED.overdue_days,
+                overdue_amount = EXCLUDED.overdue_amount,
+                total_payable = EXCLUDED.total_payable,
+                last_payment_date = EXCLUDED.last_payment_date,
+                priority_score = EXCLUDED.priority_score,
+                date_refreshed = EXCLUDED.date_refreshed,
+                write_uid = EXCLUDED.write_uid,
+                write_date = EXCLUDED.write_date
+            RETURNING contract_id
+        """, params)
+        kept_ids = [row[0] for row in self.env.cr.fetchall()]
+
+        self.env.cr.execute("""
+            DELETE FROM finance_collection_queue
+            WHERE (%(all)s OR contract_id = ANY(%(ids)s))
+              AND NOT (contract_id = ANY(%(kept)s))
+        """, dict(params, kept=kept_ids))
+        self.invalidate_model()
+
+        if self._auto_assign_enabled():
+            self._auto_assign()
+        return len(kept_ids)
+
+    # --------------------------------------------------------
+    # COLLECTOR ASSIGNMENT
+    # --------------------------------------------------------
+
+    @api.model
+    def _auto_assign_enabled(self):
+        param = self.env['ir.config_parameter'].sudo().search([('key', '=', 'asset_finance.collection_auto_assign')], limit=1)
+        return bool(param and param.value not in ('False', '0', ''))
+
+    @api.model
+    def _auto_assign(self):
+        """Give unassigned rows, highest priority first, to the least loaded collector"""
+        self.env.cr.execute("""
+            SELECT id FROM finance_collection_queue
+            WHERE collector_id IS NULL
+            ORDER BY priority_score DESC, id
+        """)
+        row_ids = [row[0] for row in self.env.cr.fetchall()]
+        collectors = self.env.ref('asset_finance.group_collection_staff').sudo().all_user_ids.filtered('active')
+        if not row_ids or not collectors:
+            return
+
+        self.env.cr.execute("""
+            SELECT collector_id, COUNT(*) FROM finance_collection_queue
+            WHERE collector_id = ANY(%s) GROUP BY collector_id
+        """, [collectors.ids])
+        load = dict(self.env.cr.fetchall())
+        heap = [(load.get(uid, 0), uid) for uid in collectors.ids]
+        heapq.heapify(heap)
+        assigned = []
+        for row_id in row_ids:
+            count, uid = heapq.heappop(heap)
+            assigned.append(uid)
+            heapq.heappush(heap, (count + 1, uid))
+
+        self.env.cr.execute("""
+            UPDATE finance_collection_queue q SET collector_id = a.collector_id
+            FROM unnest(%s::int[], %s::int[]) AS a(id, collector_id)
+            WHERE q.id = a.id
+        """, [row_ids, assigned])
+        self.invalidate_model(['collector_id'])
+
+    def write(self, vals):
+        if 'collector_id' in vals and not self.env.user.has_group('asset_finance.group_finance_manager'):
+            if vals['collector_id'] != self.env.uid or self.filtered('collector_id'):
+                raise UserError(_("Only finance managers can reassign accounts between collectors."))
+        return super().write(vals)
+
+    def action_assign_to_me(self):
+        self.write({'collector_id': self.env.uid})
+
+    def action_open_contract(self):
+        self.ensure_one()
+        return {
+            'type': 'ir.actions.act_window',
+            'res_model': 'finance.contract',
+            'res_id': self.contract_id.id,
+            'view_mode': 'form',
+        }
+
+    # --------------------------------------------------------
+    # NIGHTLY REBUILD (CRON JOB)
+    # --------------------------------------------------------
+
+    @api.model
+    @finance_job('Collection Queue Rebuild')
+    def _cron_rebuild_queue(self):
+        """Nightly: overdue days and scores move every day, so rebuild every row"""
+        tracker = get_job_tracker(self.env)
+        with tracker.chunk(_("Rebuild")):
+            count = self._refresh()
+        tracker.add_written(count)
+
+
+class FinanceContract(models.Model):
+    _inherit = 'finance.contract'
+
+    collection_queue_ids = fields.One2many('finance.collection.queue', 'contract_id', string="Collection Queue")
+
+    def _get_collection_queue_fields(self):
+        """Contract fields whose change refreshes the collection queue row"""
+        return {
+            'ac_status', 'late_status', 'dunning_step_id', 'agreement_no', 'hirer_id',
+            'asset_reg_no', 'total_payable', 'total_overdue_days',
+        }
+
+    def _write_multi(self, vals_list):
+        # Written and recomputed values (overdue status once an invoice is
+        # paid or falls due) all reach the database through the flush
+        res = super()._write_multi(vals_list)
+        fnames = self._get_collection_queue_fields()
+        self.env['finance.collection.queue']._mark_dirty([
+            contract.id for contract, vals in zip(self, vals_list) if fnames & set(vals)
+        ])
+        return res
+
+
+class AccountPayment(models.Model):
+    _inherit = 'account.payment'
+
+    def action_post(self):
+        res = super().action_post()
+        self.env['finance.collection.queue']._mark_dirty(self.contract_id.ids)
+        return res
@@ -5,8 +5,8 @@ class FinanceContractGuarantor(models.Model):
     _name = 'finance.contract.guarantor'
     _description = 'Guarantor Line'
 
-    contract_id = fields.Many2one('finance.contract', string="Contract", ondelete='cascade')
-    partner_id = fields.Many2one('res.partner', string="Guarantor Name", required=True,
+    contract_id = fields.Many2one('finance.contract', string="Contract", ondelete='cascade', index=True)
+    partner_id = fields.Many2one('res.partner', string="Guarantor Name", required=True, index=True,
                                  domain="[('finance_partner_type', 'in', [False, '']), ('finance_blacklist', '=', False)]",
                                  help="Select an individual or company to act as guarantor (not a broker/insurer/finance company/supplier).")
 
@@ -40,8 +40,8 @@ class FinanceContractJointHirer(models.Model):
     _name = 'finance.contract.joint.hirer'
     _description = 'Co-Borrower Line'
 
-    contract_id = fields.Many2one('finance.contract', string="Contract", ondelete='cascade')
-    partner_id = fields.Many2one('res.partner', string="Co-Borrower Name", required=True,
+    contract_id = fields.Many2one('finance.contract', string="Contract", ondelete='cascade', index=True)
+    partner_id = fields.Many2one('res.partner', string="Co-Borrower Name", required=True, index=True,
                                  domain="[('finance_partner_type', 'in', [False, '']), ('finance_blacklist', '=', False)]",
                                  help="Select an individual or company to act as co-borrower (not a broker/insurer/finance company/supplier).")
 
@@ -96,9 +96,10 @@ class FinanceContract(models.Model):
     product_type = fields.Selection(related='product_id.product_type', string="Product Type", store=True)
 
     asset_id = fields.Many2one('finance.asset', string="Asset", required=True)
-    asset_reg_no = fields.Char(related='asset_id.vehicle_id.license_plate', string="Asset Reg No.", store=True)
-    asset_make = fields.Char(related='asset_id.vehicle_id.model_id.brand_id.name', string="Make", store=True)
-    asset_model = fields.Char(related='asset_id.vehicle_id.model_id.name', string="Model", store=True)
+    # Vehicle changes are propagated by fleet.vehicle._sync_finance_assets, not by the ORM
+    asset_reg_no = fields.Char(string="Asset Reg No.", compute='_compute_asset_details', store=True, index='trigram')
+    asset_make = fields.Char(string="Make", compute='_compute_asset_details', store=True)
+    asset_model = fields.Char(string="Model", compute='_compute_asset_details', store=True)
     asset_type = fields.Selection(related='asset_id.asset_type', string="Asset Type", store=True)
 
     asset_condition = fields.Selection([
@@ -108,13 +109,13 @@ class FinanceContract(models.Model):
     ], string="Asset Condition", required=True, default='new')
 
 
-    hirer_id = fields.Many2one('res.partner', string="Hirer's Name", required=True, tracking=True,
+    hirer_id = fields.Many2one('res.partner', string="Hirer's Name", required=True, tracking=True, index=True,
                                domain="[('finance_partner_type', 'in', [False, '']), ('finance_blacklist', '=', False)]",
                                help="Select the individual or company hiring the asset (not a broker/insurer/finance company/supplier).")
     ic_no = fields.Char(related='hirer_id.vat', string="ID / IC No.", readonly=False)
 
     agreement_date = fields.Date(string="Agreement Date", default=fields.Date.context_today)
-    agreement_no = fields.Char(string="Agreement No", required=True, copy=False, default='New')
+    agreement_no = fields.Char(string="Agreement No", required=True, copy=False, default='New', index='trigram')
 
     finance_company_id = fields.Many2one('res.partner', string="Finance Name",
                                          domain="[('finance_partner_type', '=', 'finance_company')]")
@@ -216,13 +217,13 @@ class FinanceContract(models.Model):
     no_inst_paid = fields.Integer(string="No. of Inst. Paid", compute='_compute_payment_status', store=True)
     total_inst_paid = fields.Monetary(string="Total Installment Paid", compute='_compute_payment_status', store=True)
     total_late_paid = fields.Monetary(string="Total Late Paid", default=0.0)
-    balance_installment = fields.Monetary(string="Balance Installment", compute='_compute_balances')
+    balance_installment = fields.Monetary(string="Balance Installment", compute='_compute_balances', store=True, index=True)
     last_record_date = fields.Date(string="Last Record Date")
 
-    os_balance = fields.Monetary(string="O/S Balance", compute='_compute_balances')
+    os_balance = fields.Monetary(string="O/S Balance", compute='_compute_balances', store=True, index=True)
     balance_late_charges = fields.Monetary(string="Balance Late Charges")
     balance_misc_fee = fields.Monetary(string="Balance Misc Fee")
-    total_payable = fields.Monetary(string="Total Payable", compute='_compute_balances')
+    total_payable = fields.Monetary(string="Total Payable", compute='_compute_balances', store=True, index=True)
     next_inst_date = fields.Date(string="Next Inst. Date")
 
     collection_bank_id = fields.Many2one('res.bank', string="Collection Bank ID")
@@ -319,15 +320,7 @@ class FinanceContract(models.Model):
             self._onchange_rv_percent()
 
             # --- New Domain Logic ---
-            prod = self.product_id
-            term_domain = []
-            if prod.min_months and prod.max_months and prod.step_months > 0:
-                valid_months = list(range(prod.min_months, prod.max_months + 1, prod.step_months))
-                term_domain = [('months', 'in', valid_months)]
-            else:
-                # Fallback to default if no rules are set on the product
-                default_months = list(range(12, 121, 12))
-                term_domain = [('months', 'in', default_months)]
+            term_domain = [('months', 'in', self.product_id._get_allowed_months())]
 
             return {'domain': {'no_of_inst': term_domain}}
 
@@ -409,13 +402,29 @@ class FinanceContract(models.Model):
         if self.env.context.get('skip_schedule_generation'):
             return res
         if any(f in vals for f in trigger_fields):
-            for rec in self:
-                if rec.line_ids:
-                    rec.with_context(skip_schedule_generation=True).action_generate_schedule()
+            Job = self.env['finance.job']
+            if Job._should_enqueue(self):
+                Job._enqueue(self, '_regenerate_schedules', _('Regenerate Schedules'))
+            else:
+                self._regenerate_schedules()
         return res
 
+    def _regenerate_schedules(self):
+        """Rebuild the schedule of contracts that already have one"""
+        for rec in self:
+            if rec.line_ids:
+                rec.with_context(skip_schedule_generation=True).action_generate_schedule()
+
     # --- Computed Fields ---
 
+    @api.depends('asset_id.vehicle_id')
+    def _compute_asset_details(self):
+        for rec in self:
+            vehicle = rec.asset_id.vehicle_id
+            rec.asset_reg_no = vehicle.license_plate
+            rec.asset_make = vehicle.model_id.brand_id.name
+            rec.asset_model = vehicle.model_id.name
+
     def _compute_payment_count(self):
         for rec in self:
             rec.payment_count = self.env['account.payment'].search_count([('contract_id', '=', rec.id)])
@@ -436,6 +445,8 @@ class FinanceContract(models.Model):
 
     @api.depends('balance_hire', 'total_inst_paid', 'balance_late_charges', 'balance_misc_fee')
     def _compute_balances(self):
+        # Stored so lists and reports can sort, filter and group on them; only
+        # the contracts whose payments, penalties or fees changed are recomputed
         for rec in self:
             rec.balance_installment = rec.balance_hire - rec.total_inst_paid
             rec.os_balance = rec.balance_installment
@@ -1,6 +1,8 @@
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError
 
+from .job_run import finance_job, get_job_tracker
+
 class FinanceContract(models.Model):
     _inherit = 'finance.contract'
 
@@ -124,6 +126,14 @@ class FinanceContract(models.Model):
         # Link to contract
         self.disbursement_move_id = move.id
         self.ac_status = 'active'
+        self._post_ledger_entries([{
+            'contract_id': self.id,
+            'date': disbursement_date,
+            'event_type': 'disbursement',
+            'name': move.ref,
+            'move_id': move.id,
+            'outstanding_amount': self.balance_hire,
+        }])
 
         # Log in chatter
         self.message_post(
@@ -237,10 +247,30 @@ class FinanceContract(models.Model):
         # Post the entry
         settlement_move.action_post()
 
-        # Update contract status
+        # Ledger: waive the unearned interest, then clear what the settlement paid
+        self._post_ledger_entries([{
+            'contract_id': self.id,
+            'date': settlement_date,
+            'event_type': 'rebate',
+            'name': _("Unearned interest waived"),
+            'move_id': settlement_move.id,
+            'outstanding_amount': -unearned_writeoff,
+        }])
+        balances = self._get_ledger_balances(settlement_date)[self.id]
+        self._post_ledger_entries([{
+            'contract_id': self.id,
+            'date': settlement_date,
+            'event_type': 'settlement',
+            'name': settlement_move.ref,
+            'move_id': settlement_move.id,
+            'outstanding_amount': -balances['outstanding'],
+            'arrears_amount': -balances['arrears'],
+            'penalty_amount': -balances['penalty'],
+            'fee_amount': -balances['fee'],
+        }])
+
+        # Update contract status; the settlement entry clears late charges and misc fees
         self.ac_status = 'closed'
-        self.balance_late_charges = 0
-        self.balance_misc_fee = 0
 
         # Mark all remaining installments as settled
         remaining_lines = self.line_ids.filtered(
@@ -267,6 +297,7 @@ class FinanceContract(models.Model):
     # INTEREST RECOGNITION (MONTHLY)
     # --------------------------------------------------------
 
+    @finance_job('Recognize Monthly Interest')
     def _cron_recognize_monthly_interest(self):
         """
         Cron job to recognize earned interest monthly
@@ -286,6 +317,9 @@ class FinanceContract(models.Model):
             ('interest_recognized', '=', False)
         ])
 
+        tracker = get_job_tracker(self.env)
+        tracker.add_scanned(len(paid_lines))
+
         if not paid_lines:
             return
 
@@ -331,6 +365,7 @@ class FinanceContract(models.Model):
 
             # Mark lines as recognized
             contract_lines.write({'interest_recognized': True})
+            tracker.add_written(len(contract_lines))
 
             # Log
             contract.message_post(
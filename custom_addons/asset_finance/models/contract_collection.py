@@ -1,5 +1,12 @@
+import logging
+
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError
+from dateutil.relativedelta import relativedelta
+
+from .job_run import finance_job, get_job_tracker
+
+_logger = logging.getLogger(__name__)
 
 class FinanceContract(models.Model):
     _inherit = 'finance.contract'
@@ -46,15 +53,20 @@ class FinanceContract(models.Model):
     # PENALTY CALCULATION (CRON JOB)
     # --------------------------------------------------------
 
+    @finance_job('Calculate Late Interest')
     def _cron_calculate_late_interest(self):
         """
         Run nightly to calculate penalties based on the selected Rule.
         Called by scheduled action defined in data/cron.xml.
 
         Optimized with batch commits to prevent long-running transaction locks.
+        Each run is recorded as a finance.job.run with per-batch timings.
         """
+        tracker = get_job_tracker(self.env)
+
         # Ensure we only check active contracts that have a rule assigned
         active_contracts = self.search([('ac_status', '=', 'active'), ('penalty_rule_id', '!=', False)])
+        tracker.add_scanned(len(active_contracts))
         today = fields.Date.today()
 
         batch_size = 100  # Process 100 contracts per batch to prevent DB locks
@@ -64,90 +76,123 @@ class FinanceContract(models.Model):
         for i in range(0, len(active_contracts), batch_size):
             batch = active_contracts[i:i + batch_size]
 
-            # Process each contract in the batch
-            for contract in batch:
-                try:
-                    rule = contract.penalty_rule_id
-                    penalty_amount = 0.0
-
-                    # Find overdue lines
-                    overdue_lines = contract.line_ids.filtered(
-                        lambda l: l.date_due and l.date_due < today and l.invoice_id.payment_state != 'paid'
-                    )
-
-                    for line in overdue_lines:
-                        days_late = (today - line.date_due).days
-
-                        # Check Grace Period
-                        if days_late <= rule.grace_period_days:
-                            continue
-
-                        if rule.method == 'daily_percent':
-                            # Logic: (Principal * Rate / 100) / 365
-                            daily_rate = (rule.rate / 100) / 365
-                            daily_penalty = line.amount_principal * daily_rate
-                            penalty_amount += daily_penalty
-
-                        elif rule.method == 'fixed_one_time':
-                            # Check if penalty was already applied for this line
-                            if not line.penalty_applied:
-                                penalty_amount += rule.fixed_amount
-                                line.penalty_applied = True
-
-                    # Update the balance
-                    if penalty_amount > 0:
-                        contract.accrued_penalty += penalty_amount
-                        contract.balance_late_charges = contract.accrued_penalty - contract.total_late_paid
-
-                        # Log in chatter
-                        contract.message_post(
-                            body=f"Penalty of {contract.currency_id.symbol}{penalty_amount:.2f} accrued. "
-                                 f"Total penalties: {contract.currency_id.symbol}{contract.accrued_penalty:.2f}"
+            with tracker.chunk(f"Contracts {i + 1}-{i + len(batch)}", rows=len(batch)):
+                ledger_entries = []
+                # Process each contract in the batch
+                for contract in batch:
+                    try:
+                        rule = contract.penalty_rule_id
+                        penalty_amount = 0.0
+
+                        # Find overdue lines
+                        overdue_lines = contract.line_ids.filtered(
+                            lambda l: l.date_due and l.date_due < today and l.invoice_id.payment_state != 'paid'
                         )
 
-                        total_penalties_accrued += penalty_amount
-                        total_processed += 1
+                        for line in overdue_lines:
+                            days_late = (today - line.date_due).days
+
+                            # Check Grace Period
+                            if days_late <= rule.grace_period_days:
+                                continue
+
+                            if rule.method == 'daily_percent':
+                                # Logic: (Principal * Rate / 100) / 365
+                                daily_rate = (rule.rate / 100) / 365
+                                daily_penalty = line.amount_principal * daily_rate
+                                penalty_amount += daily_penalty
+
+                            elif rule.method == 'fixed_one_time':
+                                # Check if penalty was already applied for this line
+                                if not line.penalty_applied:
+                                    penalty_amount += rule.fixed_amount
+                                    line.penalty_applied = True
+
+                        # Update the balance
+                        if penalty_amount > 0:
+                            # balance_late_charges follows the ledger penalty entry
+                            contract.accrued_penalty += penalty_amount
+                            ledger_entries.append({
+                                'contract_id': contract.id,
+                                'date': today,
+                                'event_type': 'penalty',
+                                'name': rule.name,
+                                'penalty_amount': penalty_amount,
+                            })
+
+                            # Log in chatter
+                            contract.message_post(
+                                body=f"Penalty of {contract.currency_id.symbol}{penalty_amount:.2f} accrued. "
+                                     f"Total penalties: {contract.currency_id.symbol}{contract.accrued_penalty:.2f}"
+                            )
+
+                            total_penalties_accrued += penalty_amount
+                            total_processed += 1
+                            tracker.add_written(1)
+
+                    except Exception as e:
+                        # Log error but continue processing other contracts
+                        contract.message_post(
+                            body=f"Error calculating penalty: {str(e)}",
+                            message_type='notification'
+                        )
+                        continue
 
-                except Exception as e:
-                    # Log error but continue processing other contracts
-                    contract.message_post(
-                        body=f"Error calculating penalty: {str(e)}",
-                        message_type='notification'
-                    )
-                    continue
+                batch._post_ledger_entries(ledger_entries)
 
             # Commit after each batch to prevent long-running locks
             self.env.cr.commit()
 
-        # Log summary in server logs
+        # Log summary in server logs (run metrics are kept on finance.job.run)
         if total_processed > 0:
-            _logger = self.env['ir.logging']
-            _logger.sudo().create({
-                'name': 'Penalty Calculation Cron',
-                'type': 'server',
-                'level': 'info',
-                'message': f"Processed {total_processed} contracts. Total penalties accrued: {total_penalties_accrued:.2f}",
-                'path': 'asset_finance.contract_collection',
-                'func': '_cron_calculate_late_interest',
-                'line': '49'
-            })
+            _logger.info(
+                "Penalty calculation: processed %s contracts. Total penalties accrued: %.2f",
+                total_processed, total_penalties_accrued
+            )
 
     # --------------------------------------------------------
     # COLLECTION NOTICES & ACTIONS
     # --------------------------------------------------------
 
+    def _send_notice_bulk(self, template_xmlid, log_body, vals=None):
+        """Queue the notice of the template with XML id ``template_xmlid``, see ``_queue_notice``"""
+        template = self.env.ref(template_xmlid, raise_if_not_found=False)
+        return self._queue_notice(template, log_body, vals=vals)
+
+    def _queue_notice(self, template, log_body, vals=None):
+        """
+        Queue one notice e-mail per contract with a single batched template
+        render. ``vals`` is written once on all contracts and flushed before
+        the render, so the template shows the new values (e.g. the due date of
+        a reminder). Mails go through the mail queue (no force_send) and the
+        chatter notes are logged in one batch. Contracts whose hirer has no
+        e-mail are skipped.
+        Returns the contracts the notice was queued for.
+        """
+        contracts = self.filtered(lambda c: c.hirer_id.email)
+        if not contracts:
+            return contracts
+
+        if vals:
+            contracts.write(vals)
+            contracts.flush_recordset(list(vals))
+
+        if template:
+            template.send_mail_batch(contracts.ids)
+        contracts._message_log_batch(bodies={contract.id: log_body for contract in contracts})
+        return contracts
+
     def action_send_reminder(self):
         """Send payment reminder email"""
         self.ensure_one()
         if not self.hirer_id.email:
             raise UserError(_("Hirer email address is missing. Please update the partner record."))
 
-        template = self.env.ref('asset_finance.email_template_payment_reminder', raise_if_not_found=False)
-        if template:
-            template.send_mail(self.id, force_send=True)
-
-        self.date_reminder_sent = fields.Date.today()
-        self.message_post(body="Payment Reminder Email sent to Hirer.")
+        self._send_notice_bulk(
+            'asset_finance.email_template_payment_reminder',
+            _("Payment Reminder Email sent to Hirer."),
+            {'date_reminder_sent': fields.Date.today()},
+        )
 
         return {
             'type': 'ir.actions.client',
@@ -165,11 +210,7 @@ class FinanceContract(models.Model):
         if not self.hirer_id.email:
             raise UserError(_("Hirer email address is missing. Please update the partner record."))
 
-        template = self.env.ref('asset_finance.email_template_overdue_notice', raise_if_not_found=False)
-        if template:
-            template.send_mail(self.id, force_send=True)
-
-        self.message_post(body="Overdue Notice sent via email.")
+        self._send_notice_bulk('asset_finance.email_template_overdue_notice', _("Overdue Notice sent via email."))
 
         return {
             'type': 'ir.actions.client',
@@ -187,16 +228,12 @@ class FinanceContract(models.Model):
         if not self.hirer_id.email:
             raise UserError(_("Hirer email address is missing. Please update the partner record."))
 
-        template = self.env.ref('asset_finance.email_template_4th_schedule', raise_if_not_found=False)
-        if template:
-            template.send_mail(self.id, force_send=True)
-
-        self.date_4th_sched_sent = fields.Date.today()
-        self.message_post(body="4th Schedule Notice sent via email.")
-
-        # Update status to Legal if not already
-        if self.late_status != 'legal':
-            self.late_status = 'legal'
+        # Also moves the contract to Legal status
+        self._send_notice_bulk(
+            'asset_finance.email_template_4th_schedule',
+            _("4th Schedule Notice sent via email."),
+            {'date_4th_sched_sent': fields.Date.today(), 'late_status': 'legal'},
+        )
 
         return {
             'type': 'ir.actions.client',
@@ -254,11 +291,9 @@ class FinanceContract(models.Model):
         if not self.hirer_id.email:
             raise UserError(_("Hirer email address is missing. Please update the partner record."))
 
-        template = self.env.ref('asset_finance.email_template_settlement_quotation', raise_if_not_found=False)
-        if template:
-            template.send_mail(self.id, force_send=True)
-
-        self.message_post(body="Settlement Quotation sent via email.")
+        self._send_notice_bulk(
+            'asset_finance.email_template_settlement_quotation', _("Settlement Quotation sent via email.")
+        )
 
         return {
             'type': 'ir.actions.client',
@@ -270,25 +305,86 @@ class FinanceContract(models.Model):
             }
         }
 
+    # --------------------------------------------------------
+    # PRE-DUE REMINDERS (CRON JOB)
+    # --------------------------------------------------------
+
+    @api.model
+    @finance_job('Pre-Due Payment Reminders')
+    def _cron_send_pre_due_reminders(self, batch_size=500):
+        """
+        Daily: queue a payment reminder for every unpaid installment due in
+        exactly ``reminder_days_before`` days, when automatic reminders are
+        enabled in the settings. Lines already reminded are skipped.
+        """
+        Param = self.env['ir.config_parameter'].sudo()
+        enabled = Param.search([('key', '=', 'asset_finance.auto_send_reminders')], limit=1)
+        if not enabled or enabled.value in ('False', '0', ''):
+            return
+        days_param = Param.search([('key', '=', 'asset_finance.reminder_days_before')], limit=1)
+        days_before = int(days_param.value) if days_param else 3
+
+        today = fields.Date.today()
+        due_date = today + relativedelta(days=days_before)
+        tracker = get_job_tracker(self.env)
+
+        # One query on the date_due index; invoiced lines only count when still unpaid
+        self.env.cr.execute("""
+            SELECT l.id, l.contract_id
+            FROM finance_contract_line l
+            JOIN finance_contract c ON c.id = l.contract_id
+            LEFT JOIN account_move m ON m.id = l.invoice_id
+            WHERE l.date_due = %s
+              AND l.reminder_sent_date IS NULL
+              AND c.ac_status = 'active'
+              AND (m.id IS NULL OR m.payment_state NOT IN ('paid', 'in_payment', 'reversed'))
+            ORDER BY l.contract_id
+        """, [due_date])
+        rows = self.env.cr.fetchall()
+        tracker.add_scanned(len(rows))
+
+        line_ids_by_contract = {}
+        for line_id, contract_id in rows:
+            line_ids_by_contract.setdefault(contract_id, []).append(line_id)
+        contract_ids = list(line_ids_by_contract)
+
+        for i in range(0, len(contract_ids), batch_size):
+            batch = self.browse(contract_ids[i:i + batch_size])
+            with tracker.chunk(f"Contracts {i + 1}-{i + len(batch)}", rows=len(batch)):
+                sent = batch._send_notice_bulk(
+                    'asset_finance.email_template_payment_reminder',
+                    _("Pre-due Payment Reminder queued for installment due %s.", due_date),
+                    {'date_reminder_sent': today, 'next_inst_date': due_date},
+                )
+                line_ids = [line_id for contract_id in sent.ids for line_id in line_ids_by_contract[contract_id]]
+                self.env['finance.contract.line'].browse(line_ids).write({'reminder_sent_date': today})
+                tracker.add_written(len(sent))
+
     # --------------------------------------------------------
     # BATCH COLLECTION ACTIONS
     # --------------------------------------------------------
 
     def action_batch_send_reminders(self):
-        """Send payment reminders to all selected contracts"""
-        success_count = 0
-        error_count = 0
-
-        for contract in self:
-            try:
-                if contract.hirer_id.email:
-                    contract.action_send_reminder()
-                    success_count += 1
-                else:
-                    error_count += 1
-            except Exception as e:
-                error_count += 1
-                contract.message_post(body=f"Failed to send reminder: {str(e)}")
+        """Send payment reminders to all selected contracts (queued for large selections)"""
+        Job = self.env['finance.job']
+        if Job._should_enqueue(self):
+            return Job._enqueue(self, '_batch_send_reminders', _('Batch Payment Reminders'))._action_notify_queued()
+        return self._batch_send_reminders()
+
+    @finance_job('Batch Payment Reminders', job_type='batch')
+    def _batch_send_reminders(self):
+        tracker = get_job_tracker(self.env)
+        tracker.add_scanned(len(self))
+
+        # Contracts without a hirer e-mail are skipped and reported as failed
+        sent = self._send_notice_bulk(
+            'asset_finance.email_template_payment_reminder',
+            _("Payment Reminder Email sent to Hirer."),
+            {'date_reminder_sent': fields.Date.today()},
+        )
+        success_count = len(sent)
+        error_count = len(self) - success_count
+        tracker.add_written(success_count)
 
         return {
             'type': 'ir.actions.client',
@@ -0,0 +1,179 @@
+import logging
+
+from odoo import models, fields, api
+
+from .job_run import finance_job, get_job_tracker
+
+_logger = logging.getLogger(__name__)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+    _logger.info("numpy is not installed, effective rates are solved one contract at a time")
+
+# bracket of the monthly rate and stop criteria of the solver
+MIN_RATE, MAX_RATE = -0.99, 1.0
+MAX_ITERATIONS = 60
+TOLERANCE = 1e-9
+# a rate this close to a bracket edge means the root lies outside the bracket
+EDGE_MARGIN = 1e-6
+
+
+def solve_monthly_rates(principal, first, monthly, last, months, advance):
+    """
+    Monthly internal rate of return of many contracts at once: the rate r
+    for which the installments, discounted at r, repay the amount financed.
+    Installments are the first amount, ``months - 2`` monthly amounts and the
+    last amount, due at the end of each month (or at the start when paid in
+    ``advance``). All arguments are sequences of the same length; returns a
+    list of rates, 0.0 where the cash flows have no solution in the bracket
+    or the solver did not converge.
+
+    Newton steps are taken on every unsolved contract together; a step that
+    leaves the bracket known to hold the root falls back to bisection.
+    """
+    if numpy is None:
+        return [
+            _solve_monthly_rate(*values)
+            for values in zip(principal, first, monthly, last, months, advance)
+        ]
+    principal = numpy.asarray(principal, dtype=float)
+    months = numpy.asarray(months, dtype=int)
+    size = len(principal)
+    rates = numpy.zeros(size)
+    if not size:
+        return rates.tolist()
+
+    # one row of installments per contract, zero past its last month
+    index = numpy.arange(max(months.max(), 1))[None, :]
+    count = months[:, None]
+    amounts = numpy.where(index < count - 1, numpy.asarray(monthly, dtype=float)[:, None], 0.0)
+    amounts = numpy.where(index == 0, numpy.asarray(first, dtype=float)[:, None], amounts)
+    amounts = numpy.where(index == count - 1, numpy.asarray(last, dtype=float)[:, None], amounts)
+    periods = index + 1 - numpy.asarray(advance, dtype=int)[:, None]
+
+    solvable = (principal > 0) & (months > 0) & (amounts.sum(axis=1) > 0)
+    active = solvable.copy()
+    solved = numpy.zeros(size, dtype=bool)
+    low = numpy.full(size, MIN_RATE)
+    high = numpy.full(size, MAX_RATE)
+    rate = numpy.full(size, 0.01)
+    for _iteration in range(MAX_ITERATIONS):
+        rows = numpy.flatnonzero(active)
+        if not len(rows):
+            break
+        r = rate[rows][:, None]
+        discounted = amounts[rows] * (1 + r) ** -periods[rows]
+        value = discounted.sum(axis=1) - principal[rows]
+        slope = -(discounted * periods[rows]).sum(axis=1) / (1 + rate[rows])
+        # the present value falls as the rate rises
+        low[rows] = numpy.where(value > 0, rate[rows], low[rows])
+        high[rows] = numpy.where(value > 0, high[rows], rate[rows])
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            step = rate[rows] - value / slope
+        outside = ~numpy.isfinite(step) | (step <= low[rows]) | (step >= high[rows])
+        step = numpy.where(outside, (low[rows] + high[rows]) / 2, step)
+        converged = (numpy.abs(value) <= TOLERANCE * principal[rows]) | (numpy.abs(step - rate[rows]) <= TOLERANCE)
+        rate[rows] = numpy.where(converged, rate[rows], step)
+        active[rows[converged]] = False
+        solved[rows[converged]] = True
+
+    solved &= (rate > MIN_RATE + EDGE_MARGIN) & (rate < MAX_RATE - EDGE_MARGIN)
+    rates[solved] = rate[solved]
+    return rates.tolist()
+
+
+def _solve_monthly_rate(principal, first, monthly, last, months, advance):
+    """Scalar version of solve_monthly_rates, used when numpy is not available"""
+    amounts = [first] + [monthly] * (months - 2) + [last] if months > 1 else [last]
+    periods = [i + 1 - int(advance) for i in range(months)]
+    if principal <= 0 or months <= 0 or sum(amounts) <= 0:
+        return 0.0
+    low, high, rate = MIN_RATE, MAX_RATE, 0.01
+    for _iteration in range(MAX_ITERATIONS):
+        discounted = [amount * (1 + rate) ** -period for amount, period in zip(amounts, periods)]
+        value = sum(discounted) - principal
+        slope = -sum(d * period for d, period in zip(discounted, periods)) / (1 + rate)
+        if value > 0:
+            low = rate
+        else:
+            high = rate
+        step = rate - value / slope if slope else high
+        if not low < step < high:
+            step = (low + high) / 2
+        if abs(value) <= TOLERANCE * principal or abs(step - rate) <= TOLERANCE:
+            break
+        rate = step
+    else:
+        return 0.0
+    return rate if MIN_RATE + EDGE_MARGIN < rate < MAX_RATE - EDGE_MARGIN else 0.0
+
+
+def annual_rates(monthly_rates):
+    """(EIR, APR) in percent of each monthly rate: compounded and nominal annual rates"""
+    return [(((1 + rate) ** 12 - 1) * 100, rate * 12 * 100) for rate in monthly_rates]
+
+
+class FinanceContract(models.Model):
+    _inherit = 'finance.contract'
+
+    eir_rate = fields.Float(string="EIR (%)", digits=(16, 4), compute='_compute_effective_rates', store=True,
+        help="Effective interest rate: annual compounded rate at which the installments repay "
+             "the amount financed net of the admin fee")
+    apr_rate = fields.Float(string="APR (%)", digits=(16, 4), compute='_compute_effective_rates', store=True,
+        help="Annual percentage rate: the monthly effective rate times twelve")
+
+    @api.depends('loan_amount', 'admin_fee', 'first_inst_amount', 'monthly_inst', 'last_inst_amount',
+                 'no_of_inst', 'payment_scheme')
+    def _compute_effective_rates(self):
+        # one vectorized solve for the whole batch being recomputed
+        rates = annual_rates(solve_monthly_rates(
+            [rec.loan_amount - rec.admin_fee for rec in self],
+            self.mapped('first_inst_amount'),
+            self.mapped('monthly_inst'),
+            self.mapped('last_inst_amount'),
+            [rec.no_of_inst.months for rec in self],
+            [rec.payment_scheme == 'advance' for rec in self],
+        ))
+        for rec, (eir, apr) in zip(self, rates):
+            rec.eir_rate = eir
+            rec.apr_rate = apr
+
+    @api.model
+    @finance_job('Recompute Effective Rates')
+    def _recompute_effective_rates(self, batch_size=10000):
+        """
+        Solve the effective rates of every contract without going through the
+        ORM: the cash flow columns are read with one query per batch, solved
+        together and written back with one UPDATE.
+        """
+        tracker = get_job_tracker(self.env)
+        self.env.flush_all()
+        self.env.cr.execute("""
+            SELECT c.id,
+                   (COALESCE(c.loan_amount, 0) - COALESCE(c.admin_fee, 0))::float,
+                   COALESCE(c.first_inst_amount, 0)::float,
+                   COALESCE(c.monthly_inst, 0)::float,
+                   COALESCE(c.last_inst_amount, 0)::float,
+                   COALESCE(t.months, 0),
+                   COALESCE(c.payment_scheme = 'advance', FALSE)
+            FROM finance_contract c
+            LEFT JOIN finance_term t ON t.id = c.no_of_inst
+            ORDER BY c.id
+        """)
+        rows = self.env.cr.fetchall()
+        tracker.add_scanned(len(rows))
+        for i in range(0, len(rows), batch_size):
+            batch = rows[i:i + batch_size]
+            with tracker.chunk(f"Contracts {i + 1}-{i + len(batch)}", rows=len(batch)):
+                ids, principal, first, monthly, last, months, advance = zip(*batch)
+                rates = annual_rates(solve_monthly_rates(principal, first, monthly, last, months, advance))
+                self.env.cr.execute("""
+                    UPDATE finance_contract c
+                    SET eir_rate = r.eir_rate, apr_rate = r.apr_rate
+                    FROM unnest(%s::int[], %s::numeric[], %s::numeric[]) AS r(id, eir_rate, apr_rate)
+                    WHERE c.id = r.id
+                """, [list(ids), [round(eir, 4) for eir, _apr in rates], [round(apr, 4) for _eir, apr in rates]])
+                tracker.add_written(self.env.cr.rowcount)
+        self.invalidate_model(['eir_rate', 'apr_rate'])
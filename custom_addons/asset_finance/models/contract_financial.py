@@ -4,6 +4,138 @@ from odoo.tools import float_round
 from dateutil.relativedelta import relativedelta
 import math
 
+from .job_run import finance_job, get_job_tracker
+
+
+def compute_financials(cash_price, down_payment, int_rate_pa, months):
+    """
+    Loan amount, term charges and balance hire from plain values. Shared by
+    the contract computes and the record-free quotation, so a quote always
+    matches the contract it becomes.
+    """
+    loan_amount = cash_price - down_payment
+    interest = (loan_amount * (int_rate_pa / 100) * (months / 12)) if months else 0
+    return {
+        'loan_amount': loan_amount,
+        'term_charges': interest,
+        'balance_hire': loan_amount + interest,
+    }
+
+
+def compute_installments(loan_amount, balance_hire, int_rate_pa, months):
+    """First, monthly and last installment amounts, based on the annuity formula"""
+    if months > 0 and loan_amount > 0:
+        n = months
+        if int_rate_pa > 0:
+            # Standard annuity formula for level payments
+            P = loan_amount
+            # Monthly interest rate
+            r = (int_rate_pa / 100) / 12
+
+            # M = P * [r(1+r)^n] / [(1+r)^n - 1]
+            try:
+                monthly_inst = P * (r * (1 + r)**n) / ((1 + r)**n - 1)
+            except ZeroDivisionError:
+                monthly_inst = loan_amount / n
+        else:
+            # No interest, just divide principal by number of installments
+            monthly_inst = loan_amount / n
+
+        rounded_inst = math.floor(monthly_inst)
+        if n > 1:
+            last_inst_amount = balance_hire - (rounded_inst * (n - 1))
+        else:
+            last_inst_amount = balance_hire
+        return {'first_inst_amount': rounded_inst, 'monthly_inst': rounded_inst, 'last_inst_amount': last_inst_amount}
+    return {'first_inst_amount': 0, 'monthly_inst': 0, 'last_inst_amount': 0}
+
+
+def schedule_start_date(first_due_date, agreement_date, payment_scheme):
+    """Due date of the first installment"""
+    if first_due_date:
+        return first_due_date
+    base_date = agreement_date or fields.Date.today()
+    if payment_scheme == 'advance':
+        # Front payment: Due immediately on agreement date
+        return base_date
+    # Normal arrears: Due 1 month after
+    return base_date + relativedelta(months=1)
+
+
+def compute_schedule(start_date, months, loan_amount, term_charges, first_inst_amount, monthly_inst,
+                     interest_method, precision):
+    """
+    Amortization schedule with Rule of 78 or Flat Rate, as a list of
+    finance.contract.line values (without contract_id).
+    """
+    lines = []
+
+    # Setup Variables for Calculation
+    n = months
+    total_principal = loan_amount
+    total_interest = term_charges
+
+    # Rule of 78 Denominator: Sum of Digits = n * (n + 1) / 2
+    # Example: For 12 months, SOD = 78.
+    sum_of_digits = (n * (n + 1)) / 2 if interest_method == 'rule78' else 0
+
+    # Trackers for rounding adjustments
+    allocated_principal = 0.0
+    allocated_interest = 0.0
+
+    for i in range(1, n + 1):
+        date_due = start_date + relativedelta(months=i-1)
+
+        # --- A. Interest Calculation ---
+        if interest_method == 'rule78':
+            # Rule of 78 Formula:
+            # Interest_k = Total_Interest * (Remaining_Months / Sum_of_Digits)
+            # For month 1 of 12, Remaining weight is 12. For month 12, it is 1.
+            weight = n - i + 1
+            interest_portion = total_interest * (weight / sum_of_digits)
+        else:
+            # Flat Rate: Evenly distributed
+            interest_portion = total_interest / n
+
+        # Use Odoo's float_round with currency precision to avoid penny-rounding errors
+        interest_portion = float_round(interest_portion, precision_digits=precision)
+
+        # --- B. Principal Calculation ---
+        # Determine the installment amount for this specific line
+        if i == 1:
+            amount_total = first_inst_amount
+        else:
+            amount_total = monthly_inst
+
+        principal_portion = monthly_inst - interest_portion
+
+        # --- C. Final Installment Adjustment ---
+        if i == n:
+            # For final installment, ensure all remaining amounts are allocated precisely
+            principal_portion = float_round(total_principal - allocated_principal, precision_digits=precision)
+            interest_portion = float_round(total_interest - allocated_interest, precision_digits=precision)
+            amount_total = float_round(principal_portion + interest_portion, precision_digits=precision)
+        else:
+            # Round principal portion for intermediate installments
+            principal_portion = float_round(principal_portion, precision_digits=precision)
+            amount_total = float_round(amount_total, precision_digits=precision)
+
+        # Append the line
+        lines.append({
+            'sequence': i,
+            'date_due': date_due,
+            'amount_principal': principal_portion,
+            'amount_interest': interest_portion,
+            'amount_total': amount_total,
+        })
+
+        # Update trackers
+        allocated_principal += principal_portion
+        allocated_interest += interest_portion
+
+    return lines
+
+
 class FinanceContract(models.Model):
     _inherit = 'finance.contract'
 
@@ -15,11 +147,10 @@ class FinanceContract(models.Model):
     def _compute_financials(self):
         """Calculate loan amount, term charges, and balance hire"""
         for rec in self:
-            rec.loan_amount = rec.cash_price - rec.down_payment
-            months = rec.no_of_inst.months if rec.no_of_inst else 0
-            interest = (rec.loan_amount * (rec.int_rate_pa / 100) * (months / 12)) if months else 0
-            rec.term_charges = interest
-            rec.balance_hire = rec.loan_amount + interest
+            financials = compute_financials(rec.cash_price, rec.down_payment, rec.int_rate_pa, rec.no_of_inst.months)
+            rec.loan_amount = financials['loan_amount']
+            rec.term_charges = financials['term_charges']
+            rec.balance_hire = financials['balance_hire']
 
     @api.depends('loan_amount', 'int_rate_pa', 'no_of_inst')
     def _compute_installment_amounts(self):
@@ -28,32 +159,10 @@ class FinanceContract(models.Model):
         The fields remain editable for manual overrides.
         """
         for rec in self:
-            if rec.no_of_inst and rec.no_of_inst.months > 0 and rec.loan_amount > 0:
-                n = rec.no_of_inst.months
-                if rec.int_rate_pa > 0:
-                    # Standard annuity formula for level payments
-                    P = rec.loan_amount
-                    # Monthly interest rate
-                    r = (rec.int_rate_pa / 100) / 12
-
-                    # M = P * [r(1+r)^n] / [(1+r)^n - 1]
-                    try:
-                        monthly_inst = P * (r * (1 + r)**n) / ((1 + r)**n - 1)
-                    except ZeroDivisionError:
-                        monthly_inst = rec.loan_amount / n
-                else:
-                    # No interest, just divide principal by number of installments
-                    monthly_inst = rec.loan_amount / n
-
-                rounded_inst = math.floor(monthly_inst)
-                rec.first_inst_amount = rounded_inst
-                rec.monthly_inst = rounded_inst
-                if n > 1:
-                    rec.last_inst_amount = rec.balance_hire - (rounded_inst * (n - 1))
-                else:
-                    rec.last_inst_amount = rec.balance_hire
-            else:
-                rec.monthly_inst = rec.first_inst_amount = rec.last_inst_amount = 0
+            installments = compute_installments(rec.loan_amount, rec.balance_hire, rec.int_rate_pa, rec.no_of_inst.months)
+            rec.first_inst_amount = installments['first_inst_amount']
+            rec.monthly_inst = installments['monthly_inst']
+            rec.last_inst_amount = installments['last_inst_amount']
 
     # --------------------------------------------------------
     # SCHEDULE GENERATION (RULE OF 78 & FLAT RATE)
@@ -67,96 +176,50 @@ class FinanceContract(models.Model):
         if not self.no_of_inst or not self.monthly_inst:
             raise UserError(_("Please set Number of Installments and Monthly Installment amount."))
 
-        # 1. Determine Start Date based on Payment Scheme
-        start_date = self.first_due_date
-        if not start_date:
-            base_date = self.agreement_date or fields.Date.today()
-            if self.payment_scheme == 'advance':
-                # Front payment: Due immediately on agreement date
-                start_date = base_date
-            else:
-                # Normal arrears: Due 1 month after
-                start_date = base_date + relativedelta(months=1)
-
-        lines = []
-
-        # 2. Setup Variables for Calculation
-        n = self.no_of_inst.months
-        total_principal = self.loan_amount
-        total_interest = self.term_charges
-        monthly_inst = self.monthly_inst
-
-        # Rule of 78 Denominator: Sum of Digits = n * (n + 1) / 2
-        # Example: For 12 months, SOD = 78.
-        sum_of_digits = (n * (n + 1)) / 2 if self.interest_method == 'rule78' else 0
-
-        # Trackers for rounding adjustments
-        allocated_principal = 0.0
-        allocated_interest = 0.0
-
-        for i in range(1, n + 1):
-            date_due = start_date + relativedelta(months=i-1)
-
-            # --- A. Interest Calculation ---
-            if self.interest_method == 'rule78':
-                # Rule of 78 Formula:
-                # Interest_k = Total_Interest * (Remaining_Months / Sum_of_Digits)
-                # For month 1 of 12, Remaining weight is 12. For month 12, it is 1.
-                weight = n - i + 1
-                interest_portion = total_interest * (weight / sum_of_digits)
-            else:
-                # Flat Rate: Evenly distributed
-                interest_portion = total_interest / n
-
-            # Use Odoo's float_round with currency precision to avoid penny-rounding errors
-            precision = self.currency_id.decimal_places
-            interest_portion = float_round(interest_portion, precision_digits=precision)
-
-            # --- B. Principal Calculation ---
-            # Determine the installment amount for this specific line
-            if i == 1:
-                amount_total = self.first_inst_amount
-            else:
-                amount_total = self.monthly_inst
-
-            principal_portion = monthly_inst - interest_portion
-
-            # --- C. Final Installment Adjustment ---
-            if i == n:
-                # For final installment, ensure all remaining amounts are allocated precisely
-                principal_portion = float_round(total_principal - allocated_principal, precision_digits=precision)
-                interest_portion = float_round(total_interest - allocated_interest, precision_digits=precision)
-                amount_total = float_round(principal_portion + interest_portion, precision_digits=precision)
-            else:
-                # Round principal portion for intermediate installments
-                principal_portion = float_round(principal_portion, precision_digits=precision)
-                amount_total = float_round(amount_total, precision_digits=precision)
-
-            # Append the line
-            lines.append((0, 0, {
-                'sequence': i,
-                'date_due': date_due,
-                'amount_principal': principal_portion,
-                'amount_interest': interest_portion,
-                'amount_total': amount_total,
-            }))
-
-            # Update trackers
-            allocated_principal += principal_portion
-            allocated_interest += interest_portion
-
-        self.write({'line_ids': lines})
+        self.write({'line_ids': [(0, 0, vals) for vals in self._prepare_schedule_lines()]})
+
+    def _prepare_schedule_lines(self):
+        """
+        Compute the amortization schedule without writing it.
+        Returns a list of finance.contract.line values (without contract_id),
+        so bulk loaders can insert schedules for many contracts at once.
+        """
+        self.ensure_one()
+        return compute_schedule(
+            schedule_start_date(self.first_due_date, self.agreement_date, self.payment_scheme),
+            self.no_of_inst.months, self.loan_amount, self.term_charges,
+            self.first_inst_amount, self.monthly_inst, self.interest_method,
+            self.currency_id.decimal_places,
+        )
 
     # --------------------------------------------------------
     # INVOICE CREATION
     # --------------------------------------------------------
 
     def action_create_invoices(self):
-        """Create customer invoices for due installments"""
+        """Create customer invoices for due installments (queued for large selections)"""
+        Job = self.env['finance.job']
+        if Job._should_enqueue(self):
+            return Job._enqueue(self, '_create_due_invoices', _('Create Due Invoices'))._action_notify_queued()
+
+        invoice_count = self._create_due_invoices()
+        if not invoice_count:
+            raise UserError(_("No installments are due for invoicing today."))
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {'title': 'Success', 'message': f'{invoice_count} Invoices created!', 'type': 'success'}
+        }
+
+    @finance_job('Create Due Invoices', job_type='batch')
+    def _create_due_invoices(self):
+        """Invoice and post every due, uninvoiced installment. Returns the invoice count."""
+        tracker = get_job_tracker(self.env)
+        invoice_count = 0
+        ledger_entries = []
         for rec in self:
             due_lines = rec.line_ids.filtered(lambda l: not l.invoice_id and l.date_due <= fields.Date.today())
-            if not due_lines:
-                raise UserError(_("No installments are due for invoicing today."))
+            tracker.add_scanned(len(rec.line_ids))
 
             for line in due_lines:
                 invoice_lines = []
@@ -189,12 +252,20 @@ class FinanceContract(models.Model):
 
                 line.invoice_id = invoice.id
                 invoice.action_post()
+                ledger_entries.append({
+                    'contract_id': rec.id,
+                    'date': line.date_due,
+                    'event_type': 'installment',
+                    'name': invoice.ref,
+                    'move_id': invoice.id,
+                    'contract_line_id': line.id,
+                    'arrears_amount': line.amount_total,
+                })
+                tracker.add_written(1)
+                invoice_count += 1
 
-            return {
-                'type': 'ir.actions.client',
-                'tag': 'display_notification',
-                'params': {'title': 'Success', 'message': f'{len(due_lines)} Invoices created!', 'type': 'success'}
-            }
+        self._post_ledger_entries(ledger_entries)
+        return invoice_count
 
     # --------------------------------------------------------
     # EARLY SETTLEMENT CALCULATIONS
@@ -0,0 +1,239 @@
+from odoo import models, fields, api, _
+from odoo.exceptions import UserError
+
+# monetary components tracked by the ledger: (delta column, running balance column)
+LEDGER_COMPONENTS = [
+    ('outstanding_amount', 'outstanding_balance'),
+    ('arrears_amount', 'arrears_balance'),
+    ('penalty_amount', 'penalty_balance'),
+    ('fee_amount', 'fee_balance'),
+]
+
+# contract fields derived from the ledger: field -> ledger component
+LEDGER_DERIVED_FIELDS = {
+    'balance_late_charges': 'penalty',
+    'balance_misc_fee': 'fee',
+}
+
+
+class FinanceContractLedger(models.Model):
+    _name = 'finance.contract.ledger'
+    _description = 'Contract Ledger Entry'
+    _order = 'contract_id, date, id'
+
+    contract_id = fields.Many2one('finance.contract', string="Contract", required=True, ondelete='cascade', index=True)
+    date = fields.Date(string="Date", required=True, default=fields.Date.context_today)
+    event_type = fields.Selection([
+        ('opening', 'Opening Balance'),
+        ('disbursement', 'Disbursement'),
+        ('installment', 'Installment Billed'),
+        ('allocation', 'Payment Allocation'),
+        ('penalty', 'Penalty'),
+        ('fee', 'Fee'),
+        ('rebate', 'Rebate'),
+        ('settlement', 'Settlement'),
+        ('write_off', 'Write-off'),
+        ('adjustment', 'Manual Adjustment'),
+    ], string="Event", required=True, index=True)
+    name = fields.Char(string="Description")
+
+    # --- Source documents ---
+    payment_id = fields.Many2one('account.payment', string="Payment", ondelete='set null')
+    move_id = fields.Many2one('account.move', string="Journal Entry", ondelete='set null')
+    contract_line_id = fields.Many2one('finance.contract.line', string="Installment Line", ondelete='set null')
+
+    # --- Signed movements ---
+    outstanding_amount = fields.Monetary(string="Outstanding", currency_field='currency_id',
+        help="Change of the hire balance still owed (principal and term charges)")
+    arrears_amount = fields.Monetary(string="Arrears", currency_field='currency_id',
+        help="Change of the billed but unpaid installments")
+    penalty_amount = fields.Monetary(string="Penalty", currency_field='currency_id')
+    fee_amount = fields.Monetary(string="Fee", currency_field='currency_id')
+
+    # --- Running balances, maintained per contract in (date, id) order ---
+    outstanding_balance = fields.Monetary(string="Outstanding Balance", currency_field='currency_id', readonly=True)
+    arrears_balance = fields.Monetary(string="Arrears Balance", currency_field='currency_id', readonly=True)
+    penalty_balance = fields.Monetary(string="Penalty Balance", currency_field='currency_id', readonly=True)
+    fee_balance = fields.Monetary(string="Fee Balance", currency_field='currency_id', readonly=True)
+
+    currency_id = fields.Many2one(related='contract_id.currency_id')
+
+    # "balance as of" lookups read the last entry of a contract up to a date
+    _contract_date_idx = models.Index('(contract_id, date, id)')
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        # Serialize postings per contract: concurrent entries would otherwise
+        # compute their running balances without seeing each other
+        contract_ids = sorted({vals['contract_id'] for vals in vals_list if vals.get('contract_id')})
+        if contract_ids:
+            self.env.cr.execute("""
+                SELECT id FROM finance_contract WHERE id = ANY(%s) ORDER BY id FOR NO KEY UPDATE
+            """, [contract_ids])
+        entries = super().create(vals_list)
+        entries._update_running_balances()
+        entries.contract_id._sync_ledger_balances()
+        return entries
+
+    def write(self, vals):
+        raise UserError(_("Contract ledger entries cannot be changed. Post a correcting entry instead."))
+
+    @api.ondelete(at_uninstall=False)
+    def _unlink_except_posted(self):
+        raise UserError(_("Contract ledger entries cannot be deleted. Post a correcting entry instead."))
+
+    def _update_running_balances(self):
+        """
+        Recompute the running balances of the contracts of ``self`` with one
+        window UPDATE. Entries are usually appended at the end of a contract,
+        but back-dated ones shift the balances of every later entry, so only
+        rows from the earliest new date onwards are rewritten.
+        """
+        if not self:
+            return
+        self.flush_model()
+        self.env.cr.execute("""
+            WITH starts AS (
+                SELECT contract_id, MIN(date) AS date
+                FROM finance_contract_ledger
+                WHERE id = ANY(%(ids)s)
+                GROUP BY contract_id
+            ), running AS (
+                SELECT l.id, l.date, s.date AS start_date,
+                       SUM(l.outstanding_amount) OVER w AS outstanding_balance,
+                       SUM(l.arrears_amount) OVER w AS arrears_balance,
+                       SUM(l.penalty_amount) OVER w AS penalty_balance,
+                       SUM(l.fee_amount) OVER w AS fee_balance
+                FROM finance_contract_ledger l
+                JOIN starts s ON s.contract_id = l.contract_id
+                WINDOW w AS (PARTITION BY l.contract_id ORDER BY l.date, l.id)
+            )
+            UPDATE finance_contract_ledger l
+            SET outstanding_balance = r.outstanding_balance,
+                arrears_balance = r.arrears_balance,
+                penalty_balance = r.penalty_balance,
+                fee_balance = r.fee_balance
+            FROM running r
+            WHERE l.id = r.id AND r.date >= r.start_date
+        """, {'ids': self.ids})
+        self.invalidate_model([balance for _amount, balance in LEDGER_COMPONENTS])
+
+    @api.model
+    def _seed_opening_entries(self):
+        """
+        Open the ledger of every non-draft contract that has none yet with its
+        current balances, so later events continue from them. Returns the
+        number of contracts opened.
+        """
+        self.env.flush_all()
+        self.env.cr.execute("""
+            INSERT INTO finance_contract_ledger (
+                contract_id, date, event_type, name,
+                outstanding_amount, arrears_amount, penalty_amount, fee_amount,
+                outstanding_balance, arrears_balance, penalty_balance, fee_balance,
+                create_uid, create_date, write_uid, write_date
+            )
+            SELECT c.id, CURRENT_DATE, 'opening', %(name)s,
+                   o.outstanding, o.arrears, o.penalty, o.fee,
+                   o.outstanding, o.arrears, o.penalty, o.fee,
+                   %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+            FROM finance_contract c
+            CROSS JOIN LATERAL (
+                SELECT COALESCE(c.os_balance, 0) AS outstanding,
+                       COALESCE((
+                           SELECT SUM(m.amount_residual)
+                           FROM finance_contract_line cl
+                           JOIN account_move m ON m.id = cl.invoice_id
+                           WHERE cl.contract_id = c.id AND m.state = 'posted'
+                       ), 0) AS arrears,
+                       COALESCE(c.balance_late_charges, 0) AS penalty,
+                       COALESCE(c.balance_misc_fee, 0) AS fee
+            ) o
+            WHERE c.ac_status != 'draft'
+              AND NOT EXISTS (SELECT 1 FROM finance_contract_ledger l WHERE l.contract_id = c.id)
+        """, {'name': _("Opening balance"), 'uid': self.env.uid})
+        return self.env.cr.rowcount
+
+
+class FinanceContract(models.Model):
+    _inherit = 'finance.contract'
+
+    ledger_ids = fields.One2many('finance.contract.ledger', 'contract_id', string="Ledger", readonly=True)
+
+    def _get_ledger_balances(self, date=None):
+        """
+        Return {contract_id: {'outstanding': .., 'arrears': .., 'penalty': .., 'fee': ..}}
+        as of ``date`` (today by default): the running balances of the last
+        ledger entry of each contract up to that date, read through the
+        (contract_id, date, id) index. Contracts without entries are zero.
+        """
+        date = date or fields.Date.context_today(self)
+        balances = {contract_id: dict(outstanding=0.0, arrears=0.0, penalty=0.0, fee=0.0) for contract_id in self.ids}
+        if not self:
+            return balances
+        self.env['finance.contract.ledger'].flush_model()
+        self.env.cr.execute("""
+            SELECT DISTINCT ON (contract_id)
+                   contract_id, outstanding_balance, arrears_balance, penalty_balance, fee_balance
+            FROM finance_contract_ledger
+            WHERE contract_id = ANY(%s) AND date <= %s
+            ORDER BY contract_id, date DESC, id DESC
+        """, [self.ids, date])
+        for contract_id, outstanding, arrears, penalty, fee in self.env.cr.fetchall():
+            balances[contract_id] = {
+                'outstanding': outstanding or 0.0,
+                'arrears': arrears or 0.0,
+                'penalty': penalty or 0.0,
+                'fee': fee or 0.0,
+            }
+        return balances
+
+    def write(self, vals):
+        # Late charges and misc fees are derived from the ledger: a direct
+        # change is posted as an adjustment entry for the difference
+        derived = [fname for fname in LEDGER_DERIVED_FIELDS if fname in vals]
+        if not derived:
+            return super().write(vals)
+        balances = self._get_ledger_balances()
+        today = fields.Date.context_today(self)
+        adjustments = []
+        for contract in self:
+            amounts = {
+                f'{LEDGER_DERIVED_FIELDS[fname]}_amount': (vals[fname] or 0.0) - balances[contract.id][LEDGER_DERIVED_FIELDS[fname]]
+                for fname in derived
+            }
+            adjustments.append(dict(contract_id=contract.id, date=today, event_type='adjustment',
+                                    name=_("Manual adjustment"), **amounts))
+        res = super().write({fname: value for fname, value in vals.items() if fname not in derived})
+        self._post_ledger_entries(adjustments)
+        return res
+
+    def _sync_ledger_balances(self):
+        """
+        Set the ledger-derived fields (late charges, misc fees) of ``self`` to
+        their ledger balances as of today, the same ones ``write`` adjusts
+        against, with one UPDATE. Entries dated later do not count yet.
+        """
+        if not self:
+            return
+        fnames = list(LEDGER_DERIVED_FIELDS)
+        self.flush_recordset(fnames)
+        balances = self._get_ledger_balances()
+        self.env.cr.execute("""
+            UPDATE finance_contract c
+            SET balance_late_charges = l.penalty,
+                balance_misc_fee = l.fee
+            FROM unnest(%s::int[], %s::numeric[], %s::numeric[]) AS l(contract_id, penalty, fee)
+            WHERE c.id = l.contract_id
+        """, [
+            list(balances),
+            [balance['penalty'] for balance in balances.values()],
+            [balance['fee'] for balance in balances.values()],
+        ])
+        self.invalidate_recordset(fnames)
+        self.modified(fnames)
+
+    def _post_ledger_entries(self, vals_list):
+        """Append ledger entries; they are system records, so posting does not depend on the user's rights"""
+        vals_list = [vals for vals in vals_list if any(vals.get(amount) for amount, _balance in LEDGER_COMPONENTS)]
+        return self.env['finance.contract.ledger'].sudo().create(vals_list)
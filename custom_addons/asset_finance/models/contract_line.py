@@ -7,7 +7,7 @@ class FinanceContractLine(models.Model):
 
     contract_id = fields.Many2one('finance.contract', string="Contract", ondelete='cascade')
     sequence = fields.Integer(string="#")
-    date_due = fields.Date(string="Due Date")
+    date_due = fields.Date(string="Due Date", index=True)
 
     amount_principal = fields.Monetary(string="Principal")
     amount_interest = fields.Monetary(string="Interest")
@@ -21,6 +21,10 @@ class FinanceContractLine(models.Model):
     # Payment tracking
     paid_date = fields.Date(string="Paid Date")
 
+    # Pre-due reminder tracking
+    reminder_sent_date = fields.Date(string="Reminder Sent", readonly=True,
+        help="Date the pre-due payment reminder for this installment was queued")
+
     # Penalty tracking
     penalty_applied = fields.Boolean(string="Penalty Applied", default=False,
         help="Used to track if fixed one-time penalty has been applied to this line")
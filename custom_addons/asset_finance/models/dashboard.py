@@ -1,4 +1,5 @@
-from odoo import models, fields, api, tools
+from odoo import models, fields, api, tools, _
+from odoo.exceptions import UserError
 import json
 from datetime import datetime, timedelta
 
@@ -84,89 +85,133 @@ class FinanceDashboard(models.Model):
 
         return {'monthly_trend': months_data}
 
+    @api.model
+    def _get_kpi_data(self):
+        """Portfolio KPIs computed with a single SQL aggregate"""
+        self.env['finance.contract'].flush_model(['os_balance', 'accrued_penalty', 'total_overdue_days', 'ac_status'])
+        self.env.cr.execute("""
+            SELECT
+                COUNT(*) as contract_count,
+                COALESCE(SUM(os_balance), 0) as portfolio_value,
+                COALESCE(SUM(accrued_penalty), 0) as total_penalties,
+                COALESCE(SUM(os_balance), 0) as total_outstanding,
+                COALESCE(SUM(CASE WHEN total_overdue_days > 0 THEN os_balance ELSE 0 END), 0) as total_overdue
+            FROM finance_contract
+            WHERE ac_status = 'active'
+        """)
+        result = self.env.cr.dictfetchone()
+
+        total_overdue = result['total_overdue'] or 0.0
+        total_outstanding = result['total_outstanding'] or 0.0
+        return {
+            'total_active_contracts': result['contract_count'] or 0,
+            'total_portfolio_value': result['portfolio_value'] or 0.0,
+            'total_penalties': result['total_penalties'] or 0.0,
+            'total_overdue': total_overdue,
+            'overdue_percentage': (total_overdue / total_outstanding) * 100 if total_outstanding > 0 else 0.0,
+        }
+
+    @api.model
+    def _get_mtd_data(self):
+        """Month-to-date disbursements and collections"""
+        today = fields.Date.today()
+        first_day = today.replace(day=1)
+
+        # Disbursements MTD using SQL
+        self.env.cr.execute("""
+            SELECT COALESCE(SUM(amount_total), 0) as total_disbursed
+            FROM account_move
+            WHERE ref LIKE 'Disbursement for%%'
+                AND date >= %s
+                AND date <= %s
+                AND state = 'posted'
+        """, (first_day, today))
+        total_disbursed = self.env.cr.dictfetchone()['total_disbursed'] or 0.0
+
+        # Collections MTD using SQL
+        self.env.cr.execute("""
+            SELECT COALESCE(SUM(amount), 0) as total_collected
+            FROM account_payment
+            WHERE contract_id IS NOT NULL
+                AND payment_type = 'inbound'
+                AND date >= %s
+                AND date <= %s
+                AND state = 'posted'
+        """, (first_day, today))
+        total_collected = self.env.cr.dictfetchone()['total_collected'] or 0.0
+
+        return {
+            'total_disbursed_mtd': total_disbursed,
+            'total_collected_mtd': total_collected,
+        }
+
+    @api.model
+    def _get_aging_data(self):
+        """Aging buckets computed with a single SQL aggregate"""
+        self.env['finance.contract'].flush_model(['balance_installment', 'total_overdue_days', 'ac_status'])
+        self.env.cr.execute("""
+            SELECT
+                COALESCE(SUM(CASE WHEN total_overdue_days = 0 THEN balance_installment ELSE 0 END), 0) as current,
+                COALESCE(SUM(CASE WHEN total_overdue_days > 0 AND total_overdue_days <= 30 THEN balance_installment ELSE 0 END), 0) as overdue_1_30,
+                COALESCE(SUM(CASE WHEN total_overdue_days > 30 AND total_overdue_days <= 60 THEN balance_installment ELSE 0 END), 0) as overdue_31_60,
+                COALESCE(SUM(CASE WHEN total_overdue_days > 60 AND total_overdue_days <= 90 THEN balance_installment ELSE 0 END), 0) as overdue_61_90,
+                COALESCE(SUM(CASE WHEN total_overdue_days > 90 THEN balance_installment ELSE 0 END), 0) as overdue_90_plus
+            FROM finance_contract
+            WHERE ac_status = 'active'
+        """)
+        result = self.env.cr.dictfetchone()
+        return {
+            'current_amount': result['current'] or 0.0,
+            'overdue_1_30': result['overdue_1_30'] or 0.0,
+            'overdue_31_60': result['overdue_31_60'] or 0.0,
+            'overdue_61_90': result['overdue_61_90'] or 0.0,
+            'overdue_90_plus': result['overdue_90_plus'] or 0.0,
+        }
+
     def _compute_kpis(self):
         """Optimized KPI computation using direct SQL queries"""
+        values = self._get_kpi_data()
         for rec in self:
-            # Use SQL for better performance - avoids loading all records into memory
-            # Note: balance_installment = balance_hire - total_inst_paid (computed field)
-            # Note: os_balance = balance_installment (computed field)
-            # We calculate these directly in SQL using stored fields
-            self.env.cr.execute("""
-                SELECT
-                    COUNT(*) as contract_count,
-                    COALESCE(SUM(balance_hire - total_inst_paid), 0) as portfolio_value,
-                    COALESCE(SUM(accrued_penalty), 0) as total_penalties,
-                    COALESCE(SUM(balance_hire - total_inst_paid), 0) as total_outstanding,
-                    COALESCE(SUM(CASE WHEN total_overdue_days > 0 THEN (balance_hire - total_inst_paid) ELSE 0 END), 0) as total_overdue
-                FROM finance_contract
-                WHERE ac_status = 'active'
-            """)
-
-            result = self.env.cr.dictfetchone()
-
-            rec.total_active_contracts = result['contract_count'] or 0
-            rec.total_portfolio_value = result['portfolio_value'] or 0.0
-            rec.total_penalties = result['total_penalties'] or 0.0
-            rec.total_overdue = result['total_overdue'] or 0.0
-
-            total_outstanding = result['total_outstanding'] or 0.0
-            if total_outstanding > 0:
-                rec.overdue_percentage = (rec.total_overdue / total_outstanding) * 100
-            else:
-                rec.overdue_percentage = 0.0
+            rec.update(values)
 
     def _compute_mtd(self):
         """Optimized MTD computation using SQL queries"""
-        today = fields.Date.today()
-        first_day = today.replace(day=1)
-
+        values = self._get_mtd_data()
         for rec in self:
-            # Disbursements MTD using SQL
-            self.env.cr.execute("""
-                SELECT COALESCE(SUM(amount_total), 0) as total_disbursed
-                FROM account_move
-                WHERE ref LIKE 'Disbursement for%%'
-                    AND date >= %s
-                    AND date <= %s
-                    AND state = 'posted'
-            """, (first_day, today))
-            rec.total_disbursed_mtd = self.env.cr.dictfetchone()['total_disbursed'] or 0.0
-
-            # Collections MTD using SQL
-            self.env.cr.execute("""
-                SELECT COALESCE(SUM(amount), 0) as total_collected
-                FROM account_payment
-                WHERE contract_id IS NOT NULL
-                    AND payment_type = 'inbound'
-                    AND date >= %s
-                    AND date <= %s
-                    AND state = 'posted'
-            """, (first_day, today))
-            rec.total_collected_mtd = self.env.cr.dictfetchone()['total_collected'] or 0.0
+            rec.update(values)
 
     def _compute_aging(self):
         """Optimized aging computation using SQL queries"""
+        values = self._get_aging_data()
         for rec in self:
-            # Use SQL to compute aging buckets in a single query
-            # Note: balance_installment = balance_hire - total_inst_paid (computed field)
-            # We calculate it directly in SQL using stored fields
-            self.env.cr.execute("""
-                SELECT
-                    COALESCE(SUM(CASE WHEN total_overdue_days = 0 THEN (balance_hire - total_inst_paid) ELSE 0 END), 0) as current,
-                    COALESCE(SUM(CASE WHEN total_overdue_days > 0 AND total_overdue_days <= 30 THEN (balance_hire - total_inst_paid) ELSE 0 END), 0) as overdue_1_30,
-                    COALESCE(SUM(CASE WHEN total_overdue_days > 30 AND total_overdue_days <= 60 THEN (balance_hire - total_inst_paid) ELSE 0 END), 0) as overdue_31_60,
-                    COALESCE(SUM(CASE WHEN total_overdue_days > 60 AND total_overdue_days <= 90 THEN (balance_hire - total_inst_paid) ELSE 0 END), 0) as overdue_61_90,
-                    COALESCE(SUM(CASE WHEN total_overdue_days > 90 THEN (balance_hire - total_inst_paid) ELSE 0 END), 0) as overdue_90_plus
-                FROM finance_contract
-                WHERE ac_status = 'active'
-            """)
-
-            result = self.env.cr.dictfetchone()
-            rec.current_amount = result['current'] or 0.0
-            rec.overdue_1_30 = result['overdue_1_30'] or 0.0
-            rec.overdue_31_60 = result['overdue_31_60'] or 0.0
-            rec.overdue_61_90 = result['overdue_61_90'] or 0.0
-            rec.overdue_90_plus = result['overdue_90_plus'] or 0.0
+            rec.update(values)
+
+    # --------------------------------------------------------
+    # PER-WIDGET JSON ENDPOINTS (see controllers/dashboard.py)
+    # --------------------------------------------------------
+
+    @api.model
+    def _get_widget_loaders(self):
+        """Map each dashboard widget group to the method that computes it"""
+        return {
+            'kpis': self._get_kpi_data,
+            'mtd': self._get_mtd_data,
+            'aging': self._get_aging_data,
+            'trend': self.get_chart_data,
+        }
+
+    @api.model
+    def get_widget_data(self, widget):
+        """Return the values of one widget group as a JSON-serializable dict"""
+        loaders = self._get_widget_loaders()
+        if widget not in loaders:
+            raise UserError(_("Unknown dashboard widget: %s") % widget)
+        values = loaders[widget]()
+        values['currency'] = {
+            'symbol': self.env.company.currency_id.symbol,
+            'position': self.env.company.currency_id.position,
+        }
+        return values
 
     
     def action_view_active_contracts(self):
@@ -0,0 +1,216 @@
+from odoo import models, fields, api, _
+
+from .job_run import finance_job, get_job_tracker
+
+
+class FinanceDunningStep(models.Model):
+    _name = 'finance.dunning.step'
+    _description = 'Dunning Ladder Step'
+    _order = 'sequence, min_overdue_days, id'
+
+    name = fields.Char(string="Step", required=True, translate=True)
+    sequence = fields.Integer(string="Sequence", default=10,
+        help="Steps are climbed in this order; a contract never goes back down the ladder while overdue")
+    active = fields.Boolean(default=True)
+
+    # --- Trigger ---
+    min_overdue_days = fields.Integer(string="Overdue Days", required=True,
+        help="The step applies once the oldest unpaid installment is overdue by at least this many days "
+             "(after the grace period)")
+    late_status = fields.Selection([
+        ('normal', 'Normal'),
+        ('attention', 'Attention'),
+        ('legal', 'Legal Action')
+    ], string="Late Status", help="Only apply to contracts in this late status (any status if empty)")
+
+    # --- Action ---
+    manual = fields.Boolean(string="Collector Action",
+        help="No notice is sent: contracts reaching this step are flagged for a collector")
+    template_id = fields.Many2one('mail.template', string="Notice Template",
+        domain="[('model', '=', 'finance.contract')]")
+    fee_field = fields.Selection([
+        ('reminder_fee', 'Reminder Fee'),
+        ('warning_letter_fee', 'Warning Letter Fee'),
+        ('final_letter_fee', 'Final Letter Fee'),
+        ('schedule_4_fee', '4th Schedule Fee'),
+        ('schedule_5_fee', '5th Schedule Fee'),
+    ], string="Fee Type", help="Contract fee field the step charges; the fee is also added to the misc fee balance")
+    fee_amount = fields.Monetary(string="Fee", currency_field='currency_id')
+    notice_date_field = fields.Selection([
+        ('date_reminder_sent', 'Reminder Notice Date'),
+        ('date_4th_sched_sent', '4th Schedule Date'),
+    ], string="Record Date In", help="Contract notice date stamped when the step is applied")
+    set_late_status = fields.Selection([
+        ('attention', 'Attention'),
+        ('legal', 'Legal Action')
+    ], string="Set Late Status")
+
+    currency_id = fields.Many2one('res.currency', default=lambda self: self.env.company.currency_id)
+
+
+class FinanceDunningLog(models.Model):
+    _name = 'finance.dunning.log'
+    _description = 'Dunning History'
+    _order = 'date desc, id desc'
+
+    contract_id = fields.Many2one('finance.contract', string="Contract", required=True, ondelete='cascade', index=True)
+    step_id = fields.Many2one('finance.dunning.step', string="Step", required=True, ondelete='restrict')
+    date = fields.Date(string="Date", required=True, default=fields.Date.context_today, index=True)
+    overdue_days = fields.Integer(string="Overdue Days")
+    fee_amount = fields.Monetary(string="Fee", currency_field='currency_id')
+    state = fields.Selection([
+        ('sent', 'Notice Queued'),
+        ('exception', 'Collector Action'),
+    ], string="Result", required=True)
+    currency_id = fields.Many2one(related='contract_id.currency_id')
+
+
+class FinanceContract(models.Model):
+    _inherit = 'finance.contract'
+
+    dunning_step_id = fields.Many2one('finance.dunning.step', string="Dunning Step", readonly=True,
+                                      index=True, tracking=True, copy=False)
+    date_dunning = fields.Date(string="Dunning Date", readonly=True, copy=False)
+    dunning_exception = fields.Boolean(string="Needs Collector Action", readonly=True, index=True, copy=False,
+        help="Set when the dunning run could not handle the contract automatically "
+             "(manual step or missing hirer e-mail)")
+    dunning_log_ids = fields.One2many('finance.dunning.log', 'contract_id', string="Dunning History")
+
+    def action_resolve_dunning_exception(self):
+        self.write({'dunning_exception': False})
+
+    # --------------------------------------------------------
+    # DUNNING RUN (CRON JOB)
+    # --------------------------------------------------------
+
+    @api.model
+    def _get_dunning_candidates(self):
+        """
+        One query over the overdue facts: for every active contract, the
+        overdue days of its oldest unpaid installment and the next step it
+        qualifies for after its current step. Contracts climb the ladder one
+        step per run, so none skips the earlier notices and fees.
+        Returns a list of (contract_id, step_id, overdue_days).
+        """
+        param = self.env['ir.config_parameter'].sudo().search([('key', '=', 'asset_finance.grace_period_days')], limit=1)
+        grace_period = int(param.value) if param else 7
+
+        self.env.cr.execute("""
+            WITH overdue AS (
+                SELECT l.contract_id,
+                       GREATEST(0, (%(today)s::date - MIN(l.date_due)) - %(grace)s) AS overdue_days
+                FROM finance_contract_line l
+                LEFT JOIN account_move m ON m.id = l.invoice_id
+                WHERE l.date_due < %(today)s
+                  AND (m.payment_state IS NULL OR m.payment_state != 'paid')
+                GROUP BY l.contract_id
+            )
+            SELECT DISTINCT ON (c.id) c.id, s.id, o.overdue_days
+            FROM finance_contract c
+            JOIN overdue o ON o.contract_id = c.id
+            JOIN finance_dunning_step s
+              ON s.active
+             AND o.overdue_days >= s.min_overdue_days
+             AND (s.late_status IS NULL OR s.late_status = c.late_status)
+            LEFT JOIN finance_dunning_step cur ON cur.id = c.dunning_step_id
+            WHERE c.ac_status = 'active'
+              AND o.overdue_days > 0
+              AND (cur.id IS NULL OR s.sequence > cur.sequence)
+            ORDER BY c.id, s.sequence, s.min_overdue_days
+        """, {'today': fields.Date.today(), 'grace': grace_period})
+        return self.env.cr.fetchall()
+
+    @api.model
+    @finance_job('Dunning Ladder')
+    def _cron_run_dunning(self, batch_size=500):
+        """Nightly: move overdue contracts one step up the dunning ladder and queue their notices"""
+        tracker = get_job_tracker(self.env)
+        today = fields.Date.today()
+
+        # Contracts that are no longer overdue start again at the bottom of the ladder
+        self.env.cr.execute("""
+            UPDATE finance_contract c SET dunning_step_id = NULL, dunning_exception = FALSE
+            WHERE c.dunning_step_id IS NOT NULL AND NOT EXISTS (
+                SELECT 1 FROM finance_contract_line l
+                LEFT JOIN account_move m ON m.id = l.invoice_id
+                WHERE l.contract_id = c.id AND l.date_due < %s
+                  AND (m.payment_state IS NULL OR m.payment_state != 'paid')
+            )
+        """, [today])
+        self.invalidate_model(['dunning_step_id', 'dunning_exception'])
+
+        candidates = self._get_dunning_candidates()
+        tracker.add_scanned(len(candidates))
+
+        by_step = {}
+        for contract_id, step_id, overdue_days in candidates:
+            by_step.setdefault(step_id, []).append((contract_id, overdue_days))
+
+        for step in self.env['finance.dunning.step'].browse(list(by_step)):
+            entries = by_step[step.id]
+            for i in range(0, len(entries), batch_size):
+                chunk = entries[i:i + batch_size]
+                with tracker.chunk(f"{step.name} {i + 1}-{i + len(chunk)}", rows=len(chunk)):
+                    contracts = self.browse([contract_id for contract_id, _days in chunk])
+                    contracts._apply_dunning_step(step, dict(chunk))
+                    tracker.add_written(len(contracts))
+
+    def _apply_dunning_step(self, step, overdue_days):
+        """
+        Record the step on ``self``, charge the fee and then queue the step
+        notice in bulk, so the notice shows the notice date, status and fees
+        of the step.
+        """
+        today = fields.Date.today()
+        log_body = _("Dunning step reached: %s", step.name)
+        if step.manual:
+            sent = self.browse()
+        elif step.template_id:
+            # the contracts _queue_notice can send to
+            sent = self.filtered(lambda c: c.hirer_id.email)
+        else:
+            sent = self
+        exceptions = self - sent
+
+        vals = {'dunning_step_id': step.id, 'date_dunning': today}
+        if step.notice_date_field:
+            vals[step.notice_date_field] = today
+        if step.set_late_status:
+            vals['late_status'] = step.set_late_status
+        if sent:
+            sent.write(dict(vals, dunning_exception=False))
+        if exceptions:
+            exceptions.write(dict(vals, dunning_exception=True))
+
+        if step.fee_field and step.fee_amount and sent:
+            # Fees accumulate per contract, so add them in one UPDATE instead of one write per contract;
+            # balance_misc_fee follows the ledger fee entries
+            sent.flush_recordset([step.fee_field])
+            self.env.cr.execute(f"""
+                UPDATE finance_contract
+                SET {step.fee_field} = COALESCE({step.fee_field}, 0) + %(fee)s
+                WHERE id = ANY(%(ids)s)
+            """, {'fee': step.fee_amount, 'ids': sent.ids})
+            sent.invalidate_recordset([step.fee_field])
+            sent.modified([step.fee_field])
+            sent._post_ledger_entries([{
+                'contract_id': contract.id,
+                'date': today,
+                'event_type': 'fee',
+                'name': step.name,
+                'fee_amount': step.fee_amount,
+            } for contract in sent])
+
+        if step.template_id and not step.manual:
+            sent._queue_notice(step.template_id, log_body)
+        else:
+            self._message_log_batch(bodies={contract.id: log_body for contract in self})
+
+        self.env['finance.dunning.log'].create([{
+            'contract_id': contract.id,
+            'step_id': step.id,
+            'date': today,
+            'overdue_days': overdue_days.get(contract.id, 0),
+            'fee_amount': step.fee_amount if contract in sent and step.fee_field else 0.0,
+            'state': 'sent' if contract in sent else 'exception',
+        } for contract in self])
@@ -1,4 +1,12 @@
-from odoo import models, fields
+from odoo import models, fields, _
+
+from .job_run import get_job_tracker
+
+# fleet.vehicle fields copied onto finance.asset / finance.contract
+FINANCE_SYNC_FIELDS = {
+    'license_plate', 'vin_sn', 'model_id', 'engine_no', 'engine_capacity',
+    'year_manufacture', 'vehicle_condition', 'color',
+}
 
 class FleetVehicleExtend(models.Model):
     _inherit = 'fleet.vehicle'
@@ -11,3 +19,117 @@ class FleetVehicleExtend(models.Model):
         ('new', 'New'),
         ('used', 'Used')
     ], string="Vehicle Condition", default='new')
+
+    def write(self, vals):
+        res = super().write(vals)
+        if FINANCE_SYNC_FIELDS & set(vals):
+            self._queue_finance_sync()
+        return res
+
+    def _queue_finance_sync(self):
+        """
+        Propagate vehicle changes to the linked assets and contracts. Small
+        selections are synced right away, large ones (e.g. a brand rename)
+        go to the background job queue in chunks.
+        """
+        if not self:
+            return
+        self.env.cr.execute(
+            "SELECT DISTINCT vehicle_id FROM finance_asset WHERE vehicle_id = ANY(%s)", [self.ids]
+        )
+        vehicles = self.browse([row[0] for row in self.env.cr.fetchall()])
+        if not vehicles:
+            return
+        Job = self.env['finance.job']
+        if Job._should_enqueue(vehicles):
+            Job._enqueue(vehicles, '_sync_finance_assets', _('Sync Vehicle Details'))
+        else:
+            vehicles._sync_finance_assets()
+
+    def _sync_finance_assets(self):
+        """Copy vehicle details onto finance_asset, finance_contract and their copies with set-based UPDATEs"""
+        tracker = get_job_tracker(self.env)
+        self.env.flush_all()
+
+        self.env.cr.execute("""
+            UPDATE finance_asset a
+            SET registration_no = v.license_plate,
+                chassis_no = v.vin_sn,
+                serial_no = v.vin_sn,
+                make = b.name,
+                model = m.name,
+                engine_no = v.engine_no,
+                engine_capacity = v.engine_capacity,
+                year_manufacture = v.year_manufacture,
+                vehicle_condition = v.vehicle_condition,
+                vehicle_color = v.color,
+                display_name = CASE
+                    WHEN v.license_plate IS NOT NULL AND v.license_plate != '' THEN v.license_plate || ' (' || a.name || ')'
+                    WHEN v.vin_sn IS NOT NULL AND v.vin_sn != '' THEN v.vin_sn || ' (' || a.name || ')'
+                    ELSE a.name
+                END
+            FROM fleet_vehicle v
+            LEFT JOIN fleet_vehicle_model m ON m.id = v.model_id
+            LEFT JOIN fleet_vehicle_model_brand b ON b.id = m.brand_id
+            WHERE a.vehicle_id = v.id
+              AND a.asset_type = 'vehicle'
+              AND v.id = ANY(%s)
+        """, [self.ids])
+        tracker.add_written(self.env.cr.rowcount)
+
+        self.env.cr.execute("""
+            UPDATE finance_contract c
+            SET asset_reg_no = v.license_plate,
+                asset_make = b.name,
+                asset_model = m.name
+            FROM finance_asset a
+            JOIN fleet_vehicle v ON v.id = a.vehicle_id
+            LEFT JOIN fleet_vehicle_model m ON m.id = v.model_id
+            LEFT JOIN fleet_vehicle_model_brand b ON b.id = m.brand_id
+            WHERE c.asset_id = a.id
+              AND v.id = ANY(%s)
+            RETURNING c.id
+        """, [self.ids])
+        contract_ids = [row[0] for row in self.env.cr.fetchall()]
+        tracker.add_written(len(contract_ids))
+
+        if contract_ids:
+            # Stored copies of the contract registration number
+            self.env.cr.execute("""
+                UPDATE account_payment p SET asset_reg_no = c.asset_reg_no
+                FROM finance_contract c
+                WHERE p.contract_id = c.id AND c.id = ANY(%s)
+            """, [contract_ids])
+            self.env.cr.execute("""
+                UPDATE finance_collection_queue q SET asset_reg_no = c.asset_reg_no
+                FROM finance_contract c
+                WHERE q.contract_id = c.id AND c.id = ANY(%s)
+            """, [contract_ids])
+
+        self.env['finance.asset'].invalidate_model([
+            'registration_no', 'chassis_no', 'serial_no', 'make', 'model', 'engine_no', 'engine_capacity',
+            'year_manufacture', 'vehicle_condition', 'vehicle_color', 'display_name',
+        ])
+        self.env['finance.contract'].invalidate_model(['asset_reg_no', 'asset_make', 'asset_model'])
+        self.env['account.payment'].invalidate_model(['asset_reg_no'])
+        self.env['finance.collection.queue'].invalidate_model(['asset_reg_no'])
+
+
+class FleetVehicleModel(models.Model):
+    _inherit = 'fleet.vehicle.model'
+
+    def write(self, vals):
+        res = super().write(vals)
+        if {'name', 'brand_id'} & set(vals):
+            self.env['fleet.vehicle'].with_context(active_test=False).search([('model_id', 'in', self.ids)])._queue_finance_sync()
+        return res
+
+
+class FleetVehicleModelBrand(models.Model):
+    _inherit = 'fleet.vehicle.model.brand'
+
+    def write(self, vals):
+        res = super().write(vals)
+        if 'name' in vals:
+            self.env['fleet.vehicle'].with_context(active_test=False).search([('model_id.brand_id', 'in', self.ids)])._queue_finance_sync()
+        return res
@@ -0,0 +1,236 @@
+import logging
+import time
+import traceback
+import uuid
+from datetime import timedelta
+
+from odoo import models, fields, api, _
+from odoo.exceptions import UserError
+
+_logger = logging.getLogger(__name__)
+
+
+class FinanceJob(models.Model):
+    """
+    Lightweight database job queue (no external broker).
+
+    Long running actions are split into chunks of records; each chunk is one
+    ``finance.job``. The runner cron claims pending jobs with
+    ``FOR UPDATE SKIP LOCKED`` so several cron workers can drain the queue in
+    parallel, keeps the row lock while the job runs (a crashed worker simply
+    releases the job back to the queue) and retries failures with exponential
+    backoff.
+    """
+    _name = 'finance.job'
+    _description = 'Finance Background Job'
+    _order = 'id desc'
+
+    name = fields.Char(string="Job", required=True, readonly=True)
+    batch_uuid = fields.Char(string="Batch", readonly=True, index=True, copy=False,
+        help="Jobs enqueued together for one user action share the same batch")
+    user_id = fields.Many2one('res.users', string="Started By", readonly=True, index=True,
+                              default=lambda self: self.env.user)
+    company_id = fields.Many2one('res.company', string="Company", readonly=True,
+                                 default=lambda self: self.env.company)
+
+    model_name = fields.Char(string="Model", required=True, readonly=True)
+    method_name = fields.Char(string="Method", required=True, readonly=True)
+    res_ids = fields.Json(string="Record IDs", readonly=True)
+    method_kwargs = fields.Json(string="Arguments", readonly=True)
+    record_count = fields.Integer(string="Records", readonly=True)
+
+    state = fields.Selection([
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+        ('cancelled', 'Cancelled'),
+    ], string="Status", default='pending', required=True, readonly=True, index=True)
+    priority = fields.Integer(string="Priority", default=10, readonly=True,
+        help="Lower values run first")
+    date_eta = fields.Datetime(string="Run After", readonly=True, index=True,
+        help="The job is not picked up before this time (used for retry backoff)")
+    date_started = fields.Datetime(string="Started", readonly=True)
+    date_done = fields.Datetime(string="Finished", readonly=True)
+
+    attempts = fields.Integer(string="Attempts", default=0, readonly=True)
+    max_attempts = fields.Integer(string="Max Attempts", default=5, readonly=True)
+    result = fields.Char(string="Result", readonly=True)
+    error_message = fields.Text(string="Error", readonly=True)
+
+    batch_progress = fields.Float(string="Batch Progress", compute='_compute_batch_progress',
+        help="Share of the jobs of this batch that are finished")
+
+    def _compute_batch_progress(self):
+        if not self:
+            return
+        self.env.cr.execute("""
+            SELECT batch_uuid,
+                   COUNT(*) FILTER (WHERE state IN ('done', 'failed', 'cancelled')) * 100.0 / COUNT(*)
+            FROM finance_job
+            WHERE batch_uuid = ANY(%s)
+            GROUP BY batch_uuid
+        """, [list(set(self.mapped('batch_uuid')))])
+        progress = dict(self.env.cr.fetchall())
+        for job in self:
+            job.batch_progress = progress.get(job.batch_uuid, 0.0)
+
+    # --------------------------------------------------------
+    # ENQUEUE
+    # --------------------------------------------------------
+
+    @api.model
+    def _get_chunk_size(self):
+        param = self.env['ir.config_parameter'].sudo().search([('key', '=', 'asset_finance.job_chunk_size')], limit=1)
+        return int(param.value) if param else 100
+
+    @api.model
+    def _should_enqueue(self, records):
+        """Large selections go to the queue; small ones (and jobs themselves) run inline"""
+        if self.env.context.get('finance_job_id'):
+            return False
+        param = self.env['ir.config_parameter'].sudo().search([('key', '=', 'asset_finance.job_queue_threshold')], limit=1)
+        threshold = int(param.value) if param else 50
+        return len(records) > threshold
+
+    @api.model
+    def _enqueue(self, records, method_name, name, kwargs=None, chunk_size=None, priority=10):
+        """
+        Split ``records`` into chunks and queue ``records.<method_name>(**kwargs)``
+        for each chunk. The jobs run as the current user and company.
+        Returns the created jobs.
+        """
+        if not hasattr(records, method_name):
+            raise UserError(_("Unknown job method %s on %s.", method_name, records._name))
+        chunk_size = chunk_size or self._get_chunk_size()
+        batch_uuid = uuid.uuid4().hex
+        ids = records.ids
+        vals_list = [{
+            'name': f"{name} ({i // chunk_size + 1}/{(len(ids) - 1) // chunk_size + 1})",
+            'batch_uuid': batch_uuid,
+            'user_id': self.env.uid,
+            'company_id': self.env.company.id,
+            'model_name': records._name,
+            'method_name': method_name,
+            'res_ids': ids[i:i + chunk_size],
+            'method_kwargs': kwargs or {},
+            'record_count': len(ids[i:i + chunk_size]),
+            'priority': priority,
+        } for i in range(0, len(ids), chunk_size)]
+        jobs = self.sudo().create(vals_list)
+        # Start a runner right away instead of waiting for the next cron tick
+        self.sudo().env.ref('asset_finance.ir_cron_finance_job_runner')._trigger()
+        return jobs
+
+    def _action_notify_queued(self):
+        """Client notification returned to the user who queued the jobs"""
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Queued in Background'),
+                'message': _('%(records)s records queued in %(jobs)s jobs. '
+                             'You will be notified when they are done.',
+                             records=sum(self.mapped('record_count')), jobs=len(self)),
+                'type': 'info',
+                'next': {'type': 'ir.actions.act_window_close'},
+            }
+        }
+
+    # --------------------------------------------------------
+    # RUNNER
+    # --------------------------------------------------------
+
+    @api.model
+    def _claim_next(self):
+        """Lock and return the next runnable job, skipping jobs locked by other workers"""
+        self.env.cr.execute("""
+            SELECT id FROM finance_job
+            WHERE state = 'pending' AND (date_eta IS NULL OR date_eta <= (now() AT TIME ZONE 'UTC'))
+            ORDER BY priority, id
+            LIMIT 1
+            FOR UPDATE SKIP LOCKED
+        """)
+        row = self.env.cr.fetchone()
+        return self.browse(row[0]) if row else self.browse()
+
+    @api.model
+    def _cron_run_jobs(self, time_limit=50):
+        """Run queued jobs until the queue is empty or ``time_limit`` seconds elapsed"""
+        deadline = time.monotonic() + time_limit
+        while time.monotonic() < deadline:
+            job = self._claim_next()
+            if not job:
+                break
+            job._run()
+            # Releases the row lock and publishes progress to the user
+            self.env.cr.commit()
+
+    def _run(self):
+        self.ensure_one()
+        self.write({'state': 'running', 'date_started': fields.Datetime.now(), 'attempts': self.attempts + 1})
+        env = self.env(user=self.user_id.id, context=dict(
+            self.env.context,
+            finance_job_id=self.id,
+            allowed_company_ids=[self.company_id.id],
+        ))
+        records = env[self.model_name].browse(self.res_ids or []).exists()
+        try:
+            with self.env.cr.savepoint():
+                result = getattr(records, self.method_name)(**(self.method_kwargs or {}))
+        except Exception as e:
+            self.env.invalidate_all()
+            self._handle_failure(e)
+        else:
+            self.write({
+                'state': 'done',
+                'date_done': fields.Datetime.now(),
+                'result': result if isinstance(result, str) else False,
+                'error_message': False,
+            })
+        self.env.invalidate_all()
+        self._notify_batch_done()
+
+    def _handle_failure(self, error):
+        """Retry with exponential backoff (1, 2, 4, 8... minutes) until max_attempts"""
+        _logger.warning("Finance job %s (%s) failed: %s", self.id, self.name, error)
+        vals = {'error_message': traceback.format_exc()}
+        if self.attempts >= self.max_attempts:
+            vals.update(state='failed', date_done=fields.Datetime.now())
+        else:
+            vals.update(state='pending', date_eta=fields.Datetime.now() + timedelta(minutes=2 ** (self.attempts - 1)))
+        self.write(vals)
+
+    def _notify_batch_done(self):
+        """Tell the user once every job of the batch is finished"""
+        self.ensure_one()
+        batch = self.search([('batch_uuid', '=', self.batch_uuid)])
+        if any(job.state in ('pending', 'running') for job in batch):
+            return
+        failed = batch.filtered(lambda j: j.state == 'failed')
+        self.user_id.partner_id._bus_send('simple_notification', {
+            'type': 'warning' if failed else 'success',
+            'title': self.name.rsplit(' (', 1)[0],
+            'message': _('%(done)s of %(total)s jobs completed, %(failed)s failed.',
+                         done=len(batch) - len(failed), total=len(batch), failed=len(failed)),
+            'sticky': bool(failed),
+        })
+
+    # --------------------------------------------------------
+    # ACTIONS
+    # --------------------------------------------------------
+
+    def action_retry(self):
+        self.filtered(lambda j: j.state in ('failed', 'cancelled')).sudo().write({
+            'state': 'pending', 'attempts': 0, 'date_eta': False, 'error_message': False,
+        })
+        self.sudo().env.ref('asset_finance.ir_cron_finance_job_runner')._trigger()
+
+    def action_cancel(self):
+        self.filtered(lambda j: j.state == 'pending').sudo().write({'state': 'cancelled'})
+
+    @api.model
+    def _gc_jobs(self, days=30):
+        """Remove finished jobs older than ``days`` days"""
+        limit_date = fields.Datetime.subtract(fields.Datetime.now(), days=days)
+        self.search([('date_done', '<', limit_date), ('state', 'in', ('done', 'cancelled'))]).unlink()
@@ -0,0 +1,245 @@
+import functools
+import logging
+import os
+import time
+import traceback
+from contextlib import contextmanager
+
+from odoo import models, fields, api
+
+_logger = logging.getLogger(__name__)
+
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def _resident_memory_mb():
+    """Current resident memory of this worker process in MB (0 if unavailable)"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * PAGE_SIZE / (1024.0 * 1024.0)
+    except (OSError, ValueError, IndexError):  # not Linux
+        return 0.0
+
+
+class JobRunTracker:
+    """
+    Collects the metrics of one cron / batch action run.
+
+    The tracker is passed down in the context under ``finance_job_run`` so
+    the instrumented method can report rows and chunks through
+    ``get_job_tracker(self.env)``. The run record itself is written through
+    a separate cursor, so it survives a rollback of the job transaction and
+    is visible while the job is still running.
+    """
+
+    def __init__(self, env, name, job_type, method):
+        self.env = env
+        self.name = name
+        self.job_type = job_type
+        self.method = method
+        self.run_id = False
+        self.rows_scanned = 0
+        self.records_written = 0
+        self.chunks = []
+        self._start = None
+        self._start_queries = 0
+        self._start_memory = 0.0
+
+    # --- Reporting API used by the instrumented methods ---
+
+    def add_scanned(self, count):
+        self.rows_scanned += count
+
+    def add_written(self, count):
+        self.records_written += count
+
+    @contextmanager
+    def chunk(self, label=None, rows=0):
+        """Time one chunk of work: ``with tracker.chunk('batch 3', rows=100):``"""
+        start = time.perf_counter()
+        start_queries = self._query_count()
+        try:
+            yield
+        finally:
+            self.chunks.append({
+                'sequence': len(self.chunks) + 1,
+                'name': label or f"Chunk {len(self.chunks) + 1}",
+                'rows': rows,
+                'duration': time.perf_counter() - start,
+                'query_count': self._query_count() - start_queries,
+            })
+
+    # --- Lifecycle ---
+
+    def _query_count(self):
+        return getattr(self.env.cr, 'sql_log_count', 0)
+
+    def _run_cursor(self):
+        """Cursor of the run record: its own transaction, committed on exit"""
+        return self.env.registry.cursor()
+
+    def _write_run(self, vals):
+        with self._run_cursor() as cr:
+            Run = self.env(cr=cr, su=True)['finance.job.run']
+            if self.run_id:
+                Run.browse(self.run_id).write(vals)
+            else:
+                self.run_id = Run.create(vals).id
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        self._start_queries = self._query_count()
+        self._start_memory = _resident_memory_mb()
+        try:
+            self._write_run({
+                'name': self.name,
+                'job_type': self.job_type,
+                'method': self.method,
+                'user_id': self.env.uid,
+                'date_start': fields.Datetime.now(),
+                'state': 'running',
+            })
+        except Exception:
+            # Instrumentation must never prevent the job itself from running
+            _logger.exception("Could not create job run record for %s", self.method)
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        vals = {
+            'date_end': fields.Datetime.now(),
+            'duration': time.perf_counter() - self._start,
+            'state': 'failed' if exc_type else 'done',
+            'rows_scanned': self.rows_scanned,
+            'records_written': self.records_written,
+            'query_count': self._query_count() - self._start_queries,
+            'memory_delta_mb': _resident_memory_mb() - self._start_memory,
+            'chunk_ids': [(0, 0, chunk) for chunk in self.chunks],
+        }
+        if exc_type:
+            vals['error_message'] = ''.join(traceback.format_exception(exc_type, exc_value, tb))
+        _logger.info(
+            "%s finished in %.2fs: %s rows scanned, %s written, %s queries",
+            self.name, vals['duration'], self.rows_scanned, self.records_written, vals['query_count'],
+        )
+        try:
+            if self.run_id:
+                self._write_run(vals)
+        except Exception:
+            _logger.exception("Could not update job run record for %s", self.method)
+        # Never swallow the job's own exception
+        return False
+
+
+class _NoopTracker:
+    """Stand-in used when a method is called outside an instrumented run"""
+
+    def add_scanned(self, count):
+        pass
+
+    def add_written(self, count):
+        pass
+
+    @contextmanager
+    def chunk(self, label=None, rows=0):
+        yield
+
+
+def get_job_tracker(env):
+    """Return the tracker of the current job run, or a no-op tracker"""
+    return env.context.get('finance_job_run') or _NoopTracker()
+
+
+def finance_job(name, job_type='cron'):
+    """
+    Decorator recording a ``finance.job.run`` for each call of a cron or
+    batch action method.
+
+    Nested instrumented calls (e.g. a batch action calling a single-record
+    action) are folded into the outer run.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self.env.context.get('finance_job_run'):
+                return method(self, *args, **kwargs)
+            tracker = JobRunTracker(self.env, name, job_type, f"{self._name}.{method.__name__}")
+            with tracker:
+                job = self.with_context(finance_job_run=tracker)
+                result = method(job, *args, **kwargs)
+                # Flush the last writes while the run is in context, not at commit
+                job.env.flush_all()
+                return result
+        return wrapper
+    return decorator
+
+
+class FinanceJobRun(models.Model):
+    _name = 'finance.job.run'
+    _description = 'Finance Job Run'
+    _order = 'date_start desc, id desc'
+
+    name = fields.Char(string="Job", required=True, readonly=True)
+    job_type = fields.Selection([
+        ('cron', 'Scheduled Action'),
+        ('batch', 'Batch Action'),
+        ('wizard', 'Wizard'),
+    ], string="Type", required=True, default='cron', readonly=True)
+    method = fields.Char(string="Method", readonly=True, index=True)
+    user_id = fields.Many2one('res.users', string="Started By", readonly=True)
+
+    state = fields.Selection([
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ], string="Status", default='running', readonly=True, index=True)
+
+    date_start = fields.Datetime(string="Start", readonly=True, index=True)
+    date_end = fields.Datetime(string="End", readonly=True)
+    duration = fields.Float(string="Duration (s)", readonly=True, aggregator='avg')
+
+    rows_scanned = fields.Integer(string="Rows Scanned", readonly=True)
+    records_written = fields.Integer(string="Records Written", readonly=True)
+    query_count = fields.Integer(string="SQL Queries", readonly=True)
+    memory_delta_mb = fields.Float(string="Memory Growth (MB)", readonly=True, aggregator='max',
+        help="Resident memory of the worker at the end of the run minus at its start")
+    queries_per_row = fields.Float(string="Queries / Row", compute='_compute_queries_per_row', store=True,
+                                   aggregator='avg')
+
+    error_message = fields.Text(string="Error", readonly=True)
+    chunk_ids = fields.One2many('finance.job.run.chunk', 'run_id', string="Chunks", readonly=True)
+    chunk_count = fields.Integer(string="Chunks", compute='_compute_queries_per_row', store=True)
+
+    @api.depends('query_count', 'rows_scanned', 'chunk_ids')
+    def _compute_queries_per_row(self):
+        for rec in self:
+            rec.queries_per_row = rec.query_count / rec.rows_scanned if rec.rows_scanned else 0.0
+            rec.chunk_count = len(rec.chunk_ids)
+
+    @api.model
+    def _gc_job_runs(self, days=90):
+        """Remove run history older than ``days`` days"""
+        limit_date = fields.Datetime.subtract(fields.Datetime.now(), days=days)
+        self.search([('date_start', '<', limit_date), ('state', '!=', 'running')]).unlink()
+
+    def action_view_chunks(self):
+        self.ensure_one()
+        return {
+            'name': 'Chunk Timings',
+            'type': 'ir.actions.act_window',
+            'res_model': 'finance.job.run.chunk',
+            'view_mode': 'graph,list',
+            'domain': [('run_id', '=', self.id)],
+        }
+
+
+class FinanceJobRunChunk(models.Model):
+    _name = 'finance.job.run.chunk'
+    _description = 'Finance Job Run Chunk'
+    _order = 'run_id, sequence'
+
+    run_id = fields.Many2one('finance.job.run', string="Run", required=True, ondelete='cascade', index=True)
+    sequence = fields.Integer(string="#")
+    name = fields.Char(string="Chunk")
+    rows = fields.Integer(string="Rows")
+    duration = fields.Float(string="Duration (s)")
+    query_count = fields.Integer(string="SQL Queries")
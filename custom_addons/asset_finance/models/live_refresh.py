@@ -0,0 +1,93 @@
+from odoo import models, api
+
+from .job_run import get_job_tracker
+
+# the contracts each report view is built from; their balances and statuses
+# are recomputed on every payment, so their write_date moves the report tokens
+REPORT_SOURCE_DOMAINS = {
+    'finance.report.collection': [('ac_status', '=', 'active')],
+    'finance.report.aging': [('ac_status', 'in', ('active', 'repo'))],
+    'finance.report.portfolio': [],
+}
+
+
+def _in_cron_run(env):
+    """Whether a cron job is writing in this transaction, from any of its environments"""
+    return any(getattr(get_job_tracker(e), 'job_type', None) == 'cron' for e in env.transaction.envs)
+# the report views reloaded with the contract views
+REPORT_MODELS = ['finance.report.collection', 'finance.report.aging', 'finance.report.portfolio']
+
+
+class FinanceContract(models.Model):
+    _inherit = 'finance.contract'
+
+    def _get_live_refresh_fields(self):
+        """Contract fields shown in lists that should reload open views when they change"""
+        return {
+            'ac_status', 'late_status', 'total_overdue_days', 'dunning_step_id', 'dunning_exception',
+            'balance_hire', 'balance_late_charges', 'balance_misc_fee', 'accrued_penalty', 'total_late_paid',
+            'os_balance', 'total_payable',
+        }
+
+    def _write_multi(self, vals_list):
+        # Written and recomputed values (overdue status, balances) all reach
+        # the database through the flush, recomputes do not go through write
+        res = super()._write_multi(vals_list)
+        fnames = self._get_live_refresh_fields()
+        # Nightly crons rewrite thousands of contracts: leave those to the
+        # polled change token instead of reloading every open view at once
+        if any(fnames & set(vals) for vals in vals_list) and not _in_cron_run(self.env):
+            self._muk_web_refresh_notify()
+        return res
+
+    def _muk_web_refresh_notify(self):
+        # the report views show contract balances and statuses
+        super()._muk_web_refresh_notify()
+        for name in REPORT_MODELS:
+            self.env[name]._muk_web_refresh_notify()
+
+
+class AccountPayment(models.Model):
+    _inherit = 'account.payment'
+
+    def action_post(self):
+        res = super().action_post()
+        self._muk_web_refresh_notify()
+        if self.contract_id:
+            self.contract_id._muk_web_refresh_notify()
+            self.env['finance.payment.allocation']._muk_web_refresh_notify()
+        return res
+
+
+class FinanceCollectionQueue(models.Model):
+    _inherit = 'finance.collection.queue'
+
+    @api.model
+    def _refresh(self, contract_ids=None):
+        count = super()._refresh(contract_ids)
+        self._muk_web_refresh_notify()
+        return count
+
+
+class FinanceCollectionReport(models.Model):
+    _inherit = 'finance.report.collection'
+
+    @api.model
+    def _muk_web_refresh_token_sources(self, domain):
+        return [('finance.contract', REPORT_SOURCE_DOMAINS[self._name])]
+
+
+class FinanceAgingReport(models.Model):
+    _inherit = 'finance.report.aging'
+
+    @api.model
+    def _muk_web_refresh_token_sources(self, domain):
+        return [('finance.contract', REPORT_SOURCE_DOMAINS[self._name])]
+
+
+class FinancePortfolioReport(models.Model):
+    _inherit = 'finance.report.portfolio'
+
+    @api.model
+    def _muk_web_refresh_token_sources(self, domain):
+        return [('finance.contract', REPORT_SOURCE_DOMAINS[self._name])]
@@ -48,4 +48,12 @@ class FinanceProduct(models.Model):
     def _check_dates(self):
         for rec in self:
             if rec.date_start and rec.date_end and rec.date_start > rec.date_end:
-                raise ValidationError("Start Date cannot be after End Date")
\ No newline at end of file
+                raise ValidationError("Start Date cannot be after End Date")
+
+    def _get_allowed_months(self):
+        """Terms (in months) the product can be financed over"""
+        self.ensure_one()
+        if self.min_months and self.max_months and self.step_months > 0:
+            return list(range(self.min_months, self.max_months + 1, self.step_months))
+        # Fallback to default if no rules are set on the product
+        return list(range(12, 121, 12))
@@ -0,0 +1,118 @@
+import re
+
+from odoo import models, api
+from odoo.tools import escape_psql
+
+from .res_partner_phone import normalize_phone
+
+
+class FinanceQuickSearch(models.AbstractModel):
+    """
+    Unified lookup over contracts, assets and partners for the collector and
+    officer search box. Every searched column, including the partner
+    complete_name, has a trigram index (when pg_trgm is available), so both
+    the prefix and the substring pass are index scans, and phone numbers hit
+    the indexed E.164 columns; record rules apply as with any ORM search.
+    """
+    _name = 'finance.quick.search'
+    _description = 'Finance Quick Search'
+
+    MIN_TERM_LENGTH = 3  # trigram indexes need at least three characters
+
+    @api.model
+    def _get_search_sources(self):
+        """(model, searched fields, extra fields, result builder) of each source, in display priority"""
+        return [
+            ('finance.contract', ['agreement_no', 'asset_reg_no'], ['hirer_id', 'ac_status'], self._contract_result),
+            ('finance.asset', ['registration_no', 'chassis_no'], ['display_name', 'status'], self._asset_result),
+            ('res.partner', ['nric', 'complete_name'], ['phone'], self._partner_result),
+        ]
+
+    @api.model
+    def search_records(self, term, limit=10):
+        """
+        Return up to ``limit`` ranked matches for ``term``: exact matches
+        first, then prefix matches, then substring matches.
+        """
+        term = (term or '').strip()
+        if len(term) < self.MIN_TERM_LENGTH:
+            return []
+
+        results = []
+        # A phone number is matched exactly on the normalized column
+        phone = normalize_phone(term, self.env['res.partner.phone']._get_phone_country_code())
+        if phone and len(re.sub(r'\D', '', term)) >= 6 and self.env['res.partner'].has_access('read'):
+            for partner in self.env['res.partner'].search_fetch(
+                ['|', ('phone_e164', '=', phone), ('phone_ids.phone_e164', '=', phone)],
+                ['complete_name', 'nric', 'phone'], limit=limit,
+            ):
+                result = self._partner_result(partner)
+                result.update(model='res.partner', id=partner.id, score=400)
+                results.append(result)
+
+        for priority, (model_name, field_names, extra_fields, builder) in enumerate(self._get_search_sources()):
+            Model = self.env[model_name]
+            if not Model.has_access('read'):
+                continue
+            found = Model.browse()
+            # Prefix pass first so short terms are not drowned by substring matches
+            for pattern in (f'{escape_psql(term)}%', f'%{escape_psql(term)}%'):
+                domain = ['|'] * (len(field_names) - 1) + [(field_name, '=ilike', pattern) for field_name in field_names]
+                if found:
+                    domain = [('id', 'not in', found.ids)] + domain
+                found |= Model.search_fetch(domain, field_names + extra_fields, limit=limit - len(found))
+                if len(found) >= limit:
+                    break
+            for record in found:
+                if any(r['model'] == model_name and r['id'] == record.id for r in results):
+                    continue
+                values = [record[field_name] or '' for field_name in field_names]
+                result = builder(record)
+                result.update(
+                    model=model_name,
+                    id=record.id,
+                    score=self._match_score(term, values) - priority,
+                )
+                results.append(result)
+
+        results.sort(key=lambda r: r['score'], reverse=True)
+        return results[:limit]
+
+    @api.model
+    def _match_score(self, term, values):
+        """Best score over the matched values: exact 300, prefix 200, substring 100, shorter values first"""
+        term = term.lower()
+        best = 0
+        for value in values:
+            value = value.lower()
+            if value == term:
+                score = 300
+            elif value.startswith(term):
+                score = 200
+            elif term in value:
+                score = 100
+            else:
+                continue
+            best = max(best, score - min(len(value) - len(term), 50))
+        return best
+
+    def _contract_result(self, contract):
+        return {
+            'name': contract.agreement_no,
+            'description': ' - '.join(filter(None, [contract.hirer_id.display_name, contract.asset_reg_no])),
+            'status': contract.ac_status,
+        }
+
+    def _asset_result(self, asset):
+        return {
+            'name': asset.display_name,
+            'description': asset.chassis_no or '',
+            'status': asset.status,
+        }
+
+    def _partner_result(self, partner):
+        return {
+            'name': partner.complete_name,
+            'description': ' - '.join(filter(None, [partner.nric, partner.phone])),
+            'status': False,
+        }
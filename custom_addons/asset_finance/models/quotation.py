@@ -0,0 +1,118 @@
+from odoo import models, fields, api, _
+from odoo.exceptions import UserError
+
+from .contract_financial import compute_financials, compute_installments, compute_schedule, schedule_start_date
+
+
+class FinanceQuotation(models.AbstractModel):
+    """
+    Instant what-if quotes for dealer and officer calculators. A quote runs
+    the same calculations as the contract computes on plain values, so it
+    creates no finance.contract, triggers no onchange or recompute cascade
+    and writes nothing; many scenarios are answered in one call.
+    """
+    _name = 'finance.quotation'
+    _description = 'Finance Quotation'
+
+    MAX_SCENARIOS = 500
+
+    @api.model
+    def quote(self, scenarios, with_schedule=False):
+        """
+        Quote each scenario of ``scenarios``, a list of dicts with
+        ``product_id``, ``cash_price``, ``down_payment``, ``months`` and
+        optionally ``int_rate_pa`` (product default rate otherwise),
+        ``interest_method``, ``payment_scheme``, ``agreement_date`` and
+        ``first_due_date``. Returns one result per scenario, in order: the
+        amounts, or ``errors`` when the scenario breaks the product limits.
+        """
+        if len(scenarios) > self.MAX_SCENARIOS:
+            raise UserError(_("A quotation accepts at most %s scenarios per call.", self.MAX_SCENARIOS))
+        product_ids = {scenario.get('product_id') for scenario in scenarios if isinstance(scenario.get('product_id'), int)}
+        products = self.env['finance.product'].browse(product_ids).exists()
+        products.fetch([
+            'name', 'date_start', 'date_end', 'default_int_rate', 'min_finance_amount', 'max_finance_amount',
+            'min_finance_percent', 'max_finance_percent', 'min_months', 'max_months', 'step_months', 'currency_id',
+        ])
+        products_by_id = {product.id: product for product in products}
+        return [
+            self._quote_scenario(scenario, products_by_id.get(scenario.get('product_id')), with_schedule)
+            for scenario in scenarios
+        ]
+
+    @api.model
+    def _quote_scenario(self, scenario, product, with_schedule):
+        if not product:
+            return {'errors': [_("Unknown financial product.")]}
+        try:
+            cash_price = float(scenario.get('cash_price') or 0)
+            down_payment = float(scenario.get('down_payment') or 0)
+            months = int(scenario.get('months') or 0)
+            int_rate_pa = scenario.get('int_rate_pa')
+            int_rate_pa = product.default_int_rate if int_rate_pa is None else float(int_rate_pa)
+            agreement_date = fields.Date.to_date(scenario.get('agreement_date')) or fields.Date.context_today(self)
+            first_due_date = fields.Date.to_date(scenario.get('first_due_date'))
+        except (TypeError, ValueError):
+            return {'errors': [_("Invalid scenario values.")]}
+        interest_method = scenario.get('interest_method') or 'rule78'
+        payment_scheme = scenario.get('payment_scheme') or 'arrears'
+
+        financials = compute_financials(cash_price, down_payment, int_rate_pa, months)
+        loan_amount = financials['loan_amount']
+        finance_percent = loan_amount / cash_price * 100 if cash_price else 0.0
+        errors = self._check_scenario(
+            product, cash_price, down_payment, months, int_rate_pa, agreement_date,
+            interest_method, payment_scheme, loan_amount, finance_percent,
+        )
+        if errors:
+            return {'errors': errors}
+
+        result = dict(
+            financials,
+            **compute_installments(loan_amount, financials['balance_hire'], int_rate_pa, months),
+            product_id=product.id,
+            months=months,
+            int_rate_pa=int_rate_pa,
+            finance_percent=finance_percent,
+        )
+        if with_schedule:
+            result['schedule'] = [
+                dict(line, date_due=fields.Date.to_string(line['date_due']))
+                for line in compute_schedule(
+                    schedule_start_date(first_due_date, agreement_date, payment_scheme),
+                    months, loan_amount, result['term_charges'], result['first_inst_amount'],
+                    result['monthly_inst'], interest_method, product.currency_id.decimal_places,
+                )
+            ]
+        return result
+
+    @api.model
+    def _check_scenario(self, product, cash_price, down_payment, months, int_rate_pa, agreement_date,
+                        interest_method, payment_scheme, loan_amount, finance_percent):
+        """The contract constraints and finance.product limits a scenario breaks, as messages"""
+        errors = []
+        if cash_price <= 0:
+            errors.append(_("Cash price must be positive."))
+        if down_payment < 0 or down_payment > cash_price:
+            errors.append(_("Down payment cannot exceed cash price."))
+        if int_rate_pa < 0 or int_rate_pa > 100:
+            errors.append(_("Interest rate must be between 0 and 100%."))
+        if interest_method not in ('flat', 'rule78'):
+            errors.append(_("Unknown interest method %s.", interest_method))
+        if payment_scheme not in ('arrears', 'advance'):
+            errors.append(_("Unknown payment scheme %s.", payment_scheme))
+        if months not in product._get_allowed_months():
+            errors.append(_("%(product)s cannot be financed over %(months)s months.", product=product.name, months=months))
+        if product.date_start and agreement_date < product.date_start:
+            errors.append(_("Product not valid before %s.", product.date_start))
+        if product.date_end and agreement_date > product.date_end:
+            errors.append(_("Product expired on %s.", product.date_end))
+        if product.min_finance_amount and loan_amount < product.min_finance_amount:
+            errors.append(_("Loan amount is below the product minimum of %s.", product.min_finance_amount))
+        if product.max_finance_amount and loan_amount > product.max_finance_amount:
+            errors.append(_("Loan amount is above the product maximum of %s.", product.max_finance_amount))
+        if product.min_finance_percent and finance_percent < product.min_finance_percent:
+            errors.append(_("Financing is below the product minimum of %s%% of the cash price.", product.min_finance_percent))
+        if product.max_finance_percent and finance_percent > product.max_finance_percent:
+            errors.append(_("Financing is above the product maximum of %s%% of the cash price.", product.max_finance_percent))
+        return errors
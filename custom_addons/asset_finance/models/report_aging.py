@@ -4,7 +4,15 @@ class FinanceAgingReport(models.Model):
     _name = 'finance.report.aging'
     _description = 'Aging Analysis Report'
     _auto = False
-    _order = 'total_overdue_days desc, balance_hire desc'
+    _order = 'total_overdue_days desc, os_balance desc'
+    _depends = {
+        'finance.contract': [
+            'agreement_no', 'hirer_id', 'asset_reg_no', 'asset_make', 'asset_model', 'product_id', 'ac_status',
+            'currency_id', 'os_balance', 'accrued_penalty', 'balance_late_charges', 'total_payable', 'late_status',
+        ],
+        'finance.contract.line': ['contract_id', 'date_due', 'invoice_id'],
+        'account.move': ['payment_state'],
+    }
 
     agreement_no = fields.Char(string="Agreement No", readonly=True)
     hirer_id = fields.Many2one('res.partner', string="Hirer", readonly=True)
@@ -13,8 +21,7 @@ class FinanceAgingReport(models.Model):
     asset_model = fields.Char(string="Model", readonly=True)
     product_id = fields.Many2one('finance.product', string="Product", readonly=True)
 
-    # FIXED: Field Name
-    balance_hire = fields.Monetary(string="Outstanding Balance", readonly=True, currency_field='currency_id')
+    os_balance = fields.Monetary(string="Outstanding Balance", readonly=True, currency_field='currency_id')
     
     accrued_penalty = fields.Monetary(string="Penalties", readonly=True, currency_field='currency_id')
     balance_late_charges = fields.Monetary(string="Late Charges", readonly=True, currency_field='currency_id')
@@ -41,11 +48,11 @@ class FinanceAgingReport(models.Model):
                     fc.ac_status,
                     fc.currency_id,
                     
-                    -- FIXED: Use balance_hire column
-                    fc.balance_hire,
+                    -- Stored contract balances, net of the installments paid
+                    COALESCE(fc.os_balance, 0) as os_balance,
                     COALESCE(fc.accrued_penalty, 0) as accrued_penalty,
-                    0 as balance_late_charges,
-                    (COALESCE(fc.balance_hire, 0) + COALESCE(fc.accrued_penalty, 0)) as total_payable,
+                    COALESCE(fc.balance_late_charges, 0) as balance_late_charges,
+                    COALESCE(fc.total_payable, 0) as total_payable,
 
                     fc.late_status,
 
@@ -73,7 +80,7 @@ class FinanceAgingReport(models.Model):
                 
                 GROUP BY 
                     fc.id, fc.agreement_no, fc.hirer_id, fc.asset_reg_no, fc.asset_make,
-                    fc.asset_model, fc.product_id, fc.balance_hire, fc.ac_status,
-                    fc.late_status, fc.accrued_penalty, fc.currency_id
+                    fc.asset_model, fc.product_id, fc.os_balance, fc.ac_status,
+                    fc.late_status, fc.accrued_penalty, fc.balance_late_charges, fc.total_payable, fc.currency_id
             )
         """ % self._table)
\ No newline at end of file
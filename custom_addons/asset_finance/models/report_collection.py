@@ -5,6 +5,15 @@ class FinanceCollectionReport(models.Model):
     _description = 'Collection Report'
     _auto = False
     _order = 'total_overdue_days desc, total_payable desc'
+    _depends = {
+        'finance.contract': [
+            'agreement_no', 'hirer_id', 'asset_reg_no', 'product_id', 'late_status', 'currency_id', 'ac_status',
+            'os_balance', 'balance_late_charges', 'balance_misc_fee', 'total_payable',
+        ],
+        'finance.contract.line': ['contract_id', 'date_due', 'invoice_id'],
+        'account.move': ['payment_state'],
+        'account.payment': ['contract_id', 'state', 'payment_type', 'date'],
+    }
 
     agreement_no = fields.Char(string="Agreement No", readonly=True)
     hirer_id = fields.Many2one('res.partner', string="Hirer", readonly=True)
@@ -22,8 +31,7 @@ class FinanceCollectionReport(models.Model):
         ('legal', 'Legal Action')
     ], string="Status", readonly=True)
 
-    # FIXED: balance_installment -> balance_hire
-    balance_hire = fields.Monetary(string="Outstanding", readonly=True, currency_field='currency_id')
+    os_balance = fields.Monetary(string="Outstanding", readonly=True, currency_field='currency_id')
     balance_late_charges = fields.Monetary(string="Late Charges", readonly=True, currency_field='currency_id')
     balance_misc_fee = fields.Monetary(string="Misc Fees", readonly=True, currency_field='currency_id')
     total_payable = fields.Monetary(string="Total Due", readonly=True, currency_field='currency_id')
@@ -48,15 +56,11 @@ class FinanceCollectionReport(models.Model):
                     fc.late_status,
                     fc.currency_id,
                     
-                    -- FIXED: fc.balance_installment -> fc.balance_hire
-                    fc.balance_hire,
+                    -- Stored contract balances, net of the installments paid
+                    COALESCE(fc.os_balance, 0) as os_balance,
                     COALESCE(fc.balance_late_charges, 0) as balance_late_charges,
                     COALESCE(fc.balance_misc_fee, 0) as balance_misc_fee,
-                    
-                    -- Calculated Total Payable
-                    (COALESCE(fc.balance_hire, 0) + 
-                     COALESCE(fc.balance_late_charges, 0) + 
-                     COALESCE(fc.balance_misc_fee, 0)) as total_payable,
+                    COALESCE(fc.total_payable, 0) as total_payable,
 
                     overdue_calc.total_overdue_days,
                     last_pmt.last_payment_date,
@@ -64,7 +68,7 @@ class FinanceCollectionReport(models.Model):
                     -- Priority Score (Simple logic: Days * Amount)
                     CASE 
                         WHEN overdue_calc.total_overdue_days > 0 THEN 
-                            (overdue_calc.total_overdue_days * (COALESCE(fc.balance_hire, 0) + COALESCE(fc.balance_late_charges, 0) + COALESCE(fc.balance_misc_fee, 0)) / 1000)
+                            (overdue_calc.total_overdue_days * COALESCE(fc.total_payable, 0) / 1000)
                         ELSE 0
                     END as priority_score
 
@@ -24,6 +24,9 @@ class FinanceInterestIncomeReport(models.Model):
     # --- Financial Details ---
     loan_amount = fields.Monetary(string="Loan Amount", readonly=True, currency_field='currency_id')
     term_charges = fields.Monetary(string="Total Interest", readonly=True, currency_field='currency_id')
+    int_rate_pa = fields.Float(string="Flat Rate (%)", readonly=True, aggregator='avg')
+    eir_rate = fields.Float(string="EIR (%)", digits=(16, 4), readonly=True, aggregator='avg')
+    apr_rate = fields.Float(string="APR (%)", digits=(16, 4), readonly=True, aggregator='avg')
 
     # --- Interest Breakdown ---
     earned_interest = fields.Monetary(string="Earned Interest", readonly=True, currency_field='currency_id')
@@ -54,6 +57,9 @@ class FinanceInterestIncomeReport(models.Model):
                     
                     fc.loan_amount,
                     fc.term_charges,
+                    fc.int_rate_pa,
+                    fc.eir_rate,
+                    fc.apr_rate,
                     
                     -- Earned Interest
                     COALESCE(fc.interest_derived, 0) as earned_interest,
@@ -85,10 +85,10 @@ class FinancePortfolioReport(models.Model):
                     SUM(fc.term_charges) as total_interest,
                     SUM(fc.balance_hire) as total_hire,
 
-                    -- Outstanding metrics (calculated from stored fields)
-                    SUM(fc.balance_hire - COALESCE(fc.total_inst_paid, 0)) as total_outstanding,
+                    -- Outstanding metrics (stored os_balance)
+                    SUM(fc.os_balance) as total_outstanding,
                     SUM(CASE
-                        WHEN overdue_info.is_overdue THEN fc.balance_hire - COALESCE(fc.total_inst_paid, 0)
+                        WHEN overdue_info.is_overdue THEN fc.os_balance
                         ELSE 0
                     END) as total_overdue,
                     SUM(fc.accrued_penalty) as total_penalties,
@@ -100,11 +100,11 @@ class FinancePortfolioReport(models.Model):
 
                     -- Risk metrics
                     CASE
-                        WHEN SUM(fc.balance_hire - COALESCE(fc.total_inst_paid, 0)) > 0 THEN
+                        WHEN SUM(fc.os_balance) > 0 THEN
                             (SUM(CASE
-                                WHEN overdue_info.is_overdue THEN fc.balance_hire - COALESCE(fc.total_inst_paid, 0)
+                                WHEN overdue_info.is_overdue THEN fc.os_balance
                                 ELSE 0
-                            END) / SUM(fc.balance_hire - COALESCE(fc.total_inst_paid, 0))) * 100
+                            END) / SUM(fc.os_balance)) * 100
                         ELSE 0
                     END as overdue_percentage,
 
@@ -82,6 +82,73 @@ class ResConfigSettings(models.TransientModel):
         help="Number of days before installment due date to send reminder."
     )
 
+    # Dashboard
+    dashboard_cache_seconds = fields.Integer(
+        string="Dashboard Cache (Seconds)",
+        default=60,
+        config_parameter='asset_finance.dashboard_cache_seconds',
+        help="How long the browser may reuse dashboard widget data before revalidating it with the server."
+    )
+
+    # Phone Numbers
+    phone_country_code = fields.Char(
+        string="Default Phone Country Code",
+        default='65',
+        config_parameter='asset_finance.phone_country_code',
+        help="Country calling code assumed for phone numbers entered without an international prefix."
+    )
+
+    # Collection Queue
+    collection_weight_days = fields.Float(
+        string="Score Weight: Days Overdue",
+        default=1.0,
+        config_parameter='asset_finance.collection_weight_days',
+        help="Priority points per day overdue."
+    )
+
+    collection_weight_amount = fields.Float(
+        string="Score Weight: Amount Due",
+        default=1.0,
+        config_parameter='asset_finance.collection_weight_amount',
+        help="Priority points per 1,000 of total amount due."
+    )
+
+    collection_weight_status = fields.Float(
+        string="Score Weight: Late Status",
+        default=50.0,
+        config_parameter='asset_finance.collection_weight_status',
+        help="Priority points for 'Attention' (twice as many for 'Legal Action')."
+    )
+
+    collection_weight_silence = fields.Float(
+        string="Score Weight: Days Since Payment",
+        default=0.5,
+        config_parameter='asset_finance.collection_weight_silence',
+        help="Priority points per day since the last payment."
+    )
+
+    collection_auto_assign = fields.Boolean(
+        string="Auto Assign Collectors",
+        default=False,
+        config_parameter='asset_finance.collection_auto_assign',
+        help="Assign new queue accounts to the collection staff member with the fewest accounts."
+    )
+
+    # Background Jobs
+    job_queue_threshold = fields.Integer(
+        string="Background Job Threshold",
+        default=50,
+        config_parameter='asset_finance.job_queue_threshold',
+        help="Batch actions on more records than this run as background jobs instead of in the request."
+    )
+
+    job_chunk_size = fields.Integer(
+        string="Background Job Chunk Size",
+        default=100,
+        config_parameter='asset_finance.job_chunk_size',
+        help="Number of records processed per background job."
+    )
+
     # Currency
     currency_id = fields.Many2one(
         'res.currency',
@@ -1,10 +1,25 @@
-from odoo import models, fields
+import hashlib
+import re
+
+from odoo import models, fields, api
+
+from .res_partner_phone import normalize_phone
+
+
+def identity_key(nric):
+    """Canonical hash of an NRIC / FIN / UEN: case, spaces and punctuation are ignored"""
+    normalized = re.sub(r'[^0-9A-Z]', '', (nric or '').upper())
+    return hashlib.sha256(normalized.encode()).hexdigest() if normalized else False
+
 
 class ResPartner(models.Model):
     _inherit = 'res.partner'
 
     # --- Identity ---
-    nric = fields.Char(string="NRIC / FIN / UEN", help="National ID or Company Reg No")
+    nric = fields.Char(string="NRIC / FIN / UEN", help="National ID or Company Reg No", index='trigram')
+    complete_name = fields.Char(index='trigram')  # substring-matched by the quick search
+    identity_key = fields.Char(string="Identity Key", compute='_compute_identity_key', store=True, index=True,
+                               copy=False, help="Normalized NRIC / UEN hash used for blacklist and duplicate screening")
     date_of_birth = fields.Date(string="Date of Birth / Incorporation")
 
     # --- Finance Partner Type (Only for Business Entities) ---
@@ -40,4 +55,92 @@ class ResPartner(models.Model):
     ], string="Address Category")
 
     # Multiple Contact Numbers ---
-    phone_ids = fields.One2many('res.partner.phone', 'partner_id', string="Contact Numbers")
\ No newline at end of file
+    phone_ids = fields.One2many('res.partner.phone', 'partner_id', string="Contact Numbers")
+    phone_e164 = fields.Char(string="E.164 Phone", readonly=True, index=True, copy=False,
+                             help="Normalized copy of the phone number for reverse lookups")
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        country_code = self.env['res.partner.phone']._get_phone_country_code()
+        for vals in vals_list:
+            if vals.get('phone'):
+                vals['phone_e164'] = normalize_phone(vals['phone'], country_code)
+        return super().create(vals_list)
+
+    def write(self, vals):
+        if 'phone' in vals:
+            country_code = self.env['res.partner.phone']._get_phone_country_code()
+            vals = dict(vals, phone_e164=normalize_phone(vals['phone'], country_code))
+        return super().write(vals)
+
+    @api.depends('nric')
+    def _compute_identity_key(self):
+        for partner in self:
+            partner.identity_key = identity_key(partner.nric)
+
+    @api.model
+    def finance_phone_lookup(self, number):
+        """
+        Reverse lookup for incoming calls: the partners whose phone or
+        contact numbers match ``number`` after E.164 normalization, each
+        with every finance contract they are hirer, guarantor or co-borrower
+        of. Matching and contracts come from one indexed query.
+        """
+        phone = normalize_phone(number, self.env['res.partner.phone']._get_phone_country_code())
+        if not phone:
+            return []
+        self.env.flush_all()
+        self.env.cr.execute("""
+            WITH hits AS (
+                SELECT p.id FROM res_partner p WHERE p.phone_e164 = %(phone)s
+                UNION
+                SELECT ph.partner_id FROM res_partner_phone ph WHERE ph.phone_e164 = %(phone)s
+            ), matched AS (
+                -- the number of a contact person also finds the contracts of its company
+                SELECT h.id AS partner_id FROM hits h
+                UNION
+                SELECT p.commercial_partner_id FROM res_partner p JOIN hits h ON h.id = p.id
+                WHERE p.commercial_partner_id IS NOT NULL
+            ), roles AS (
+                SELECT c.hirer_id AS partner_id, c.id AS contract_id, 'hirer' AS role
+                FROM finance_contract c JOIN matched m ON m.partner_id = c.hirer_id
+                UNION ALL
+                SELECT g.partner_id, g.contract_id, 'guarantor'
+                FROM finance_contract_guarantor g JOIN matched m ON m.partner_id = g.partner_id
+                UNION ALL
+                SELECT j.partner_id, j.contract_id, 'joint_hirer'
+                FROM finance_contract_joint_hirer j JOIN matched m ON m.partner_id = j.partner_id
+            )
+            SELECT m.partner_id, c.id, r.role, c.agreement_no, c.ac_status, c.late_status, c.asset_reg_no,
+                   c.total_payable
+            FROM matched m
+            LEFT JOIN roles r ON r.partner_id = m.partner_id
+            LEFT JOIN finance_contract c ON c.id = r.contract_id
+            ORDER BY m.partner_id, c.id
+        """, {'phone': phone})
+        rows = self.env.cr.fetchall()
+
+        # The query bypasses record rules: keep only what the user may read
+        partners = self.search([('id', 'in', list({row[0] for row in rows}))])
+        readable_contract_ids = set(self.env['finance.contract'].search(
+            [('id', 'in', [row[1] for row in rows if row[1]])]
+        ).ids)
+        result = {partner.id: {
+            'id': partner.id,
+            'name': partner.display_name,
+            'nric': partner.nric or '',
+            'phone': phone,
+            'contracts': [],
+        } for partner in partners}
+        for partner_id, contract_id, role, agreement_no, ac_status, late_status, asset_reg_no, total_payable in rows:
+            if partner_id in result and contract_id in readable_contract_ids:
+                result[partner_id]['contracts'].append({
+                    'id': contract_id,
+                    'agreement_no': agreement_no,
+                    'role': role,
+                    'ac_status': ac_status,
+                    'late_status': late_status,
+                    'asset_reg_no': asset_reg_no,
+                    'total_payable': total_payable,
+                })
+        return list(result.values())
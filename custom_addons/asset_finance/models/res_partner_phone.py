@@ -1,10 +1,58 @@
+import re
+import time
+
 from odoo import models, fields, api
 
+from .job_run import finance_job, get_job_tracker
+
+try:
+    import phonenumbers
+except ImportError:  # optional: fall back to the simple rules below
+    phonenumbers = None
+
+
+def normalize_phone(number, country_code='65'):
+    """
+    E.164 form of ``number`` (e.g. '+6591234567'), or '' when it cannot be
+    a phone number. Numbers without an international prefix are taken as
+    local numbers of ``country_code``, and are left unnormalized when the
+    country code is not a number (e.g. a mistyped setting).
+    """
+    number = (number or '').strip()
+    if not number:
+        return ''
+    country_code = str(country_code or '').strip().lstrip('+')
+    if not country_code.isdigit():
+        country_code = ''
+    if phonenumbers:
+        # 'ZZ' (unknown region) only parses numbers with an international prefix
+        region = phonenumbers.region_code_for_country_code(int(country_code)) if country_code else 'ZZ'
+        try:
+            parsed = phonenumbers.parse(number, region)
+        except phonenumbers.NumberParseException:
+            return ''
+        if not phonenumbers.is_possible_number(parsed):
+            return ''
+        return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+
+    digits = re.sub(r'\D', '', number)
+    if number.startswith('+'):
+        pass
+    elif digits.startswith('00'):
+        digits = digits[2:]
+    elif not country_code:
+        return ''
+    else:
+        # Local number: drop the trunk prefix
+        digits = country_code + digits.lstrip('0')
+    return '+' + digits if 8 <= len(digits) <= 15 else ''
+
+
 class ResPartnerPhone(models.Model):
     _name = 'res.partner.phone'
     _description = 'Detailed Contact Number'
 
-    partner_id = fields.Many2one('res.partner', string="Partner", ondelete='cascade')
+    partner_id = fields.Many2one('res.partner', string="Partner", ondelete='cascade', index=True)
     
     # 1. The Number
     name = fields.Char(string="Number", required=True)
@@ -28,4 +76,57 @@ class ResPartnerPhone(models.Model):
     )
     
     # Optional: Verification
-    is_verified = fields.Boolean(string="Verified")
\ No newline at end of file
+    is_verified = fields.Boolean(string="Verified")
+
+    # Normalized copy of the number for reverse lookups (set on write, backfilled by cron)
+    phone_e164 = fields.Char(string="E.164 Number", readonly=True, index=True, copy=False)
+
+    @api.model
+    def _get_phone_country_code(self):
+        param = self.env['ir.config_parameter'].sudo().search([('key', '=', 'asset_finance.phone_country_code')], limit=1)
+        return param.value if param and param.value else '65'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        country_code = self._get_phone_country_code()
+        for vals in vals_list:
+            if 'name' in vals:
+                vals['phone_e164'] = normalize_phone(vals['name'], country_code)
+        return super().create(vals_list)
+
+    def write(self, vals):
+        if 'name' in vals:
+            vals = dict(vals, phone_e164=normalize_phone(vals['name'], self._get_phone_country_code()))
+        return super().write(vals)
+
+    @api.model
+    @finance_job('Phone Number Backfill')
+    def _cron_backfill_phone_e164(self, batch_size=5000, time_limit=600):
+        """
+        Normalize the numbers stored before phone_e164 existed, one chunk per
+        transaction. Unparsable numbers get '' so they are not picked up again.
+        """
+        tracker = get_job_tracker(self.env)
+        country_code = self._get_phone_country_code()
+        deadline = time.monotonic() + time_limit
+        for table, column in (('res_partner_phone', 'name'), ('res_partner', 'phone')):
+            while time.monotonic() < deadline:
+                self.env.cr.execute(f"""
+                    SELECT id, {column} FROM {table}
+                    WHERE phone_e164 IS NULL AND {column} IS NOT NULL
+                    ORDER BY id LIMIT %s
+                """, [batch_size])
+                rows = self.env.cr.fetchall()
+                if not rows:
+                    break
+                with tracker.chunk(f"{table} {rows[0][0]}-{rows[-1][0]}", rows=len(rows)):
+                    self.env.cr.execute(f"""
+                        UPDATE {table} t SET phone_e164 = v.phone_e164
+                        FROM unnest(%s::int[], %s::varchar[]) AS v(id, phone_e164)
+                        WHERE t.id = v.id
+                    """, [[row[0] for row in rows], [normalize_phone(row[1], country_code) for row in rows]])
+                tracker.add_scanned(len(rows))
+                tracker.add_written(len(rows))
+                self.env.cr.commit()
+        self.invalidate_model(['phone_e164'])
+        self.env['res.partner'].invalidate_model(['phone_e164'])
@@ -0,0 +1,144 @@
+from odoo import models, fields, api, _
+from odoo.exceptions import UserError
+
+from .job_run import finance_job, get_job_tracker
+
+
+class FinanceScreeningHit(models.Model):
+    _name = 'finance.screening.hit'
+    _description = 'Party Screening Hit'
+    _order = 'contract_id, hit_type, id'
+
+    contract_id = fields.Many2one('finance.contract', string="Contract", required=True, ondelete='cascade', index=True)
+    role = fields.Selection([
+        ('hirer', 'Hirer'),
+        ('guarantor', 'Guarantor'),
+        ('joint_hirer', 'Co-Borrower'),
+    ], string="Role", required=True)
+    partner_id = fields.Many2one('res.partner', string="Party", required=True, ondelete='cascade')
+    matched_partner_id = fields.Many2one('res.partner', string="Matched Partner", ondelete='cascade',
+        help="Other partner registered with the same NRIC / UEN")
+    hit_type = fields.Selection([
+        ('blacklist', 'Blacklisted'),
+        ('duplicate', 'Duplicate Identity'),
+    ], string="Hit", required=True)
+    blacklist_reason = fields.Char(string="Blacklist Reason")
+
+
+class FinanceContract(models.Model):
+    _inherit = 'finance.contract'
+
+    screening_state = fields.Selection([
+        ('clear', 'Clear'),
+        ('duplicate', 'Duplicate Identity'),
+        ('blacklist', 'Blacklisted'),
+    ], string="Screening", readonly=True, copy=False, index=True,
+        help="Result of the last blacklist / duplicate screening of the hirer, guarantors and co-borrowers")
+    screening_date = fields.Datetime(string="Screened On", readonly=True, copy=False)
+    screening_hit_ids = fields.One2many('finance.screening.hit', 'contract_id', string="Screening Hits", readonly=True)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        contracts = super().create(vals_list)
+        contracts._screen_parties()
+        return contracts
+
+    def action_approve(self):
+        self._screen_parties()
+        blacklisted = self.filtered(lambda c: c.screening_state == 'blacklist')
+        if blacklisted:
+            raise UserError(_(
+                "Cannot approve %(contracts)s: a party is blacklisted or shares its NRIC / UEN with a "
+                "blacklisted partner. See the Screening tab.",
+                contracts=', '.join(blacklisted.mapped('agreement_no')),
+            ))
+        return super().action_approve()
+
+    def action_screen_parties(self):
+        self._screen_parties()
+
+    def _screen_parties(self):
+        """
+        Check the hirer, guarantors and co-borrowers of the contracts in ``self``
+        against the blacklist and against other partners with the same identity
+        key, in one query over the indexed identity_key. Replaces the previous
+        hits and sets screening_state. Returns the number of hits.
+        """
+        if not self:
+            return 0
+        self.env.flush_all()
+        self.env.cr.execute("""
+            WITH parties AS (
+                SELECT c.id AS contract_id, 'hirer' AS role, c.hirer_id AS partner_id
+                FROM finance_contract c
+                WHERE c.id = ANY(%(ids)s) AND c.hirer_id IS NOT NULL
+                UNION
+                SELECT g.contract_id, 'guarantor', g.partner_id
+                FROM finance_contract_guarantor g
+                WHERE g.contract_id = ANY(%(ids)s)
+                UNION
+                SELECT j.contract_id, 'joint_hirer', j.partner_id
+                FROM finance_contract_joint_hirer j
+                WHERE j.contract_id = ANY(%(ids)s)
+            )
+            SELECT pa.contract_id, pa.role, pa.partner_id, NULL AS matched_id,
+                   'blacklist' AS hit_type, p.finance_blacklist_reason
+            FROM parties pa
+            JOIN res_partner p ON p.id = pa.partner_id
+            WHERE p.finance_blacklist
+            UNION ALL
+            SELECT pa.contract_id, pa.role, pa.partner_id, o.id,
+                   CASE WHEN o.finance_blacklist THEN 'blacklist' ELSE 'duplicate' END,
+                   o.finance_blacklist_reason
+            FROM parties pa
+            JOIN res_partner p ON p.id = pa.partner_id
+            JOIN res_partner o ON o.identity_key = p.identity_key AND o.id != p.id
+            WHERE p.identity_key IS NOT NULL
+              AND o.active
+              -- contacts of the same company share its UEN
+              AND COALESCE(o.commercial_partner_id, o.id) != COALESCE(p.commercial_partner_id, p.id)
+        """, {'ids': self.ids})
+        rows = self.env.cr.fetchall()
+
+        Hit = self.env['finance.screening.hit'].sudo()
+        Hit.search([('contract_id', 'in', self.ids)]).unlink()
+        Hit.create([{
+            'contract_id': contract_id,
+            'role': role,
+            'partner_id': partner_id,
+            'matched_partner_id': matched_id,
+            'hit_type': hit_type,
+            'blacklist_reason': reason,
+        } for contract_id, role, partner_id, matched_id, hit_type, reason in rows])
+
+        hit_types = {}
+        for contract_id, _role, _partner_id, _matched_id, hit_type, _reason in rows:
+            hit_types.setdefault(contract_id, set()).add(hit_type)
+        now = fields.Datetime.now()
+        for state in ('clear', 'duplicate', 'blacklist'):
+            contracts = self.filtered(lambda c: self._screening_state(hit_types.get(c.id, set())) == state)
+            if contracts:
+                contracts.write({'screening_state': state, 'screening_date': now})
+        return len(rows)
+
+    @api.model
+    def _screening_state(self, hit_types):
+        if 'blacklist' in hit_types:
+            return 'blacklist'
+        if 'duplicate' in hit_types:
+            return 'duplicate'
+        return 'clear'
+
+    @api.model
+    @finance_job('Rescreen Contract Parties')
+    def _cron_rescreen_contracts(self, batch_size=1000):
+        """Rescreen the parties of every draft and active contract, e.g. after blacklist updates"""
+        tracker = get_job_tracker(self.env)
+        contracts = self.search([('ac_status', 'in', ('draft', 'active'))], order='id')
+        tracker.add_scanned(len(contracts))
+        for i in range(0, len(contracts), batch_size):
+            batch = contracts[i:i + batch_size]
+            with tracker.chunk(f"Contracts {i + 1}-{i + len(batch)}", rows=len(batch)):
+                batch._screen_parties()
+                tracker.add_written(len(batch))
+            batch.invalidate_recordset()
@@ -0,0 +1,72 @@
+import { Component, onWillStart, useState } from '@odoo/owl';
+
+import { browser } from '@web/core/browser/browser';
+import { registry } from '@web/core/registry';
+import { useService } from '@web/core/utils/hooks';
+
+/**
+ * Finance dashboard client action.
+ *
+ * Each widget group is fetched from its own endpoint in parallel and
+ * rendered as soon as it arrives, so a slow aggregate only delays its
+ * own card. The endpoints send ETag/Cache-Control headers, so repeated
+ * visits are answered from the browser cache or with a 304.
+ */
+export class FinanceDashboard extends Component {
+    static template = 'asset_finance.FinanceDashboard';
+    static props = ['*'];
+    static WIDGETS = ['kpis', 'mtd', 'aging', 'trend'];
+
+    setup() {
+        this.orm = useService('orm');
+        this.action = useService('action');
+        this.state = useState({
+            kpis: null,
+            mtd: null,
+            aging: null,
+            trend: null,
+            errors: {},
+        });
+        onWillStart(() => {
+            // Fire all requests without awaiting them: the component renders
+            // its placeholders immediately and fills each card on arrival.
+            for (const widget of FinanceDashboard.WIDGETS) {
+                this.loadWidget(widget);
+            }
+        });
+    }
+
+    async loadWidget(widget) {
+        try {
+            const response = await browser.fetch(
+                `/asset_finance/dashboard/${widget}`,
+                { credentials: 'same-origin' }
+            );
+            if (!response.ok) {
+                throw new Error(response.statusText);
+            }
+            this.state[widget] = await response.json();
+        } catch (error) {
+            this.state.errors[widget] = error.message || String(error);
+        }
+    }
+
+    formatK(value) {
+        return `${((value || 0) / 1000).toFixed(0)}K`;
+    }
+
+    formatAmount(value) {
+        return (value || 0).toLocaleString();
+    }
+
+    currencySymbol(data) {
+        return data?.currency?.symbol || '';
+    }
+
+    async openAction(method) {
+        const action = await this.orm.call('finance.dashboard', method, [[1]]);
+        return this.action.doAction(action);
+    }
+}
+
+registry.category('actions').add('asset_finance.dashboard', FinanceDashboard);
@@ -14,6 +14,19 @@ Test Categories:
 - Payment: Payment allocation
 - Accounting: Journal entries
 - Integration: Module integration tests
+- Dashboard: Dashboard widget data
+- Job Run: Cron / batch run metrics
+- Job Queue: Background jobs
+- Dunning: Nightly dunning ladder
+- Collection Queue: Stored collector work queue
+- Quick Search: Unified contract, asset and partner lookup
+- Screening: Blacklist and duplicate identity screening
+- Phone Lookup: E.164 phone normalization and caller lookup
+- Live Refresh: Bus notifications for open auto refresh views
+- Contract Ledger: Append-only balance events and as-of-date lookups
+- Quotation: Record-free instant quotes
+- Effective Rate: Vectorized EIR / APR solver
+- Performance: Query budget benchmarks (tag asset_finance_benchmark)
 """
 
 from . import test_common
@@ -24,3 +37,16 @@ from . import test_collection_workflow
 from . import test_payment_allocation
 from . import test_accounting_entries
 from . import test_integration
+from . import test_dashboard
+from . import test_job_run
+from . import test_job_queue
+from . import test_dunning
+from . import test_collection_queue
+from . import test_quick_search
+from . import test_screening
+from . import test_phone_lookup
+from . import test_live_refresh
+from . import test_contract_ledger
+from . import test_quotation
+from . import test_effective_rate
+from . import test_performance
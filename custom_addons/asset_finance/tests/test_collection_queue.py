@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+Collection Queue Tests
+======================
+
+Tests for the stored collector work queue.
+"""
+
+from .test_common import AssetFinanceTestCommon
+from odoo.tests.common import tagged
+from odoo.exceptions import UserError
+from datetime import datetime, timedelta
+
+
+@tagged('post_install', '-at_install', 'asset_finance', 'collection_queue')
+class TestCollectionQueue(AssetFinanceTestCommon):
+    """Test queue refresh, scoring and collector assignment"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env['ir.config_parameter'].sudo().set_param('asset_finance.grace_period_days', 0)
+
+    def _create_overdue_contract(self, days, **kwargs):
+        contract = self._create_test_contract(
+            first_due_date=(datetime.now() - timedelta(days=days)).date(), **kwargs
+        )
+        contract.action_approve()
+        contract.action_generate_schedule()
+        contract._create_due_invoices()
+        return contract
+
+    def _queue_row(self, contract):
+        return self.env['finance.collection.queue'].search([('contract_id', '=', contract.id)])
+
+    def test_01_refresh_queues_overdue_contracts(self):
+        """Test the rebuild queues overdue contracts only, older debts first"""
+        recent = self._create_overdue_contract(10)
+        old = self._create_overdue_contract(70, asset_id=self.asset_2.id)
+
+        self.env['finance.collection.queue']._cron_rebuild_queue()
+
+        recent_row, old_row = self._queue_row(recent), self._queue_row(old)
+        self.assertEqual(recent_row.overdue_days, 10)
+        self.assertGreater(old_row.priority_score, recent_row.priority_score)
+        self.assertEqual(
+            self.env['finance.collection.queue'].search([('contract_id', 'in', (recent | old).ids)]),
+            old_row | recent_row,
+            "Queue should be ordered by priority"
+        )
+
+    def test_02_incremental_refresh_on_payment(self):
+        """Test posting a payment re-scores the contract before commit"""
+        contract = self._create_overdue_contract(40)
+        Queue = self.env['finance.collection.queue']
+        Queue._refresh(contract.ids)
+        self.assertFalse(self._queue_row(contract).last_payment_date)
+
+        payment = self.env['account.payment'].create({
+            'payment_type': 'inbound',
+            'partner_type': 'customer',
+            'partner_id': contract.hirer_id.id,
+            'amount': 100.0,
+            'date': datetime.now().date(),
+            'journal_id': self.bank_journal.id,
+            'contract_id': contract.id,
+        })
+        payment.action_post()
+        self.env.flush_all()
+        self.env.cr.precommit.run()
+
+        self.assertEqual(self._queue_row(contract).last_payment_date, datetime.now().date())
+
+    def test_03_collector_assignment(self):
+        """Test collectors can claim unassigned accounts but not reassign them"""
+        contract = self._create_overdue_contract(40)
+        self.env['finance.collection.queue']._refresh(contract.ids)
+        row = self._queue_row(contract).with_user(self.user_collection)
+
+        row.action_assign_to_me()
+        self.assertEqual(row.collector_id, self.user_collection)
+        with self.assertRaises(UserError):
+            row.write({'collector_id': self.user_manager.id})
+
+        self.env['finance.collection.queue']._refresh(contract.ids)
+        self.assertEqual(row.collector_id, self.user_collection, "Refresh keeps the assignment")
+
+    def test_04_incremental_refresh_on_overdue_change(self):
+        """Test a recomputed overdue status re-scores the contract before commit"""
+        contract = self._create_overdue_contract(40)
+        self.env['finance.collection.queue']._refresh(contract.ids)
+        self.assertEqual(self._queue_row(contract).overdue_days, 40)
+
+        first_line = contract.line_ids.sorted('sequence')[0]
+        first_line.date_due -= timedelta(days=10)
+        self.env.flush_all()
+        self.env.cr.precommit.run()
+
+        self.assertEqual(self._queue_row(contract).overdue_days, 50)
+
+    def test_05_grace_period(self):
+        """Test the queue counts overdue days after the grace period, like the contract and dunning"""
+        self.env['ir.config_parameter'].sudo().set_param('asset_finance.grace_period_days', 7)
+        within_grace = self._create_overdue_contract(5)
+        late = self._create_overdue_contract(10, asset_id=self.asset_2.id)
+
+        self.env['finance.collection.queue']._refresh((within_grace | late).ids)
+
+        self.assertFalse(self._queue_row(within_grace), "Contracts within the grace period are not queued")
+        self.assertEqual(self._queue_row(late).overdue_days, 3)
+        self.assertEqual(self._queue_row(late).overdue_days, late.total_overdue_days)
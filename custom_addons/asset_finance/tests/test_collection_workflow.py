@@ -8,6 +8,7 @@ Tests for collection management, penalties, and workflow.
 
 from .test_common import AssetFinanceTestCommon
 from odoo.tests.common import tagged
+from odoo.tools import format_date
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 
@@ -341,3 +342,65 @@ class TestCollectionWorkflow(AssetFinanceTestCommon):
             'normal',
             "Late status should be normal for fully paid"
         )
+
+    def test_17_bulk_notice_queues_mails(self):
+        """Test bulk reminders queue one mail per contract without sending them"""
+        contracts = self.env['finance.contract']
+        for asset in (self.asset_1, self.asset_2):
+            contract = self._create_test_contract(asset_id=asset.id)
+            contract.action_approve()
+            contracts |= contract
+
+        contracts.action_batch_send_reminders()
+
+        mails = self.env['mail.mail'].search([('model', '=', 'finance.contract'), ('res_id', 'in', contracts.ids)])
+        self.assertEqual(len(mails), 2, "One mail per contract should be queued")
+        self.assertEqual(set(mails.mapped('state')), {'outgoing'}, "Mails should wait in the mail queue")
+        self.assertEqual(set(contracts.mapped('date_reminder_sent')), {datetime.now().date()})
+
+    def test_18_pre_due_reminders(self):
+        """Test the pre-due cron reminds installments due in N days exactly once"""
+        Param = self.env['ir.config_parameter'].sudo()
+        Param.set_param('asset_finance.auto_send_reminders', 'True')
+        Param.set_param('asset_finance.reminder_days_before', 3)
+        due_date = datetime.now().date() + timedelta(days=3)
+
+        contract = self._create_test_contract(first_due_date=due_date)
+        contract.action_approve()
+        contract.action_generate_schedule()
+        other = self._create_test_contract(asset_id=self.asset_2.id, first_due_date=due_date + timedelta(days=1))
+        other.action_approve()
+        other.action_generate_schedule()
+
+        self.env['finance.contract']._cron_send_pre_due_reminders()
+
+        first_line = contract.line_ids.sorted('sequence')[0]
+        self.assertEqual(first_line.reminder_sent_date, datetime.now().date())
+        self.assertEqual(contract.next_inst_date, due_date)
+        self.assertFalse(other.date_reminder_sent, "Installments not due in 3 days are not reminded")
+
+        mail_domain = [('model', '=', 'finance.contract'), ('res_id', '=', contract.id)]
+        mail_count = self.env['mail.mail'].search_count(mail_domain)
+        self.env['finance.contract']._cron_send_pre_due_reminders()
+        self.assertEqual(self.env['mail.mail'].search_count(mail_domain), mail_count,
+                         "Already reminded lines are skipped")
+
+    def test_19_reminder_shows_new_due_date(self):
+        """Test the queued reminder renders the due date written by the cron"""
+        Param = self.env['ir.config_parameter'].sudo()
+        Param.set_param('asset_finance.auto_send_reminders', 'True')
+        Param.set_param('asset_finance.reminder_days_before', 3)
+        due_date = datetime.now().date() + timedelta(days=3)
+
+        contract = self._create_test_contract(first_due_date=due_date)
+        contract.action_approve()
+        contract.action_generate_schedule()
+        contract.next_inst_date = False
+
+        self.env['finance.contract']._cron_send_pre_due_reminders()
+
+        mail = self.env['mail.mail'].search([('model', '=', 'finance.contract'), ('res_id', '=', contract.id)])
+        self.assertEqual(len(mail), 1)
+        self.assertIn(format_date(self.env, due_date, lang_code=contract.hirer_id.lang), mail.body_html,
+                      "The reminder should show the due date written before the render")
+        self.assertIn(contract.agreement_no, mail.subject)
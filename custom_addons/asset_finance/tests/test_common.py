@@ -6,11 +6,15 @@ Common Test Setup and Utilities
 Base test class with common setup for all Asset Finance tests.
 """
 
+from contextlib import nullcontext
+
 from odoo.tests.common import TransactionCase, tagged
 from odoo.exceptions import UserError, ValidationError, AccessError
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 
+from ..models.job_run import JobRunTracker
+
 
 @tagged('post_install', '-at_install', 'asset_finance')
 class AssetFinanceTestCommon(TransactionCase):
@@ -25,6 +29,11 @@ class AssetFinanceTestCommon(TransactionCase):
         """Set up common test data"""
         super().setUpClass()
 
+        # Tests run in one transaction: batch commits of the crons are no-ops
+        # and job run records are written in the test transaction
+        cls.classPatch(cls.cr, 'commit', lambda: None)
+        cls.classPatch(JobRunTracker, '_run_cursor', lambda tracker: nullcontext(tracker.env.cr))
+
         # Get company and currency
         cls.company = cls.env.company
         cls.currency = cls.company.currency_id
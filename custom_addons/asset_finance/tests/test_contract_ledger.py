@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+Contract Ledger Tests
+=====================
+
+Tests for the append-only contract ledger and its running balances.
+"""
+
+from .test_common import AssetFinanceTestCommon
+from odoo.tests.common import tagged
+from odoo.exceptions import UserError
+from datetime import datetime, timedelta
+
+
+@tagged('post_install', '-at_install', 'asset_finance', 'ledger')
+class TestContractLedger(AssetFinanceTestCommon):
+    """Test ledger events, running balances and as-of-date lookups"""
+
+    def _post(self, contract, days_ago, event_type, **amounts):
+        return contract._post_ledger_entries([dict(
+            contract_id=contract.id,
+            date=(datetime.now() - timedelta(days=days_ago)).date(),
+            event_type=event_type,
+            **amounts,
+        )])
+
+    def test_01_running_balances(self):
+        """Test each entry carries the running balances of its contract"""
+        contract = self._create_test_contract()
+        other = self._create_test_contract(asset_id=self.asset_2.id)
+        self._post(contract, 30, 'disbursement', outstanding_amount=1000.0)
+        self._post(other, 30, 'disbursement', outstanding_amount=500.0)
+        self._post(contract, 20, 'installment', arrears_amount=100.0)
+        entry = self._post(contract, 10, 'allocation', outstanding_amount=-100.0, arrears_amount=-100.0)
+
+        self.assertMoneyEqual(entry.outstanding_balance, 900.0)
+        self.assertMoneyEqual(entry.arrears_balance, 0.0)
+        self.assertMoneyEqual(
+            other.ledger_ids.outstanding_balance, 500.0,
+            "Balances should not leak between contracts"
+        )
+
+    def test_02_back_dated_entry_shifts_later_balances(self):
+        """Test a back-dated entry is included in the balances of later entries"""
+        contract = self._create_test_contract()
+        self._post(contract, 30, 'disbursement', outstanding_amount=1000.0)
+        last = self._post(contract, 5, 'fee', fee_amount=10.0)
+        self._post(contract, 15, 'penalty', penalty_amount=25.0)
+
+        self.assertMoneyEqual(last.penalty_balance, 25.0)
+        self.assertMoneyEqual(last.fee_balance, 10.0)
+        self.assertMoneyEqual(last.outstanding_balance, 1000.0)
+
+    def test_03_balances_as_of_date(self):
+        """Test balances can be read as of any date"""
+        contract = self._create_test_contract()
+        empty = self._create_test_contract(asset_id=self.asset_2.id)
+        self._post(contract, 30, 'disbursement', outstanding_amount=1000.0)
+        self._post(contract, 10, 'penalty', penalty_amount=25.0)
+
+        balances = (contract | empty)._get_ledger_balances((datetime.now() - timedelta(days=20)).date())
+        self.assertMoneyEqual(balances[contract.id]['outstanding'], 1000.0)
+        self.assertMoneyEqual(balances[contract.id]['penalty'], 0.0)
+        self.assertMoneyEqual(balances[empty.id]['outstanding'], 0.0)
+
+        balances = contract._get_ledger_balances()
+        self.assertMoneyEqual(balances[contract.id]['penalty'], 25.0)
+
+    def test_04_entries_are_append_only(self):
+        """Test ledger entries cannot be changed or deleted"""
+        contract = self._create_test_contract()
+        entry = self._post(contract, 0, 'fee', fee_amount=10.0)
+
+        with self.assertRaises(UserError):
+            entry.write({'fee_amount': 20.0})
+        with self.assertRaises(UserError):
+            entry.unlink()
+
+    def test_05_disbursement_and_settlement_events(self):
+        """Test disbursement opens the outstanding balance and settlement clears the ledger"""
+        contract = self._create_test_contract(first_due_date=datetime.now().date())
+        contract.action_approve()
+        contract.action_generate_schedule()
+        contract.create_disbursement_entry(
+            disbursement_date=datetime.now().date(),
+            payment_method_id=self.bank_journal.id
+        )
+        self.assertMoneyEqual(contract._get_ledger_balances()[contract.id]['outstanding'], contract.balance_hire)
+
+        contract.process_early_settlement(
+            settlement_date=datetime.now().date(),
+            payment_journal_id=self.bank_journal.id
+        )
+
+        self.assertEqual(contract.ledger_ids[-1].event_type, 'settlement')
+        for component, balance in contract._get_ledger_balances()[contract.id].items():
+            self.assertMoneyEqual(balance, 0.0, f"{component} should be cleared by the settlement")
+
+    def test_06_payment_allocation_event(self):
+        """Test a posted contract payment reduces the penalty balance in the ledger"""
+        contract = self._create_test_contract(first_due_date=datetime.now().date())
+        contract.action_approve()
+        contract.action_generate_schedule()
+        self._post(contract, 1, 'penalty', penalty_amount=300.0)
+        self.assertMoneyEqual(contract.balance_late_charges, 300.0)
+
+        payment = self.env['account.payment'].create({
+            'payment_type': 'inbound',
+            'partner_type': 'customer',
+            'partner_id': contract.hirer_id.id,
+            'amount': 200.0,
+            'date': datetime.now().date(),
+            'journal_id': self.bank_journal.id,
+            'contract_id': contract.id,
+        })
+        payment.action_post()
+
+        entry = contract.ledger_ids.filtered(lambda l: l.event_type == 'allocation')
+        self.assertEqual(entry.payment_id, payment)
+        self.assertMoneyEqual(entry.penalty_balance, 100.0)
+        self.assertMoneyEqual(contract.balance_late_charges, 100.0)
+
+    def test_07_late_charges_and_fees_follow_the_ledger(self):
+        """Test late charges and misc fees are derived from the ledger and direct changes are adjustments"""
+        contract = self._create_test_contract()
+        self._post(contract, 10, 'penalty', penalty_amount=40.0)
+        self._post(contract, 5, 'fee', fee_amount=15.0)
+        self.assertMoneyEqual(contract.balance_late_charges, 40.0)
+        self.assertMoneyEqual(contract.balance_misc_fee, 15.0)
+        self.assertMoneyEqual(contract.total_payable, contract.os_balance + 55.0)
+
+        contract.write({'balance_late_charges': 25.0, 'balance_misc_fee': 15.0})
+
+        adjustment = contract.ledger_ids.filtered(lambda l: l.event_type == 'adjustment')
+        self.assertMoneyEqual(adjustment.penalty_amount, -15.0)
+        self.assertMoneyEqual(adjustment.fee_amount, 0.0)
+        self.assertMoneyEqual(contract.balance_late_charges, 25.0)
+        self.assertMoneyEqual(contract._get_ledger_balances()[contract.id]['penalty'], 25.0)
+
+    def test_08_future_entries_do_not_count_yet(self):
+        """Test the derived fields follow the balances as of today, like direct changes do"""
+        contract = self._create_test_contract()
+        self._post(contract, 5, 'fee', fee_amount=15.0)
+        self._post(contract, -3, 'fee', fee_amount=10.0)
+        self.assertMoneyEqual(contract.balance_misc_fee, 15.0, "A fee dated in three days is not owed yet")
+
+        contract.write({'balance_misc_fee': 20.0})
+        adjustment = contract.ledger_ids.filtered(lambda l: l.event_type == 'adjustment')
+        self.assertMoneyEqual(adjustment.fee_amount, 5.0)
+        self.assertMoneyEqual(contract.balance_misc_fee, 20.0)
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Dashboard Tests
+===============
+
+Tests for the per-widget dashboard data used by the JSON endpoints.
+"""
+
+from .test_common import AssetFinanceTestCommon
+from odoo.tests.common import tagged
+from odoo.exceptions import UserError
+from datetime import datetime
+
+
+@tagged('post_install', '-at_install', 'asset_finance', 'dashboard')
+class TestDashboard(AssetFinanceTestCommon):
+    """Test dashboard widget data"""
+
+    def test_01_widget_groups_return_expected_keys(self):
+        """Test each widget group returns its own values"""
+        Dashboard = self.env['finance.dashboard']
+        expected = {
+            'kpis': {'total_active_contracts', 'total_portfolio_value', 'total_overdue',
+                     'overdue_percentage', 'total_penalties'},
+            'mtd': {'total_disbursed_mtd', 'total_collected_mtd'},
+            'aging': {'current_amount', 'overdue_1_30', 'overdue_31_60',
+                      'overdue_61_90', 'overdue_90_plus'},
+            'trend': {'monthly_trend'},
+        }
+        for widget, keys in expected.items():
+            data = Dashboard.get_widget_data(widget)
+            self.assertTrue(keys <= set(data), f"Widget {widget} is missing keys")
+            self.assertIn('currency', data)
+
+    def test_02_unknown_widget(self):
+        """Test unknown widget names are rejected"""
+        with self.assertRaises(UserError):
+            self.env['finance.dashboard'].get_widget_data('unknown')
+
+    def test_03_kpis_match_computed_fields(self):
+        """Test widget data and the record computes stay consistent"""
+        contract = self._create_test_contract(first_due_date=datetime.now().date())
+        contract.action_generate_schedule()
+        contract.action_approve()
+
+        data = self.env['finance.dashboard'].get_widget_data('kpis')
+        dashboard = self.env['finance.dashboard'].browse(1)
+
+        self.assertEqual(dashboard.total_active_contracts, data['total_active_contracts'])
+        self.assertMoneyEqual(dashboard.total_portfolio_value, data['total_portfolio_value'])
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Dunning Ladder Tests
+====================
+
+Tests for the nightly set-based dunning run.
+"""
+
+from .test_common import AssetFinanceTestCommon
+from odoo.tests.common import tagged
+from odoo.tools import format_amount
+from datetime import datetime, timedelta
+
+
+@tagged('post_install', '-at_install', 'asset_finance', 'dunning')
+class TestDunning(AssetFinanceTestCommon):
+    """Test the dunning ladder steps, fees and exceptions"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env['ir.config_parameter'].sudo().set_param('asset_finance.grace_period_days', 0)
+        cls.env['finance.dunning.step'].search([]).write({'active': False})
+        Step = cls.env['finance.dunning.step']
+        cls.step_reminder = Step.create({
+            'name': 'Test Reminder',
+            'sequence': 1,
+            'min_overdue_days': 1,
+            'template_id': cls.env.ref('asset_finance.email_template_payment_reminder').id,
+            'fee_field': 'reminder_fee',
+            'fee_amount': 10.0,
+            'notice_date_field': 'date_reminder_sent',
+        })
+        cls.step_legal = Step.create({
+            'name': 'Test 4th Schedule',
+            'sequence': 2,
+            'min_overdue_days': 60,
+            'template_id': cls.env.ref('asset_finance.email_template_4th_schedule').id,
+            'fee_field': 'schedule_4_fee',
+            'fee_amount': 50.0,
+            'set_late_status': 'legal',
+        })
+
+    def _create_overdue_contract(self, days, **kwargs):
+        contract = self._create_test_contract(
+            first_due_date=(datetime.now() - timedelta(days=days)).date(), **kwargs
+        )
+        contract.action_approve()
+        contract.action_generate_schedule()
+        return contract
+
+    def test_01_contracts_climb_one_step_per_run(self):
+        """Test each overdue contract moves to the next step only, and further on the next run"""
+        recent = self._create_overdue_contract(10)
+        old = self._create_overdue_contract(70, asset_id=self.asset_2.id)
+
+        self.env['finance.contract']._cron_run_dunning()
+
+        self.assertEqual(recent.dunning_step_id, self.step_reminder)
+        self.assertEqual(recent.date_reminder_sent, datetime.now().date())
+        self.assertEqual(recent.reminder_fee, 10.0)
+        self.assertEqual(old.dunning_step_id, self.step_reminder, "No step is skipped")
+        self.assertEqual(old.schedule_4_fee, 0.0)
+
+        self.env['finance.contract']._cron_run_dunning()
+
+        self.assertEqual(recent.dunning_step_id, self.step_reminder)
+        self.assertEqual(old.dunning_step_id, self.step_legal)
+        self.assertEqual(old.late_status, 'legal')
+        self.assertEqual(old.schedule_4_fee, 50.0)
+        self.assertEqual(len(old.dunning_log_ids), 2)
+
+    def test_02_step_applied_once(self):
+        """Test a second run does not resend the notice or charge the fee again"""
+        contract = self._create_overdue_contract(10)
+        self.env['finance.contract']._cron_run_dunning()
+        self.env['finance.contract']._cron_run_dunning()
+
+        self.assertEqual(contract.reminder_fee, 10.0)
+        self.assertEqual(len(contract.dunning_log_ids), 1)
+
+    def test_03_missing_email_is_exception(self):
+        """Test contracts without hirer e-mail are flagged for a collector"""
+        contract = self._create_overdue_contract(10)
+        contract.hirer_id.email = False
+
+        self.env['finance.contract']._cron_run_dunning()
+
+        self.assertTrue(contract.dunning_exception)
+        self.assertEqual(contract.reminder_fee, 0.0, "No fee without a notice")
+        self.assertEqual(contract.dunning_log_ids.state, 'exception')
+
+        contract.action_resolve_dunning_exception()
+        self.assertFalse(contract.dunning_exception)
+
+    def test_04_notice_shows_step_fee(self):
+        """Test the notice is rendered after the step fee is charged"""
+        contract = self._create_overdue_contract(70)
+
+        self.env['finance.contract']._cron_run_dunning()
+        self.env['finance.contract']._cron_run_dunning()
+
+        mail = self.env['mail.mail'].search([
+            ('model', '=', 'finance.contract'), ('res_id', '=', contract.id), ('subject', 'ilike', '4th schedule'),
+        ])
+        self.assertEqual(len(mail), 1)
+        self.assertEqual(contract.balance_misc_fee, 60.0)
+        self.assertIn(format_amount(self.env, contract.total_payable, contract.currency_id), mail.body_html,
+                      "The notice should include the fee of its own step")
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Effective Rate Tests
+====================
+
+Tests for the EIR / APR solver and its stored contract values.
+"""
+
+from .test_common import AssetFinanceTestCommon
+from odoo.tests.common import tagged
+
+from ..models.contract_eir import solve_monthly_rates, _solve_monthly_rate, annual_rates
+
+
+@tagged('post_install', '-at_install', 'asset_finance', 'effective_rate')
+class TestEffectiveRate(AssetFinanceTestCommon):
+    """Test effective rates are solved for many contracts at once"""
+
+    def _annuity(self, principal, rate, months):
+        return principal * rate / (1 - (1 + rate) ** -months)
+
+    def test_01_solver_recovers_known_rates(self):
+        """Test the solver finds the rate of exact annuities, in arrears and in advance"""
+        pay = self._annuity(1000.0, 0.015, 24)
+        arrears, advance, zero, empty = solve_monthly_rates(
+            [1000.0, 1000.0, 1200.0, 0.0],
+            [pay, pay / 1.015, 100.0, 0.0],
+            [pay, pay / 1.015, 100.0, 0.0],
+            [pay, pay / 1.015, 100.0, 0.0],
+            [24, 24, 12, 0],
+            [False, True, False, False],
+        )
+        self.assertAlmostEqual(arrears, 0.015, places=8)
+        self.assertAlmostEqual(advance, 0.015, places=8)
+        self.assertAlmostEqual(zero, 0.0, places=8)
+        self.assertEqual(empty, 0.0, "Contracts without cash flows should not be solved")
+
+        eir, apr = annual_rates([0.01])[0]
+        self.assertAlmostEqual(eir, 12.6825, places=4)
+        self.assertAlmostEqual(apr, 12.0, places=4)
+
+    def test_02_vectorized_matches_scalar(self):
+        """Test the batch solve agrees with the per-contract fallback"""
+        scenarios = [
+            (40000.0, 835.0, 835.0, 812.0, 60, False),
+            (40000.0, 835.0, 835.0, 812.0, 60, True),
+            (15000.0, 1300.0, 1300.0, 1400.0, 12, False),
+            (5000.0, 0.0, 0.0, 5300.0, 1, False),
+            # repaid six times over in three months: the root is above MAX_RATE
+            (1000.0, 2000.0, 2000.0, 2000.0, 3, False),
+        ]
+        rates = solve_monthly_rates(*zip(*scenarios))
+        for rate, scenario in zip(rates, scenarios):
+            self.assertAlmostEqual(rate, _solve_monthly_rate(*scenario), places=9)
+        self.assertEqual(rates[-1], 0.0, "A rate outside the bracket is not reported as its edge")
+
+    def test_03_contract_rates_stored(self):
+        """Test a flat rate contract shows a higher effective rate and batch recompute agrees"""
+        contract = self._create_test_contract()
+        self.assertGreater(contract.eir_rate, contract.int_rate_pa, "A flat rate understates the effective rate")
+        self.assertGreater(contract.eir_rate, contract.apr_rate)
+
+        eir_rate, apr_rate = contract.eir_rate, contract.apr_rate
+        self.env['finance.contract']._recompute_effective_rates()
+        self.assertAlmostEqual(contract.eir_rate, eir_rate, places=4)
+        self.assertAlmostEqual(contract.apr_rate, apr_rate, places=4)
+
+        contract.admin_fee = 500.0
+        self.assertGreater(contract.eir_rate, eir_rate, "Fees raise the effective rate")
@@ -366,3 +366,18 @@ class TestIntegration(AssetFinanceTestCommon):
         # Approve contract with guarantor/co-borrower
         contract.action_approve()
         self.assertEqual(contract.ac_status, 'active')
+
+    def test_14_fleet_changes_synced_to_contracts(self):
+        """Test vehicle and brand edits reach contracts, inline or through the job queue"""
+        contract = self._create_test_contract()
+
+        self.vehicle_1.license_plate = 'TEST9999Z'
+        self.assertEqual(contract.asset_reg_no, 'TEST9999Z')
+
+        # Large selections are deferred to the background job queue
+        self.env['ir.config_parameter'].sudo().set_param('asset_finance.job_queue_threshold', 0)
+        self.vehicle_1.model_id.brand_id.name = 'Renamed Brand'
+        self.assertTrue(self.env['finance.job'].search([('method_name', '=', '_sync_finance_assets')]))
+
+        self.env['finance.job']._cron_run_jobs()
+        self.assertEqual(contract.asset_make, 'Renamed Brand')
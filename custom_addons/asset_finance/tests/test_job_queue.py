@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Background Job Tests
+====================
+
+Tests for the finance.job queue: chunking, running, retries and the
+actions that hand large selections to the queue.
+"""
+
+from .test_common import AssetFinanceTestCommon
+from odoo.tests.common import tagged
+
+
+@tagged('post_install', '-at_install', 'asset_finance', 'job_queue')
+class TestJobQueue(AssetFinanceTestCommon):
+    """Test finance.job queue"""
+
+    def setUp(self):
+        super().setUp()
+        Param = self.env['ir.config_parameter'].sudo()
+        Param.set_param('asset_finance.job_queue_threshold', 1)
+        Param.set_param('asset_finance.job_chunk_size', 1)
+
+    def _create_contracts(self, count=2):
+        contracts = self.env['finance.contract']
+        for i in range(count):
+            contract = self._create_test_contract(asset_id=(self.asset_1 if i % 2 else self.asset_2).id)
+            contract.action_approve()
+            contracts |= contract
+        return contracts
+
+    def test_01_large_selection_is_queued(self):
+        """Test batch reminders above the threshold are split into chunked jobs"""
+        contracts = self._create_contracts(3)
+
+        result = contracts.action_batch_send_reminders()
+
+        self.assertEqual(result['params']['title'], 'Queued in Background')
+        jobs = self.env['finance.job'].search([('method_name', '=', '_batch_send_reminders')])
+        self.assertEqual(len(jobs), 3, "One job per chunk of one record")
+        self.assertEqual(len(set(jobs.mapped('batch_uuid'))), 1, "Jobs share one batch")
+        self.assertEqual(set(jobs.mapped('state')), {'pending'})
+        self.assertEqual(jobs.user_id, self.env.user)
+
+        self.env['finance.job']._cron_run_jobs()
+
+        self.assertEqual(set(jobs.mapped('state')), {'done'})
+        self.assertEqual(jobs[0].batch_progress, 100.0)
+
+    def test_02_small_selection_runs_inline(self):
+        """Test selections at or below the threshold do not create jobs"""
+        contract = self._create_contracts(1)
+
+        result = contract.action_batch_send_reminders()
+
+        self.assertEqual(result['params']['title'], 'Batch Reminder Complete')
+        self.assertFalse(self.env['finance.job'].search([]))
+
+    def test_03_failed_job_is_retried_with_backoff(self):
+        """Test a failing job goes back to pending with a delay, then fails for good"""
+        contracts = self._create_contracts(2)
+        # action_generate_schedule requires a single record, so a 2-record chunk fails
+        job = self.env['finance.job']._enqueue(contracts, 'action_generate_schedule', 'Failing Job', chunk_size=2)
+
+        self.env['finance.job']._cron_run_jobs()
+
+        self.assertEqual(job.state, 'pending')
+        self.assertEqual(job.attempts, 1)
+        self.assertTrue(job.date_eta, "Retry should be delayed")
+        self.assertTrue(job.error_message)
+
+        job.write({'max_attempts': 2, 'date_eta': False})
+        self.env['finance.job']._cron_run_jobs()
+
+        self.assertEqual(job.state, 'failed')
+        self.assertEqual(job.attempts, 2)
+
+    def test_04_schedule_regeneration_is_queued(self):
+        """Test mass edits of schedule fields regenerate schedules in the background"""
+        contracts = self._create_contracts(2)
+        for contract in contracts:
+            contract.action_generate_schedule()
+
+        contracts.write({'int_rate_pa': 6.0})
+
+        jobs = self.env['finance.job'].search([('method_name', '=', '_regenerate_schedules')])
+        self.assertEqual(len(jobs), 2)
+
+        self.env['finance.job']._cron_run_jobs()
+
+        self.assertEqual(set(jobs.mapped('state')), {'done'})
+        for contract in contracts:
+            self.assertTrue(contract.line_ids)
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Job Run Tests
+=============
+
+Tests for the run metrics recorded by instrumented crons, batch actions
+and wizards.
+"""
+
+from .test_common import AssetFinanceTestCommon
+from ..models.job_run import finance_job, get_job_tracker
+from odoo.tests.common import tagged
+from odoo.exceptions import UserError
+from datetime import datetime
+from dateutil.relativedelta import relativedelta
+
+
+@tagged('post_install', '-at_install', 'asset_finance', 'job_run')
+class TestJobRun(AssetFinanceTestCommon):
+    """Test finance.job.run recording"""
+
+    def _last_run(self, method):
+        return self.env['finance.job.run'].search([('method', '=', method)], limit=1)
+
+    def test_01_cron_records_run(self):
+        """Test the late interest cron records a finished run"""
+        contract = self._create_test_contract(
+            first_due_date=datetime.now().date() - relativedelta(months=2),
+            penalty_rule_id=self.penalty_rule_daily.id
+        )
+        contract.action_generate_schedule()
+        contract.action_approve()
+
+        self.env['finance.contract']._cron_calculate_late_interest()
+
+        run = self._last_run('finance.contract._cron_calculate_late_interest')
+        self.assertTrue(run, "Cron should record a job run")
+        self.assertEqual(run.state, 'done')
+        self.assertEqual(run.job_type, 'cron')
+        self.assertGreaterEqual(run.rows_scanned, 1)
+        self.assertTrue(run.date_end)
+        self.assertGreaterEqual(run.chunk_count, 1)
+        self.assertEqual(sum(run.chunk_ids.mapped('rows')), run.rows_scanned)
+
+    def test_02_failed_run(self):
+        """Test a failing job is recorded with its error and still raises"""
+        Contract = self.env['finance.contract']
+
+        @finance_job('Failing Job', job_type='batch')
+        def failing_job(records):
+            get_job_tracker(records.env).add_scanned(3)
+            raise UserError("Boom")
+
+        with self.assertRaises(UserError):
+            failing_job(Contract)
+
+        run = self._last_run('finance.contract.failing_job')
+        self.assertEqual(run.state, 'failed')
+        self.assertEqual(run.rows_scanned, 3)
+        self.assertIn('Boom', run.error_message)
+
+    def test_03_nested_runs_fold(self):
+        """Test nested instrumented calls are recorded as one run"""
+        Contract = self.env['finance.contract']
+
+        @finance_job('Inner Job')
+        def inner_job(records):
+            get_job_tracker(records.env).add_written(1)
+
+        @finance_job('Outer Job')
+        def outer_job(records):
+            inner_job(records)
+            inner_job(records)
+
+        outer_job(Contract)
+
+        self.assertFalse(self._last_run('finance.contract.inner_job'))
+        self.assertEqual(self._last_run('finance.contract.outer_job').records_written, 2)
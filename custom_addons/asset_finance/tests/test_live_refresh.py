@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+Live Refresh Tests
+==================
+
+Tests for the bus notifications that reload open auto refresh views.
+"""
+
+import json
+
+from .test_common import AssetFinanceTestCommon
+from ..models.job_run import JobRunTracker
+from odoo.tests.common import tagged
+from datetime import datetime, timedelta
+
+
+@tagged('post_install', '-at_install', 'asset_finance', 'live_refresh')
+class TestLiveRefresh(AssetFinanceTestCommon):
+    """Test finance write paths publish one invalidation per transaction"""
+
+    def _refresh_notifications(self):
+        self.env.flush_all()
+        self.env.cr.precommit.run()
+        messages = self.env['bus.bus'].sudo().search([('channel', 'like', '"muk_web_refresh"')])
+        return [json.loads(message.message) for message in messages]
+
+    def test_01_status_change_notifies_contract_views(self):
+        """Test a contract status change is published, other writes are not"""
+        contract = self._create_test_contract()
+        self._refresh_notifications()
+        self.env['bus.bus'].sudo().search([]).unlink()
+
+        contract.write({'bank_acct': '123-456-789'})
+        self.assertFalse(self._refresh_notifications())
+
+        contract.action_approve()
+        notifications = self._refresh_notifications()
+        self.assertEqual(len(notifications), 1)
+        self.assertEqual(notifications[0]['type'], 'muk_web_refresh/updated')
+        self.assertIn('finance.contract', notifications[0]['payload']['models'])
+
+    def test_02_payment_notifies_queue_once(self):
+        """Test posting a payment publishes the contract, payment and queue models together"""
+        contract = self._create_test_contract(first_due_date=(datetime.now() - timedelta(days=40)).date())
+        contract.action_approve()
+        contract.action_generate_schedule()
+        contract._create_due_invoices()
+        self.env['finance.collection.queue']._refresh(contract.ids)
+        self._refresh_notifications()
+        self.env['bus.bus'].sudo().search([]).unlink()
+
+        payment = self.env['account.payment'].create({
+            'payment_type': 'inbound',
+            'partner_type': 'customer',
+            'partner_id': contract.hirer_id.id,
+            'amount': 100.0,
+            'date': datetime.now().date(),
+            'journal_id': self.bank_journal.id,
+            'contract_id': contract.id,
+        })
+        payment.action_post()
+
+        models = set()
+        for notification in self._refresh_notifications():
+            models.update(notification['payload']['models'])
+        self.assertTrue({'finance.contract', 'account.payment', 'finance.collection.queue'} <= models)
+
+    def test_03_report_token_follows_source_rows(self):
+        """Test report views get their change token from the contracts they show, not from the view"""
+        Report = self.env['finance.report.collection']
+        contract = self._create_test_contract()
+        contract.action_approve()
+        draft = self._create_test_contract(asset_id=self.asset_2.id)
+        token = Report.muk_web_refresh_token([])
+        self.assertEqual(len(token.split(':')), 2, "Count and write_date of the source contracts")
+
+        self.env.cr.execute("UPDATE finance_contract SET write_date = write_date + interval '1 minute' WHERE id = %s",
+                            [draft.id])
+        self.assertEqual(Report.muk_web_refresh_token([]), token, "Contracts outside the report do not move it")
+        self.env.cr.execute("UPDATE finance_contract SET write_date = write_date + interval '1 minute' WHERE id = %s",
+                            [contract.id])
+        self.assertNotEqual(Report.muk_web_refresh_token([]), token)
+        self.assertIsNone(self.env['finance.report.disbursement'].muk_web_refresh_token([]),
+                          "Views without source models have no token")
+
+    def test_04_contract_change_notifies_reports(self):
+        """Test contract changes reload the report views built on them, recomputes included"""
+        contract = self._create_test_contract(first_due_date=(datetime.now() - timedelta(days=40)).date())
+        contract.action_approve()
+        contract.action_generate_schedule()
+        self._refresh_notifications()
+        self.env['bus.bus'].sudo().search([]).unlink()
+
+        # recomputes the stored overdue status, which write() never sees
+        contract._create_due_invoices()
+
+        models = set()
+        for notification in self._refresh_notifications():
+            models.update(notification['payload']['models'])
+        self.assertTrue({'finance.contract', 'finance.report.collection', 'finance.report.aging',
+                         'finance.report.portfolio'} <= models)
+
+    def test_05_cron_writes_do_not_notify(self):
+        """Test contract changes made by a cron run leave the reload to the change token"""
+        contract = self._create_test_contract()
+        self._refresh_notifications()
+        self.env['bus.bus'].sudo().search([]).unlink()
+
+        tracker = JobRunTracker(self.env, 'Test Cron', 'cron', 'finance.contract.test')
+        cron_contract = contract.with_context(finance_job_run=tracker)
+        cron_contract.action_approve()
+        self.assertFalse(self._refresh_notifications())
+        self.assertEqual(contract.ac_status, 'active')
@@ -370,3 +370,34 @@ class TestPaymentAllocation(AssetFinanceTestCommon):
             0,
             "Outbound payment should not create allocations"
         )
+
+    def test_11_stored_balances_follow_penalties(self):
+        """Test stored balances are recomputed and sortable in SQL"""
+        small = self._create_test_contract()
+        large = self._create_test_contract(cash_price=90000.0, asset_id=self.asset_2.id)
+        (small | large).action_approve()
+
+        small.balance_late_charges = 300.0
+        self.assertMoneyEqual(small.total_payable, small.os_balance + 300.0)
+
+        Contract = self.env['finance.contract']
+        self.assertEqual(
+            Contract.search([('id', 'in', (small | large).ids)], order='os_balance desc'),
+            large | small,
+            "Largest exposure should sort first"
+        )
+        self.assertEqual(
+            Contract.search([('id', 'in', (small | large).ids), ('total_payable', '>', small.os_balance)]),
+            large | small,
+        )
+
+    def test_12_reports_read_stored_balances(self):
+        """Test the aging report shows the contract stored balances"""
+        contract = self._create_test_contract()
+        contract.action_approve()
+        contract.balance_late_charges = 300.0
+
+        row = self.env['finance.report.aging'].search([('id', '=', contract.id)])
+        self.assertMoneyEqual(row.os_balance, contract.os_balance)
+        self.assertMoneyEqual(row.balance_late_charges, 300.0)
+        self.assertMoneyEqual(row.total_payable, contract.total_payable)
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+Performance Benchmarks
+======================
+
+Query-count budgets and wall-clock timings for the finance hot paths at
+10, 1,000 and 10,000 contracts.
+
+The suite is tagged ``-standard`` so it does not run with the regular
+tests. Run it explicitly:
+
+    python odoo-bin --test-enable --stop-after-init -d bench_db \\
+        -u asset_finance --test-tags asset_finance_benchmark
+
+Environment variables:
+- ASSET_FINANCE_BENCHMARK_SCALES: comma separated scales (default 10,1000,10000)
+- ASSET_FINANCE_BENCHMARK_OUTPUT: path of the JSON results file
+- ASSET_FINANCE_BENCHMARK_RECORD: set to 1 to measure the query counts
+  and write them to benchmark_baseline.json instead of asserting them
+
+Every operation has a query budget of the measured ``fixed + per_record *
+scale`` of benchmark_baseline.json plus QUERY_MARGIN, so a single extra
+query per record exceeds it. Operations without a measured baseline are
+checked against the QUERY_BUDGETS estimates instead.
+The per-record cost must also not grow with the scale: an operation whose
+queries per record at 1,000 or 10,000 contracts exceed those at the
+smallest scale run has an N+1 over the batch and fails.
+"""
+
+import json
+import logging
+import math
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from dateutil.relativedelta import relativedelta
+
+from .test_common import AssetFinanceTestCommon
+from odoo.tests.common import tagged
+
+_logger = logging.getLogger(__name__)
+
+BENCHMARK_SCALES = [
+    int(scale) for scale in os.environ.get('ASSET_FINANCE_BENCHMARK_SCALES', '10,1000,10000').split(',')
+    if scale.strip()
+]
+
+RECORD_BASELINE = os.environ.get('ASSET_FINANCE_BENCHMARK_RECORD') == '1'
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), 'benchmark_baseline.json')
+
+# extra queries over the measured baseline tolerated at any scale
+QUERY_MARGIN = 5
+
+# operation: (fixed queries, queries per record), upper estimates used until
+# the operation has a measured baseline
+QUERY_BUDGETS = {
+    'generate_schedule': (20, 12),
+    'create_invoices': (20, 150),
+    'allocate_payment': (20, 30),
+    'cron_late_interest': (30, 15),
+    'cron_recognize_interest': (30, 20),
+    'settlement_amount': (10, 5),
+    'dashboard': (60, 0),
+    'reports': (40, 0),
+}
+
+# extra queries per record tolerated at a larger scale than the smallest run
+SCALING_TOLERANCE = 0.5
+
+REPORT_MODELS = [
+    'finance.report.aging',
+    'finance.report.collection',
+    'finance.report.disbursement',
+    'finance.report.interest',
+    'finance.report.portfolio',
+]
+
+
+@tagged('post_install', '-at_install', '-standard', 'asset_finance_benchmark')
+class TestPerformance(AssetFinanceTestCommon):
+    """Benchmark finance hot paths against query budgets"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.benchmark_results = []
+        cls.baseline = {}
+        if os.path.exists(BASELINE_FILE):
+            with open(BASELINE_FILE) as f:
+                cls.baseline = json.load(f)
+
+    @classmethod
+    def tearDownClass(cls):
+        results = json.dumps(cls.benchmark_results, indent=2)
+        output = os.environ.get('ASSET_FINANCE_BENCHMARK_OUTPUT')
+        if output:
+            with open(output, 'w') as f:
+                f.write(results)
+        _logger.info("Asset finance benchmark results:\n%s", results)
+        if RECORD_BASELINE and cls.benchmark_results:
+            with open(BASELINE_FILE, 'w') as f:
+                json.dump(cls._measured_baseline(cls.benchmark_results), f, indent=2, sort_keys=True)
+                f.write('\n')
+            _logger.info("Asset finance benchmark baseline written to %s", BASELINE_FILE)
+        super().tearDownClass()
+
+    @classmethod
+    def _measured_baseline(cls, results):
+        """Fit ``fixed + per_record * scale`` through the smallest and largest measured scale of each operation"""
+        baseline = {}
+        for operation in QUERY_BUDGETS:
+            measured = sorted(
+                (result['scale'], result['queries']) for result in results if result['operation'] == operation
+            )
+            if not measured:
+                continue
+            (small_scale, small_queries), (large_scale, large_queries) = measured[0], measured[-1]
+            per_record = (
+                (large_queries - small_queries) / (large_scale - small_scale)
+                if large_scale > small_scale else small_queries / small_scale
+            )
+            baseline[operation] = {
+                'fixed': max(0, round(small_queries - per_record * small_scale)),
+                'per_record': round(per_record, 3),
+                'measured': [{'scale': scale, 'queries': queries} for scale, queries in measured],
+            }
+        return baseline
+
+    def _query_budget(self, operation, scale):
+        measured = self.baseline.get(operation)
+        if measured:
+            return math.ceil(measured['fixed'] + measured['per_record'] * scale) + QUERY_MARGIN
+        fixed, per_record = QUERY_BUDGETS[operation]
+        return fixed + math.ceil(per_record * scale)
+
+    # --------------------------------------------------------
+    # HELPERS
+    # --------------------------------------------------------
+
+    @contextmanager
+    def _benchmark(self, operation, scale):
+        """Measure one operation and assert it stays within its query budget"""
+        budget = self._query_budget(operation, scale)
+
+        self.env.flush_all()
+        start_queries = self.cr.sql_log_count
+        start = time.perf_counter()
+        try:
+            if RECORD_BASELINE:
+                yield
+            else:
+                with self.assertQueryCount(budget):
+                    yield
+        finally:
+            elapsed = time.perf_counter() - start
+            queries = self.cr.sql_log_count - start_queries
+            self.benchmark_results.append({
+                'operation': operation,
+                'scale': scale,
+                'queries': queries,
+                'queries_per_record': round(queries / scale, 2),
+                'budget': budget,
+                'seconds': round(elapsed, 3),
+                'records_per_second': round(scale / elapsed, 1) if elapsed else None,
+            })
+        self._assert_scaling(operation, scale, queries)
+
+    def _assert_scaling(self, operation, scale, queries):
+        """Fail when the queries per record grow compared to the smallest scale benchmarked so far"""
+        smaller = [
+            result for result in self.benchmark_results
+            if result['operation'] == operation and result['scale'] < scale
+        ]
+        if not smaller:
+            return
+        baseline = min(smaller, key=lambda result: result['scale'])
+        self.assertLessEqual(
+            queries / scale, baseline['queries'] / baseline['scale'] + SCALING_TOLERANCE,
+            f"{operation}: {queries} queries for {scale} records grow faster than "
+            f"{baseline['queries']} queries for {baseline['scale']} records"
+        )
+
+    def _create_benchmark_contracts(self, scale):
+        """Create ``scale`` active contracts with their first installments due"""
+        today = datetime.now().date()
+        agreement_date = today - relativedelta(months=3)
+        vals_list = [{
+            'product_id': self.product_hp_5y.id,
+            'asset_id': (self.asset_1 if i % 2 else self.asset_2).id,
+            'hirer_id': (self.customer_1 if i % 2 else self.customer_2).id,
+            'agreement_date': agreement_date,
+            'first_due_date': agreement_date + relativedelta(days=1),
+            'cash_price': 50000.0,
+            'down_payment': 10000.0,
+            'int_rate_pa': 8.5,
+            'no_of_inst': self.term_60m.id,
+            'interest_method': 'rule78',
+            'payment_scheme': 'arrears',
+            'installment_type': 'annuity',
+            'penalty_rule_id': self.penalty_rule_daily.id,
+            'journal_id': self.sales_journal.id,
+            'asset_account_id': self.asset_account.id,
+            'income_account_id': self.income_account.id,
+            'unearned_interest_account_id': self.unearned_interest_account.id,
+        } for i in range(scale)]
+        contracts = self.env['finance.contract'].create(vals_list)
+        contracts.action_approve()
+        return contracts
+
+    def _create_payments(self, contracts):
+        return self.env['account.payment'].create([{
+            'payment_type': 'inbound',
+            'partner_type': 'customer',
+            'partner_id': contract.hirer_id.id,
+            'amount': contract.monthly_inst,
+            'date': datetime.now().date(),
+            'journal_id': self.bank_journal.id,
+            'contract_id': contract.id,
+        } for contract in contracts])
+
+    def _run_benchmarks(self, scale):
+        if scale not in BENCHMARK_SCALES:
+            self.skipTest(f"Scale {scale} not selected in ASSET_FINANCE_BENCHMARK_SCALES")
+
+        contracts = self._create_benchmark_contracts(scale)
+
+        with self._benchmark('generate_schedule', scale):
+            for contract in contracts:
+                contract.action_generate_schedule()
+
+        with self._benchmark('create_invoices', scale):
+            for contract in contracts:
+                contract.action_create_invoices()
+
+        payments = self._create_payments(contracts)
+        with self._benchmark('allocate_payment', scale):
+            for payment in payments:
+                payment._allocate_payment_to_contract()
+
+        with self._benchmark('cron_late_interest', scale):
+            self.env['finance.contract']._cron_calculate_late_interest()
+
+        with self._benchmark('cron_recognize_interest', scale):
+            self.env['finance.contract']._cron_recognize_monthly_interest()
+
+        settlement_date = datetime.now().date()
+        with self._benchmark('settlement_amount', scale):
+            for contract in contracts:
+                contract.calculate_settlement_amount(settlement_date)
+
+        Dashboard = self.env['finance.dashboard']
+        with self._benchmark('dashboard', scale):
+            for widget in Dashboard._get_widget_loaders():
+                Dashboard.get_widget_data(widget)
+
+        with self._benchmark('reports', scale):
+            for model in REPORT_MODELS:
+                Report = self.env[model]
+                Report.search_read([], limit=80)
+                Report._read_group([], aggregates=['__count'])
+
+    # --------------------------------------------------------
+    # BENCHMARKS
+    # --------------------------------------------------------
+
+    def test_01_scale_10(self):
+        """Benchmark hot paths with 10 contracts"""
+        self._run_benchmarks(10)
+
+    def test_02_scale_1000(self):
+        """Benchmark hot paths with 1,000 contracts"""
+        self._run_benchmarks(1000)
+
+    def test_03_scale_10000(self):
+        """Benchmark hot paths with 10,000 contracts"""
+        self._run_benchmarks(10000)
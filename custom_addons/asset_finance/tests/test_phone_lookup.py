@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Phone Lookup Tests
+==================
+
+Tests for E.164 phone normalization and caller reverse lookup.
+"""
+
+from .test_common import AssetFinanceTestCommon
+from odoo.tests.common import tagged
+from odoo.addons.asset_finance.models.res_partner_phone import normalize_phone
+
+
+@tagged('post_install', '-at_install', 'asset_finance', 'phone_lookup')
+class TestPhoneLookup(AssetFinanceTestCommon):
+    """Test phone normalization, backfill and reverse lookup"""
+
+    def test_01_normalize_phone(self):
+        """Test local, international and formatted numbers normalize to E.164"""
+        self.assertEqual(normalize_phone('9123 4567'), '+6591234567')
+        self.assertEqual(normalize_phone('+65 9123-4567'), '+6591234567')
+        self.assertEqual(normalize_phone('0065 91234567'), '+6591234567')
+        self.assertEqual(normalize_phone('n/a'), '')
+        # A blank or mistyped country code setting leaves local numbers unnormalized
+        self.assertEqual(normalize_phone('9123 4567', ''), '')
+        self.assertEqual(normalize_phone('9123 4567', 'SG'), '')
+        self.assertEqual(normalize_phone('+65 9123-4567', 'SG'), '+6591234567')
+
+    def test_02_lookup_returns_partner_contracts(self):
+        """Test a caller's number finds the partner and every contract role"""
+        self.env['res.partner.phone'].create({
+            'partner_id': self.guarantor.id,
+            'name': '+65 8111 2222',
+        })
+        hirer_contract = self._create_test_contract(hirer_id=self.guarantor.id)
+        guaranteed = self._create_test_contract(asset_id=self.asset_2.id)
+        self.env['finance.contract.guarantor'].create({
+            'contract_id': guaranteed.id,
+            'partner_id': self.guarantor.id,
+            'relationship': 'spouse',
+        })
+
+        result = self.env['res.partner'].finance_phone_lookup('81112222')
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]['id'], self.guarantor.id)
+        roles = {(c['id'], c['role']) for c in result[0]['contracts']}
+        self.assertEqual(roles, {(hirer_contract.id, 'hirer'), (guaranteed.id, 'guarantor')})
+        totals = {c['id']: c['total_payable'] for c in result[0]['contracts']}
+        self.assertMoneyEqual(totals[hirer_contract.id], hirer_contract.total_payable,
+                              "The lookup should show the contract total payable")
+
+    def test_03_backfill_existing_numbers(self):
+        """Test the backfill normalizes rows stored before the column existed"""
+        phone = self.env['res.partner.phone'].create({'partner_id': self.customer_1.id, 'name': '6222 3333'})
+        self.env.cr.execute("UPDATE res_partner_phone SET phone_e164 = NULL WHERE id = %s", [phone.id])
+
+        self.env['res.partner.phone']._cron_backfill_phone_e164()
+
+        self.assertEqual(phone.phone_e164, '+6562223333')
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Quick Search Tests
+==================
+
+Tests for the unified finance quick search.
+"""
+
+from .test_common import AssetFinanceTestCommon
+from odoo.tests.common import tagged
+
+
+@tagged('post_install', '-at_install', 'asset_finance', 'quick_search')
+class TestQuickSearch(AssetFinanceTestCommon):
+    """Test quick search matching and ranking"""
+
+    def test_01_exact_match_ranked_first(self):
+        """Test an exact agreement number outranks partial matches"""
+        contract = self._create_test_contract()
+        contract.agreement_no = 'QS-12345'
+        other = self._create_test_contract(asset_id=self.asset_2.id)
+        other.agreement_no = 'QS-123456'
+
+        results = self.env['finance.quick.search'].search_records('qs-12345')
+
+        contract_results = [r for r in results if r['model'] == 'finance.contract']
+        self.assertEqual([r['id'] for r in contract_results], [contract.id, other.id])
+
+    def test_02_searches_assets_and_partners(self):
+        """Test registration plate and NRIC matches are returned"""
+        contract = self._create_test_contract()
+        self.customer_1.nric = 'S9912345Q'
+        results = self.env['finance.quick.search'].search_records('1234', limit=50)
+
+        matched = {(r['model'], r['id']) for r in results}
+        self.assertIn(('res.partner', self.customer_1.id), matched)
+        self.assertIn(('finance.contract', contract.id), matched, "Matched on the asset registration no")
+
+    def test_03_short_terms_ignored(self):
+        """Test terms shorter than the trigram length return nothing"""
+        self.assertEqual(self.env['finance.quick.search'].search_records('S9'), [])
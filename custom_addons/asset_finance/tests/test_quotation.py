@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Quotation Tests
+===============
+
+Tests for the record-free instant quotation.
+"""
+
+from .test_common import AssetFinanceTestCommon
+from odoo.tests.common import tagged
+from odoo.exceptions import UserError
+
+
+@tagged('post_install', '-at_install', 'asset_finance', 'quotation')
+class TestQuotation(AssetFinanceTestCommon):
+    """Test quotes match contracts, respect product limits and write nothing"""
+
+    def _scenario(self, **kwargs):
+        scenario = {
+            'product_id': self.product_hp_5y.id,
+            'cash_price': 50000.0,
+            'down_payment': 10000.0,
+            'months': 60,
+            'int_rate_pa': 8.5,
+        }
+        scenario.update(kwargs)
+        return scenario
+
+    def test_01_quote_matches_contract(self):
+        """Test a quote returns the amounts and schedule the contract computes"""
+        contract = self._create_test_contract()
+        quote, = self.env['finance.quotation'].quote([self._scenario()], with_schedule=True)
+
+        for field_name in ('loan_amount', 'term_charges', 'balance_hire', 'first_inst_amount',
+                           'monthly_inst', 'last_inst_amount'):
+            self.assertMoneyEqual(quote[field_name], contract[field_name], field_name)
+        self.assertEqual(len(quote['schedule']), 60)
+        for quoted, expected in zip(quote['schedule'], contract._prepare_schedule_lines()):
+            self.assertMoneyEqual(quoted['amount_total'], expected['amount_total'])
+            self.assertEqual(quoted['date_due'], str(expected['date_due']))
+
+    def test_02_batch_with_product_limits(self):
+        """Test each scenario of a batch is validated on its own"""
+        self.product_hp_5y.write({'max_finance_amount': 45000.0, 'max_finance_percent': 90.0})
+        quotes = self.env['finance.quotation'].quote([
+            self._scenario(),
+            self._scenario(months=18),
+            self._scenario(down_payment=0.0),
+            self._scenario(product_id=0),
+            self._scenario(int_rate_pa=None),
+        ])
+
+        self.assertNotIn('errors', quotes[0])
+        self.assertNotIn('schedule', quotes[0])
+        self.assertEqual(len(quotes[1]['errors']), 1, "18 months is not a 12 month step")
+        self.assertEqual(len(quotes[2]['errors']), 2, "Above both the amount and the percentage limit")
+        self.assertIn('errors', quotes[3])
+        self.assertEqual(quotes[4]['int_rate_pa'], 8.5, "Product default rate should apply")
+
+    def test_03_quote_writes_nothing(self):
+        """Test quoting runs no write query and creates no contract"""
+        Contract = self.env['finance.contract']
+        count = Contract.search_count([])
+        self.env.flush_all()
+        # the product lookup only, whatever the number of scenarios
+        with self.assertQueryCount(2):
+            self.env['finance.quotation'].quote([self._scenario(months=months) for months in (12, 24, 36, 48, 60)])
+        self.assertEqual(Contract.search_count([]), count)
+
+    def test_04_batch_size_is_capped(self):
+        """Test oversized batches are refused"""
+        with self.assertRaises(UserError):
+            self.env['finance.quotation'].quote([self._scenario()] * 501)
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Party Screening Tests
+=====================
+
+Tests for blacklist and duplicate identity screening.
+"""
+
+from .test_common import AssetFinanceTestCommon
+from odoo.tests.common import tagged
+from odoo.exceptions import UserError
+
+
+@tagged('post_install', '-at_install', 'asset_finance', 'screening')
+class TestScreening(AssetFinanceTestCommon):
+    """Test identity keys and contract party screening"""
+
+    def test_01_identity_key_normalized(self):
+        """Test differently formatted NRICs share the same identity key"""
+        self.customer_1.nric = 'S1234567D'
+        self.customer_2.nric = ' s-1234 567d '
+        self.assertTrue(self.customer_1.identity_key)
+        self.assertEqual(self.customer_1.identity_key, self.customer_2.identity_key)
+
+    def test_02_duplicate_identity_flagged(self):
+        """Test a hirer entered twice with another NRIC format is flagged on create"""
+        self.customer_1.nric = 'S1234567D'
+        self.customer_2.nric = 'S 1234567 D'
+
+        contract = self._create_test_contract(hirer_id=self.customer_2.id)
+
+        self.assertEqual(contract.screening_state, 'duplicate')
+        self.assertEqual(contract.screening_hit_ids.matched_partner_id, self.customer_1)
+
+    def test_03_blacklisted_guarantor_blocks_approval(self):
+        """Test a guarantor sharing the NRIC of a blacklisted partner blocks approval"""
+        self.customer_1.write({'nric': 'T7654321A', 'finance_blacklist': True})
+        self.guarantor.nric = 't7654321a'
+        contract = self._create_test_contract(hirer_id=self.customer_2.id)
+        self.env['finance.contract.guarantor'].create({
+            'contract_id': contract.id,
+            'partner_id': self.guarantor.id,
+            'relationship': 'spouse',
+        })
+
+        with self.assertRaises(UserError):
+            contract.action_approve()
+        self.assertEqual(contract.screening_state, 'blacklist')
+        self.assertEqual(contract.screening_hit_ids.role, 'guarantor')
+
+    def test_04_rescreen_clears_resolved_hits(self):
+        """Test the batch rescreen picks up blacklist changes"""
+        self.customer_1.nric = 'S1234567D'
+        self.customer_2.nric = 'S1234567D'
+        contract = self._create_test_contract(hirer_id=self.customer_2.id)
+        self.assertEqual(contract.screening_state, 'duplicate')
+
+        self.customer_1.nric = 'S7777777X'
+        self.env['finance.contract']._cron_rescreen_contracts()
+
+        self.assertEqual(contract.screening_state, 'clear')
+        self.assertFalse(contract.screening_hit_ids)
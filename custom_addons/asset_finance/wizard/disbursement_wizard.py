@@ -1,6 +1,8 @@
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError
 
+from ..models.job_run import finance_job
+
 class FinanceDisbursementWizard(models.TransientModel):
     _name = 'finance.disbursement.wizard'
     _description = 'Disbursement Wizard'
@@ -51,6 +53,7 @@ class FinanceDisbursementWizard(models.TransientModel):
             # (Note: Interest is booked to Unearned, not paid out)
             rec.amount_net = rec.amount_principal - rec.processing_fee - rec.processing_fee_tax - rec.advance_payment
 
+    @finance_job('Disbursement', job_type='wizard')
     def action_confirm_disbursement(self):
         self.ensure_one()
         contract = self.contract_id
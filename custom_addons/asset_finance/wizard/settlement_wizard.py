@@ -1,6 +1,8 @@
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError
 
+from ..models.job_run import finance_job
+
 # Wizard for Early Settlement Quotation, 
 # allowing calculation of settlement amounts and creation of settlement invoices.
 # This wizard calculates: {Settlement} = {Future Principal} + {Arrears (Unpaid Invoices)} + {Penalty} + {Settlement Fee}
@@ -93,6 +95,7 @@ class FinanceSettlementWizard(models.TransientModel):
                 rec.manual_fee
             )
 
+    @finance_job('Early Settlement', job_type='wizard')
     def action_confirm_settlement(self):
         self.ensure_one()
         contract = self.contract_id
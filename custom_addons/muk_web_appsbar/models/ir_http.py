@@ -12,8 +12,10 @@ class IrHttp(models.AbstractModel):
     def session_info(self):
         result = super().session_info()
         if self.env.user._is_internal():
-            for company in self.env.user.company_ids.with_context(bin_size=True):
+            # stored flag, fetched with the company columns read by super
+            for company in self.env.user.company_ids:
                 result['user_companies']['allowed_companies'][company.id].update({
-                    'has_appsbar_image': bool(company.appbar_image),
+                    'has_appsbar_image': company.has_appsbar_image,
+                    'appbar_image_unique': company.appbar_image_unique,
                 })
         return result
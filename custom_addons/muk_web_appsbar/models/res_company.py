@@ -1,4 +1,6 @@
-from odoo import models, fields
+import hashlib
+
+from odoo import models, fields, api
 
 
 class ResCompany(models.Model):
@@ -13,3 +15,38 @@ class ResCompany(models.Model):
         string='Apps Menu Footer Image',
         attachment=True
     )
+    
+    appbar_image_512 = fields.Image(
+        string='Apps Menu Footer Image 512',
+        related='appbar_image',
+        max_width=512,
+        max_height=512,
+        store=True,
+    )
+    
+    appbar_image_unique = fields.Char(
+        compute='_compute_appbar_image_unique',
+        store=True,
+    )
+    
+    has_appsbar_image = fields.Boolean(
+        compute='_compute_has_appsbar_image',
+        store=True,
+    )
+    
+    #----------------------------------------------------------
+    # Compute
+    #----------------------------------------------------------
+    
+    @api.depends('appbar_image')
+    def _compute_has_appsbar_image(self):
+        for company in self.with_context(bin_size=True):
+            company.has_appsbar_image = bool(company.appbar_image)
+    
+    @api.depends('appbar_image_512')
+    def _compute_appbar_image_unique(self):
+        for company in self:
+            image = company.appbar_image_512
+            if isinstance(image, str):
+                image = image.encode()
+            company.appbar_image_unique = image and hashlib.sha1(image).hexdigest()[:16]
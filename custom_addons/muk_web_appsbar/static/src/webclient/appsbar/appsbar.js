@@ -12,8 +12,9 @@ export class AppsBar extends Component {
     	if (user.activeCompany.has_appsbar_image) {
             this.sidebarImageUrl = url('/web/image', {
                 model: 'res.company',
-                field: 'appbar_image',
+                field: 'appbar_image_512',
                 id: user.activeCompany.id,
+                unique: user.activeCompany.appbar_image_unique,
             });
     	}
     	const renderAfterMenuChange = () => {
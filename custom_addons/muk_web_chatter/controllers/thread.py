@@ -0,0 +1,17 @@
+from odoo import http
+from odoo.http import request
+
+from odoo.addons.mail.controllers.thread import ThreadController
+
+
+class MukThreadController(ThreadController):
+
+    #----------------------------------------------------------
+    # Routes
+    #----------------------------------------------------------
+
+    @http.route()
+    def mail_thread_messages(self, thread_model, thread_id, fetch_params=None, hide_notifications=False, **kwargs):
+        if hide_notifications:
+            request.update_context(muk_web_chatter_hide_notifications=True)
+        return super().mail_thread_messages(thread_model, thread_id, fetch_params=fetch_params, **kwargs)
@@ -1,2 +1,3 @@
 from . import ir_http
+from . import mail_message
 from . import res_users
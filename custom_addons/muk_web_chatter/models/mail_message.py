@@ -0,0 +1,21 @@
+from odoo import api, models
+
+
+class MailMessage(models.Model):
+
+    _inherit = 'mail.message'
+
+    #----------------------------------------------------------
+    # Functions
+    #----------------------------------------------------------
+
+    @api.model
+    def _message_fetch(self, domain, *args, **kwargs):
+        # applied before the limit, so every page holds only the
+        # messages the chatter displays
+        if self.env.context.get('muk_web_chatter_hide_notifications'):
+            domain = [
+                *domain, 
+                ('message_type', 'not in', ['notification', 'user_notification']),
+            ]
+        return super()._message_fetch(domain, *args, **kwargs)
@@ -20,6 +20,8 @@ patch(Chatter.prototype, {
             'muk_web_chatter.notifications', showNotificationMessages
         );
         this.state.showNotificationMessages = showNotificationMessages;
+        // the notification filter is applied by the server fetch
+        this.state.thread?.reloadMessages();
     },
 });
 
@@ -0,0 +1,22 @@
+import { patch } from "@web/core/utils/patch";
+import { browser } from "@web/core/browser/browser";
+
+import { Thread } from "@mail/core/common/thread_model";
+
+patch(Thread.prototype, {
+    getFetchParams() {
+        const params = super.getFetchParams(...arguments);
+        if (
+            this.getFetchRoute() === '/mail/thread/messages' &&
+            browser.localStorage.getItem('muk_web_chatter.notifications') === 'false'
+        ) {
+            params.hide_notifications = true;
+        }
+        return params;
+    },
+    async reloadMessages() {
+        this.messages = [];
+        this.isLoaded = false;
+        await this.fetchNewMessages();
+    },
+});
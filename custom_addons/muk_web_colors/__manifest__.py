@@ -4,7 +4,7 @@
     'description': '''
         This module gives you options to customize the theme colors.
     ''',
-    'version': '19.1.1.0.0',
+    'version': '19.1.1.1.0',
     'category': 'Tools/UI',
     'license': 'LGPL-3', 
     'author': 'MuK IT',
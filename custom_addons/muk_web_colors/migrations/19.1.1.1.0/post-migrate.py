@@ -0,0 +1,47 @@
+import logging
+
+from odoo import api, SUPERUSER_ID
+
+_logger = logging.getLogger(__name__)
+
+
+COLOR_ASSETS = {
+    'light': (
+        '/muk_web_colors/static/src/scss/colors_light.scss',
+        'web._assets_primary_variables',
+    ),
+    'dark': (
+        '/muk_web_colors/static/src/scss/colors_dark.scss',
+        'web.assets_web_dark',
+    ),
+}
+
+# the brand color setting is removed, the bundles use this default again
+DEFAULT_BRAND_COLOR = '#243742'
+
+
+def migrate(cr, version):
+    """ Move customized colors from the rewritten SCSS attachments into
+    system parameters and drop the asset overrides, so the bundles are
+    compiled from the module files again. The brand color is no longer
+    a setting: a customized one reverts to the default.
+    """
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    editor = env['muk_web_colors.color_assets_editor']
+    settings = env['res.config.settings']
+    params = env['ir.config_parameter']
+    for mode, (url, bundle) in COLOR_ASSETS.items():
+        custom_url = editor._get_custom_colors_url(url, bundle)
+        if not editor._get_colors_attachment(custom_url):
+            continue
+        colors = editor.get_color_variables_values(url, bundle, settings.COLOR_FIELDS + ['color_brand'])
+        brand = (colors.pop('color_brand', None) or '').strip()
+        if brand and brand.lower() != DEFAULT_BRAND_COLOR:
+            _logger.warning(
+                "The %s mode brand color %s is no longer supported and reverts to %s",
+                mode, brand, DEFAULT_BRAND_COLOR,
+            )
+        for field, value in colors.items():
+            if value:
+                params.set_param(f'muk_web_colors.{field}_{mode}', value.strip())
+        editor.reset_color_asset(url, bundle)
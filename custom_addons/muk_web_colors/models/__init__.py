@@ -1,2 +1,3 @@
 from . import color_assets_editor
+from . import ir_http
 from . import res_config_settings
@@ -0,0 +1,109 @@
+import re
+
+from markupsafe import Markup
+
+from odoo import models, tools
+
+from .res_config_settings import LIGHT_COLORS, DARK_COLORS
+
+
+HEX_COLOR_REGEX = re.compile(r'^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$')
+
+THEME_COLORS = ['primary', 'success', 'info', 'warning', 'danger']
+
+
+class IrHttp(models.AbstractModel):
+
+    _inherit = 'ir.http'
+
+    #----------------------------------------------------------
+    # Helper
+    #----------------------------------------------------------
+
+    def _parse_color(self, value):
+        match = value and HEX_COLOR_REGEX.match(value.strip())
+        if not match:
+            return None
+        digits = match.group(1)
+        if len(digits) == 3:
+            digits = ''.join(digit * 2 for digit in digits)
+        return tuple(int(digits[i:i + 2], 16) for i in (0, 2, 4))
+
+    def _format_color(self, rgb):
+        return '#%02x%02x%02x' % tuple(round(value) for value in rgb)
+
+    def _shade_color(self, rgb, weight):
+        # same as the bootstrap shade-color function
+        return tuple(value * (1 - weight) for value in rgb)
+
+    def _contrast_color(self, rgb):
+        def channel(value):
+            value /= 255
+            return value / 12.92 if value <= 0.03928 else ((value + 0.055) / 1.055) ** 2.4
+        red, green, blue = (channel(value) for value in rgb)
+        luminance = 0.2126 * red + 0.7152 * green + 0.0722 * blue
+        return '#ffffff' if (1.05 / (luminance + 0.05)) >= 3 else '#000000'
+
+    def _get_color_values(self, mode):
+        params = self.env['ir.config_parameter'].sudo()
+        defaults = DARK_COLORS if mode == 'dark' else LIGHT_COLORS
+        values = {}
+        for field, default in defaults.items():
+            value = params.get_param(f'muk_web_colors.{field}_{mode}')
+            rgb = self._parse_color(value)
+            if rgb and rgb != self._parse_color(default):
+                values[field.removeprefix('color_')] = rgb
+        return values
+
+    def _get_color_style_rules(self, values):
+        properties = []
+        rules = []
+        for name, rgb in values.items():
+            color = self._format_color(rgb)
+            properties.append(f'--mk-color-{name}: {color};')
+            if name not in THEME_COLORS:
+                continue
+            hover = self._format_color(self._shade_color(rgb, 0.15))
+            active = self._format_color(self._shade_color(rgb, 0.2))
+            contrast = self._contrast_color(rgb)
+            properties.append(f'--bs-{name}: {color};')
+            properties.append(f'--bs-{name}-rgb: {rgb[0]}, {rgb[1]}, {rgb[2]};')
+            if name == 'primary':
+                properties.append(f'--bs-link-color: {color};')
+                properties.append(f'--bs-link-color-rgb: {rgb[0]}, {rgb[1]}, {rgb[2]};')
+                properties.append(f'--bs-link-hover-color: {active};')
+            rules.append(
+                f'.btn-{name} {{ '
+                f'--bs-btn-color: {contrast}; --bs-btn-bg: {color}; --bs-btn-border-color: {color}; '
+                f'--bs-btn-hover-color: {contrast}; --bs-btn-hover-bg: {hover}; --bs-btn-hover-border-color: {active}; '
+                f'--bs-btn-active-color: {contrast}; --bs-btn-active-bg: {active}; --bs-btn-active-border-color: {active}; '
+                f'--bs-btn-disabled-bg: {color}; --bs-btn-disabled-border-color: {color}; }}'
+            )
+            rules.append(
+                f'.btn-outline-{name} {{ '
+                f'--bs-btn-color: {color}; --bs-btn-border-color: {color}; '
+                f'--bs-btn-hover-color: {contrast}; --bs-btn-hover-bg: {color}; --bs-btn-hover-border-color: {color}; '
+                f'--bs-btn-active-color: {contrast}; --bs-btn-active-bg: {color}; --bs-btn-active-border-color: {color}; '
+                f'--bs-btn-disabled-color: {color}; --bs-btn-disabled-border-color: {color}; }}'
+            )
+        if not properties:
+            return ''
+        return '\n'.join([f':root {{ {" ".join(properties)} }}', *rules])
+
+    #----------------------------------------------------------
+    # Functions
+    #----------------------------------------------------------
+
+    @tools.ormcache('mode')
+    def _get_color_style(self, mode):
+        """ Return the CSS overriding the compiled theme colors.
+
+        The colors are stored as system parameters and applied as CSS
+        custom properties on top of the bundles, which are compiled once
+        with the default colors. Changing a parameter clears the cache.
+        """
+        return self._get_color_style_rules(self._get_color_values(mode))
+
+    def _get_color_style_markup(self, color_scheme=None):
+        mode = 'dark' if color_scheme == 'dark' else 'light'
+        return Markup(self._get_color_style(mode))
@@ -1,5 +1,22 @@
 from odoo import api, fields, models
 
+# defaults of static/src/scss/colors_light.scss and colors_dark.scss
+LIGHT_COLORS = {
+    'color_primary': '#5D8DA8',
+    'color_success': '#28A745',
+    'color_info': '#17A2B8',
+    'color_warning': '#FFAC00',
+    'color_danger': '#DC3545',
+}
+
+DARK_COLORS = {
+    'color_primary': '#5D8DA8',
+    'color_success': '#1DC959',
+    'color_info': '#6AB5FB',
+    'color_warning': '#FBB56A',
+    'color_danger': '#FF5757',
+}
+
 
 class ResConfigSettings(models.TransientModel):
 
@@ -12,7 +29,6 @@ class ResConfigSettings(models.TransientModel):
     @property
     def COLOR_FIELDS(self):
         return [
-            'color_brand',
             'color_primary',
             'color_success',
             'color_info',
@@ -20,161 +36,88 @@ class ResConfigSettings(models.TransientModel):
             'color_danger',
         ]
         
-    @property
-    def COLOR_ASSET_LIGHT_URL(self):
-        return '/muk_web_colors/static/src/scss/colors_light.scss'
-        
-    @property
-    def COLOR_BUNDLE_LIGHT_NAME(self):
-        return 'web._assets_primary_variables'
-        
-    @property
-    def COLOR_ASSET_DARK_URL(self):
-        return '/muk_web_colors/static/src/scss/colors_dark.scss'
-        
-    @property
-    def COLOR_BUNDLE_DARK_NAME(self):
-        return 'web.assets_web_dark'
-
     #----------------------------------------------------------
     # Fields Light Mode
     #----------------------------------------------------------
     
-    color_brand_light = fields.Char(
-        string='Brand Light Color'
-    )
-    
     color_primary_light = fields.Char(
-        string='Primary Light Color'
+        string='Primary Light Color',
+        config_parameter='muk_web_colors.color_primary_light',
+        default=LIGHT_COLORS['color_primary'],
     )
     
     color_success_light = fields.Char(
-        string='Success Light Color'
+        string='Success Light Color',
+        config_parameter='muk_web_colors.color_success_light',
+        default=LIGHT_COLORS['color_success'],
     )
     
     color_info_light = fields.Char(
-        string='Info Light Color'
+        string='Info Light Color',
+        config_parameter='muk_web_colors.color_info_light',
+        default=LIGHT_COLORS['color_info'],
     )
     
     color_warning_light = fields.Char(
-        string='Warning Light Color'
+        string='Warning Light Color',
+        config_parameter='muk_web_colors.color_warning_light',
+        default=LIGHT_COLORS['color_warning'],
     )
     
     color_danger_light = fields.Char(
-        string='Danger Light Color'
+        string='Danger Light Color',
+        config_parameter='muk_web_colors.color_danger_light',
+        default=LIGHT_COLORS['color_danger'],
     )
 
     #----------------------------------------------------------
     # Fields Dark Mode
     #----------------------------------------------------------
     
-    color_brand_dark = fields.Char(
-        string='Brand Dark Color'
-    )
-    
     color_primary_dark = fields.Char(
-        string='Primary Dark Color'
+        string='Primary Dark Color',
+        config_parameter='muk_web_colors.color_primary_dark',
+        default=DARK_COLORS['color_primary'],
     )
     
     color_success_dark = fields.Char(
-        string='Success Dark Color'
+        string='Success Dark Color',
+        config_parameter='muk_web_colors.color_success_dark',
+        default=DARK_COLORS['color_success'],
     )
     
     color_info_dark = fields.Char(
-        string='Info Dark Color'
+        string='Info Dark Color',
+        config_parameter='muk_web_colors.color_info_dark',
+        default=DARK_COLORS['color_info'],
     )
     
     color_warning_dark = fields.Char(
-        string='Warning Dark Color'
+        string='Warning Dark Color',
+        config_parameter='muk_web_colors.color_warning_dark',
+        default=DARK_COLORS['color_warning'],
     )
     
     color_danger_dark = fields.Char(
-        string='Danger Dark Color'
+        string='Danger Dark Color',
+        config_parameter='muk_web_colors.color_danger_dark',
+        default=DARK_COLORS['color_danger'],
     )
     
     #----------------------------------------------------------
     # Helper
     #----------------------------------------------------------
     
-    def _get_light_color_values(self):
-        return self.env['muk_web_colors.color_assets_editor'].get_color_variables_values(
-            self.COLOR_ASSET_LIGHT_URL, 
-            self.COLOR_BUNDLE_LIGHT_NAME,
-            self.COLOR_FIELDS
-        )
-        
-    def _get_dark_color_values(self):
-        return self.env['muk_web_colors.color_assets_editor'].get_color_variables_values(
-            self.COLOR_ASSET_DARK_URL, 
-            self.COLOR_BUNDLE_DARK_NAME,
-            self.COLOR_FIELDS
-        )
-        
-    def _set_light_color_values(self, values):
-        colors = self._get_light_color_values()
-        for var, value in colors.items():
-            values[f'{var}_light'] = value
-        return values
-        
-    def _set_dark_color_values(self, values):
-        colors = self._get_dark_color_values()
-        for var, value in colors.items():
-            values[f'{var}_dark'] = value
-        return values
-    
-    def _detect_light_color_change(self):
-        colors = self._get_light_color_values()
-        return any(
-            self[f'{var}_light'] != val
-            for var, val in colors.items()
-        )
-        
-    def _detect_dark_color_change(self):
-        colors = self._get_dark_color_values()
-        return any(
-            self[f'{var}_dark'] != val
-            for var, val in colors.items()
-        )
-        
-    def _replace_light_color_values(self):
-        variables = [
-            {
-                'name': field, 
-                'value': self[f'{field}_light']
-            }
-            for field in self.COLOR_FIELDS
-        ]
-        return self.env['muk_web_colors.color_assets_editor'].replace_color_variables_values(
-            self.COLOR_ASSET_LIGHT_URL, 
-            self.COLOR_BUNDLE_LIGHT_NAME,
-            variables
-        )
-        
-    def _replace_dark_color_values(self):
-        variables = [
-            {
-                'name': field, 
-                'value': self[f'{field}_dark']
-            }
-            for field in self.COLOR_FIELDS
-        ]
-        return self.env['muk_web_colors.color_assets_editor'].replace_color_variables_values(
-            self.COLOR_ASSET_DARK_URL, 
-            self.COLOR_BUNDLE_DARK_NAME,
-            variables
-        )
-    
+    def _reset_color_parameters(self, mode):
+        params = self.env['ir.config_parameter'].sudo()
+        for field in self.COLOR_FIELDS:
+            params.set_param(f'muk_web_colors.{field}_{mode}', False)
+
     def _reset_light_color_assets(self):
-        self.env['muk_web_colors.color_assets_editor'].reset_color_asset(
-            self.COLOR_ASSET_LIGHT_URL, 
-            self.COLOR_BUNDLE_LIGHT_NAME,
-        )
+        self._reset_color_parameters('light')
         
     def _reset_dark_color_assets(self):
-        self.env['muk_web_colors.color_assets_editor'].reset_color_asset(
-            self.COLOR_ASSET_DARK_URL, 
-            self.COLOR_BUNDLE_DARK_NAME,
-        )
+        self._reset_color_parameters('dark')
         
     #----------------------------------------------------------
     # Action
@@ -193,21 +136,3 @@ class ResConfigSettings(models.TransientModel):
             'type': 'ir.actions.client',
             'tag': 'reload',
         }
-    
-    #----------------------------------------------------------
-    # Functions
-    #----------------------------------------------------------
-
-    def get_values(self):
-        res = super().get_values()
-        res = self._set_light_color_values(res)
-        res = self._set_dark_color_values(res)
-        return res
-
-    def set_values(self):
-        res = super().set_values()
-        if self._detect_light_color_change():
-            self._replace_light_color_values()
-        if self._detect_dark_color_change():
-            self._replace_dark_color_values()
-        return res
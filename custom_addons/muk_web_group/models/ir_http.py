@@ -0,0 +1,30 @@
+from odoo import api, models, tools
+
+
+class IrHttp(models.AbstractModel):
+
+    _inherit = 'ir.http'
+
+    #----------------------------------------------------------
+    # Helper
+    #----------------------------------------------------------
+
+    @api.model
+    @tools.ormcache()
+    def _get_group_expand_limit(self):
+        value = self.env['ir.config_parameter'].sudo().get_param(
+            'muk_web_group.expand_limit'
+        )
+        try:
+            return int(value or 500)
+        except ValueError:
+            return 500
+
+    #----------------------------------------------------------
+    # Functions
+    #----------------------------------------------------------
+    
+    def session_info(self):
+        result = super().session_info()
+        result['group_expand_limit'] = self._get_group_expand_limit()
+        return result
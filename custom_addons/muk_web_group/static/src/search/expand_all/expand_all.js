@@ -1,5 +1,8 @@
 import { Component } from '@odoo/owl';
 import { registry } from '@web/core/registry';
+import { _t } from '@web/core/l10n/translation';
+import { useService } from '@web/core/utils/hooks';
+import { session } from '@web/session';
 import { DropdownItem } from '@web/core/dropdown/dropdown_item';
 
 const cogMenuRegistry = registry.category('cogMenu');
@@ -10,26 +13,59 @@ export class ExpandAll extends Component {
     static components = { DropdownItem };
     static props = {};
 
-    async onExpandButtonClicked() {
+    setup() {
+        this.notification = useService('notification');
+    }
+
+    getExpandLimit() {
+        return session.group_expand_limit ?? 500;
+    }
+
+    getGroupsAtDepth(depth) {
         let groups = this.env.model.root.groups;
-        while (groups.length) {
+        for (let level = 0; level < depth; level++) {
+            groups = groups.filter(
+            	(group) => !group._config.isFolded
+            ).flatMap(
+            	(group) => group.list.groups || []
+            );
+        }
+        return groups;
+    }
+
+    async onExpandButtonClicked() {
+        // Unfold a whole level in the config and load the tree once,
+        // instead of toggling every group with its own request.
+        const limit = this.getExpandLimit();
+        let depth = 0;
+        let opened = 0;
+        let capped = false;
+        let groups = this.getGroupsAtDepth(depth);
+        while (groups.length && !capped) {
             const foldedGroups = groups.filter(
             	(group) => group._config.isFolded
             );
-            if (foldedGroups.length) {
-            	for (const group of foldedGroups) {
-            		await group.toggle();
+            const available = Math.max(
+            	limit - opened - (groups.length - foldedGroups.length), 0
+            );
+            const unfoldGroups = foldedGroups.slice(0, available);
+            capped = unfoldGroups.length < foldedGroups.length;
+            opened += groups.length - foldedGroups.length + unfoldGroups.length;
+            if (unfoldGroups.length) {
+            	for (const group of unfoldGroups) {
+            		group._config.isFolded = false;
                 }
+                await this.env.model.root.load();
             }
-            const subGroups = foldedGroups.map(
-            	(group) => group.list.groups || []
-            );
-            groups = subGroups.reduce( 
-            	(a, b) => a.concat(b), []
-            );
+            groups = this.getGroupsAtDepth(++depth);
         }
-        await this.env.model.root.load();
         this.env.model.notify();
+        if (capped) {
+            this.notification.add(
+            	_t('Only the first %s groups have been expanded.', limit),
+            	{ type: 'warning' }
+            );
+        }
     }
 }
 
@@ -6,7 +6,9 @@ import {
     mountView,
     contains,
     onRpc,
+    patchWithCleanup,
 } from '@web/../tests/web_test_helpers';
+import { session } from '@web/session';
 
 class Category extends models.Model {
     name = fields.Char();
@@ -50,3 +52,17 @@ test('expand/collapse all groups from cog menu in grouped list', async () => {
     expect('tbody tr.o_data_row').toHaveCount(0);
     expect('.o_group_header').toHaveCount(2);
 });
+
+test('expand all stops at the configured group limit', async () => {
+    patchWithCleanup(session, { group_expand_limit: 1 });
+    await mountView({
+        type: 'list',
+        resModel: 'product',
+        groupBy: ['category_id'],
+        arch: `<list string='Products'><field name='name'/><field name='category_id'/></list>`,
+    });
+    await contains('.o_cp_action_menus .dropdown-toggle').click();
+    await contains('.mk_expand_all_menu').click();
+    expect('tbody tr.o_data_row').toHaveCount(2);
+    expect('.o_notification').toHaveCount(1);
+});
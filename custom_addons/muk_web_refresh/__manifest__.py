@@ -6,7 +6,7 @@
         30 seconds. The refresh will reload and update the data
         of the view.
     ''',
-    'version': '19.1.1.0.0',
+    'version': '19.1.1.1.0',
     'category': 'Tools/UI',
     'license': 'LGPL-3', 
     'author': 'MuK IT',
@@ -17,6 +17,7 @@
     ],
     'depends': [
         'web',
+        'bus',
     ],
     'assets': {
         'web.assets_backend': [            
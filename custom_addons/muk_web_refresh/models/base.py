@@ -0,0 +1,74 @@
+from odoo import api, models
+
+
+class Base(models.AbstractModel):
+
+    _inherit = 'base'
+
+    #----------------------------------------------------------
+    # Functions
+    #----------------------------------------------------------
+
+    @api.model
+    def _muk_web_refresh_token_sources(self, domain):
+        """ Return the source rows whose changes show in this model.
+
+        SQL view models (``_auto = False``) have no ``write_date`` and
+        aggregating them runs the whole view query, so their token is
+        built from the rows they are read from instead, as a list of
+        ``(model name, domain)`` pairs. Scope the domains to the rows
+        the view can show, so unrelated writes do not move the token.
+        Override on view models; ``domain`` is the domain of the view.
+        """
+        return []
+
+    @api.model
+    def muk_web_refresh_token(self, domain=None):
+        """ Return a change token for the records matching ``domain``.
+
+        The token is built from the record count, the highest id and the
+        latest ``write_date`` in one aggregate query, so it changes whenever
+        a record is created, deleted or written. Auto refresh compares it
+        with the previous token instead of reloading the whole view.
+
+        SQL view models use the count and latest ``write_date`` of their
+        source rows instead, and return no token (reload every time) when
+        they declare none.
+        """
+        self.check_access('read')
+        if not self._auto:
+            sources = self._muk_web_refresh_token_sources(domain or [])
+            if not sources:
+                return None
+            values = []
+            for name, source_domain in sources:
+                [source_values] = self.env[name].sudo()._read_group(
+                    source_domain, [], ['__count', 'write_date:max']
+                )
+                values.extend(source_values)
+            return ':'.join(str(value or '') for value in values)
+        aggregates = ['__count', 'id:max']
+        if self._log_access:
+            aggregates.append('write_date:max')
+        [values] = self._read_group(domain or [], [], aggregates)
+        return ':'.join(str(value or '') for value in values)
+
+    def _muk_web_refresh_notify(self):
+        """ Reload the open auto refresh views of this model.
+
+        The model names are collected during the transaction and published
+        in one bus notification right before it commits, so a batch of
+        writes wakes every client only once.
+        """
+        names = self.env.cr.precommit.data.setdefault('muk_web_refresh.models', set())
+        if not names:
+            self.env.cr.precommit.add(self._muk_web_refresh_send)
+        names.add(self._name)
+
+    @api.model
+    def _muk_web_refresh_send(self):
+        names = self.env.cr.precommit.data.pop('muk_web_refresh.models', set())
+        if names:
+            self.env['bus.bus']._sendone(
+                'muk_web_refresh', 'muk_web_refresh/updated', {'models': sorted(names)}
+            )
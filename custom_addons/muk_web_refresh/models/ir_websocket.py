@@ -0,0 +1,15 @@
+from odoo import models
+
+
+class IrWebsocket(models.AbstractModel):
+
+    _inherit = 'ir.websocket'
+
+    #----------------------------------------------------------
+    # Functions
+    #----------------------------------------------------------
+
+    def _build_bus_channel_list(self, channels):
+        if self.env.uid and self.env.user._is_internal():
+            channels = [*channels, 'muk_web_refresh']
+        return super()._build_bus_channel_list(channels)
@@ -1,21 +1,35 @@
 import { useState, onWillStart, useEffect } from '@odoo/owl';
 
 import { browser } from '@web/core/browser/browser';
+import { useService } from '@web/core/utils/hooks';
 import { patch } from '@web/core/utils/patch';
+import { useDebounced } from '@web/core/utils/timing';
 import { session } from '@web/session';
 
 import {ControlPanel} from '@web/search/control_panel/control_panel';
 
+// the interval grows up to this factor while nothing changes
+const MAX_IDLE_FACTOR = 8;
+// bursts of bus notifications are merged into one reload
+const NOTIFY_DEBOUNCE_DELAY = 300;
+
 patch(ControlPanel.prototype, {
 	setup() {
 		super.setup(...arguments);
+		this.autoLoadOrm = useService('orm');
+		this.autoLoadBus = useService('bus_service');
+		this.autoLoadNotifyReload = useDebounced(
+			() => this.notifyAutoLoad(), NOTIFY_DEBOUNCE_DELAY
+		);
         this.autoLoadState = useState({
 			active: false,
 			counter: 0,
         });
+		this.autoLoadToken = null;
+		this.autoLoadIdleFactor = 1;
 		onWillStart(() => {
 			if (
-				this.checkAutoLoadAvailability() && 
+				this.checkAutoLoadAvailability() &&
 				this.getAutoLoadStorageValue()
 			) {
 				this.autoLoadState.active = true;
@@ -26,33 +40,57 @@ patch(ControlPanel.prototype, {
 				if (!this.autoLoadState.active) {
 					return;
 				}
+				this.autoLoadToken = null;
+				this.autoLoadIdleFactor = 1;
 				this.autoLoadState.counter = (
 					this.getAutoLoadRefreshInterval()
 				);
+				this.checkAutoLoadToken();
 				const interval = browser.setInterval(
 					() => {
+						if (document.hidden) {
+							return;
+						}
 						this.autoLoadState.counter = (
-							this.autoLoadState.counter ? 
-							this.autoLoadState.counter - 1 : 
+							this.autoLoadState.counter ?
+							this.autoLoadState.counter - 1 :
 							this.getAutoLoadRefreshInterval()
 						);
 						if (this.autoLoadState.counter <= 0) {
-							this.autoLoadState.counter = (
-								this.getAutoLoadRefreshInterval()
-							);
-							if (this.pagerProps?.onUpdate) {
-								this.pagerProps.onUpdate({
-									offset: this.pagerProps.offset, 
-									limit: this.pagerProps.limit
-								});
-							} else if (typeof this.env.searchModel?.search) {
-								this.env.searchModel.search();
-							}
+							this.checkAutoLoadToken();
 						}
-					}, 
+					},
 					1000
 				);
-				return () => browser.clearInterval(interval);
+				const onVisibilityChange = () => {
+					if (!document.hidden) {
+						this.autoLoadIdleFactor = 1;
+						this.checkAutoLoadToken();
+					}
+				};
+				const onUpdated = ({ models }) => {
+					if (
+						!document.hidden &&
+						models.includes(this.env.searchModel?.resModel)
+					) {
+						this.autoLoadNotifyReload();
+					}
+				};
+				document.addEventListener(
+					'visibilitychange', onVisibilityChange
+				);
+				this.autoLoadBus.subscribe(
+					'muk_web_refresh/updated', onUpdated
+				);
+				return () => {
+					browser.clearInterval(interval);
+					document.removeEventListener(
+						'visibilitychange', onVisibilityChange
+					);
+					this.autoLoadBus.unsubscribe(
+						'muk_web_refresh/updated', onUpdated
+					);
+				};
 			},
 			() => [this.autoLoadState.active]
 		);
@@ -63,6 +101,69 @@ patch(ControlPanel.prototype, {
     getAutoLoadRefreshInterval() {
     	return (session.pager_autoload_interval ?? 30000) / 1000;
 	},
+	async getAutoLoadToken() {
+		const searchModel = this.env.searchModel;
+		if (!searchModel?.resModel) {
+			return null;
+		}
+		try {
+			return await this.autoLoadOrm.silent.call(
+				searchModel.resModel,
+				'muk_web_refresh_token',
+				[searchModel.domain],
+				{ context: searchModel.context },
+			);
+		} catch {
+			return null;
+		}
+	},
+	async checkAutoLoadToken() {
+		this.autoLoadState.counter = (
+			this.getAutoLoadRefreshInterval() * this.autoLoadIdleFactor
+		);
+		const token = await this.getAutoLoadToken();
+		if (!this.autoLoadState.active) {
+			return;
+		}
+		const previous = this.autoLoadToken;
+		const changed = (
+			token === null ||
+			(previous !== null && token !== previous)
+		);
+		this.autoLoadToken = token;
+		if (changed) {
+			this.autoLoadIdleFactor = 1;
+			this.reloadAutoLoad();
+		} else if (previous !== null) {
+			this.autoLoadIdleFactor = Math.min(
+				this.autoLoadIdleFactor * 2, MAX_IDLE_FACTOR
+			);
+		}
+		this.autoLoadState.counter = (
+			this.getAutoLoadRefreshInterval() * this.autoLoadIdleFactor
+		);
+	},
+	notifyAutoLoad() {
+		// the server named this model: reload without asking for a
+		// token, recomputed values do not always move it
+		if (!this.autoLoadState.active) {
+			return;
+		}
+		this.autoLoadToken = null;
+		this.autoLoadIdleFactor = 1;
+		this.autoLoadState.counter = this.getAutoLoadRefreshInterval();
+		this.reloadAutoLoad();
+	},
+	reloadAutoLoad() {
+		if (this.pagerProps?.onUpdate) {
+			this.pagerProps.onUpdate({
+				offset: this.pagerProps.offset,
+				limit: this.pagerProps.limit
+			});
+		} else if (typeof this.env.searchModel?.search) {
+			this.env.searchModel.search();
+		}
+	},
     getAutoLoadStorageKey() {
 		const keys = [
 			this.env?.config?.actionId ?? '',
@@ -1,4 +1,4 @@
-import { expect, test } from '@odoo/hoot';
+import { advanceTime, expect, test } from '@odoo/hoot';
 import {
     models,
     fields,
@@ -37,3 +37,25 @@ test(
         expect('.o_control_panel i.fa-refresh').not.toHaveClass('fa-spin');
         expect('.o_control_panel i.fa-refresh').toHaveClass('text-muted');
 });
+
+test(
+    'refresh only reloads when the change token changes', 
+    async () => {
+        let token = 'a';
+        onRpc('product', 'muk_web_refresh_token', () => token);
+        onRpc('web_search_read', () => {
+            expect.step('web_search_read');
+        });
+        await mountView({
+            type: 'list',
+            resModel: 'product',
+            arch: `<list><field name='name'/></list>`,
+        });
+        expect.verifySteps(['web_search_read']);
+        await contains('.o_control_panel i.fa-refresh').click();
+        await advanceTime(30000);
+        expect.verifySteps([]);
+        token = 'b';
+        await advanceTime(60000);
+        expect.verifySteps(['web_search_read']);
+});
@@ -12,8 +12,10 @@ class IrHttp(models.AbstractModel):
     def session_info(self):
         result = super().session_info()
         if self.env.user._is_internal():
-            for company in self.env.user.company_ids.with_context(bin_size=True):
+            # stored flag, fetched with the company columns read by super
+            for company in self.env.user.company_ids:
                 result['user_companies']['allowed_companies'][company.id].update({
-                    'has_background_image': bool(company.background_image),
+                    'has_background_image': company.has_background_image,
+                    'background_image_unique': company.background_image_unique,
                 })
         return result
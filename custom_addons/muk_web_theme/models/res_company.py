@@ -1,4 +1,6 @@
-from odoo import models, fields
+import hashlib
+
+from odoo import models, fields, api
 
 
 class ResCompany(models.Model):
@@ -18,3 +20,38 @@ class ResCompany(models.Model):
         string='Apps Menu Background Image',
         attachment=True
     )
+    
+    background_image_1920 = fields.Image(
+        string='Apps Menu Background Image 1920',
+        related='background_image',
+        max_width=1920,
+        max_height=1920,
+        store=True,
+    )
+    
+    background_image_unique = fields.Char(
+        compute='_compute_background_image_unique',
+        store=True,
+    )
+    
+    has_background_image = fields.Boolean(
+        compute='_compute_has_background_image',
+        store=True,
+    )
+    
+    #----------------------------------------------------------
+    # Compute
+    #----------------------------------------------------------
+    
+    @api.depends('background_image')
+    def _compute_has_background_image(self):
+        for company in self.with_context(bin_size=True):
+            company.has_background_image = bool(company.background_image)
+    
+    @api.depends('background_image_1920')
+    def _compute_background_image_unique(self):
+        for company in self:
+            image = company.background_image_1920
+            if isinstance(image, str):
+                image = image.encode()
+            company.background_image_unique = image and hashlib.sha1(image).hexdigest()[:16]
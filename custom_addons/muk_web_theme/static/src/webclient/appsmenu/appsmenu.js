@@ -13,8 +13,9 @@ export class AppsMenu extends Dropdown {
     	if (user.activeCompany.has_background_image) {
             this.imageUrl = url('/web/image', {
                 model: 'res.company',
-                field: 'background_image',
+                field: 'background_image_1920',
                 id: user.activeCompany.id,
+                unique: user.activeCompany.background_image_unique,
             });
     	} else {
     		this.imageUrl = '/muk_web_theme/static/src/img/background.png';
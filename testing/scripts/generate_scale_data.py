@@ -0,0 +1,404 @@
+# -------------------------------------------------------------------------
+# SCALE DATA GENERATOR FOR ASSET FINANCE
+# Run this inside Odoo Shell:
+#
+#   SCALE_CONTRACTS=100000 SCALE_SEED=42 \
+#   odoo shell -d <database_name> --no-http < testing/scripts/generate_scale_data.py
+#
+# Parameters (environment variables):
+#   SCALE_CONTRACTS       number of contracts to create (default 100000)
+#   SCALE_SEED            random seed, same seed = same dataset (default 42)
+#   SCALE_BATCH           records per ORM batch / commit (default 2000)
+#   SCALE_HISTORY_MONTHS  agreements are spread over this many past months (default 6)
+#   SCALE_PREFIX          prefix for generated names, plates and NRICs (default SC)
+#
+# Unlike setup_test_data*.py this script never creates records one at a time:
+# partners, vehicles, assets, contracts and invoices use multi-create,
+# schedule lines are bulk loaded with COPY, and payments are registered
+# per batch through the standard payment register wizard.
+# -------------------------------------------------------------------------
+import io
+import os
+import random
+import time
+from datetime import date
+
+from dateutil.relativedelta import relativedelta
+
+# Share of contracts per overdue pattern, and how many of the most recent
+# due installments stay unpaid for that pattern
+OVERDUE_PATTERNS = [
+    ('current', 0.70, 0),
+    ('late_30', 0.15, 1),
+    ('late_60', 0.08, 2),
+    ('legal', 0.07, 4),
+]
+
+MAKES = {
+    'Toyota': ['Corolla Altis', 'Camry', 'Vios', 'Hiace'],
+    'Honda': ['Civic', 'Jazz', 'Vezel'],
+    'Hyundai': ['Avante', 'Ioniq 5'],
+    'Mercedes-Benz': ['C200', 'E250'],
+    'BMW': ['320i', 'X3'],
+}
+
+NO_TRACKING = {
+    'tracking_disable': True,
+    'mail_create_nolog': True,
+    'mail_create_nosubscribe': True,
+    'mail_notrack': True,
+    'skip_schedule_generation': True,
+}
+
+
+def _log(message, start):
+    print(f"[{time.perf_counter() - start:8.1f}s] {message}")
+
+
+def _batches(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _copy_rows(cr, table, columns, rows):
+    """Bulk load rows with COPY. Values must not contain tabs or newlines."""
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write('\t'.join(r'\N' if value is None else str(value) for value in row))
+        buffer.write('\n')
+    buffer.seek(0)
+    cr.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buffer)
+
+
+def _pick_pattern(rng):
+    roll = rng.random()
+    for name, share, unpaid in OVERDUE_PATTERNS:
+        if roll < share:
+            return name, unpaid
+        roll -= share
+    return OVERDUE_PATTERNS[0][0], OVERDUE_PATTERNS[0][2]
+
+
+def _get_setup(env, prefix):
+    """Find journals/accounts as the other setup scripts do, create scale master data"""
+    Journal = env['account.journal']
+    Account = env['account.account']
+
+    sales_journal = Journal.search([('type', '=', 'sale')], limit=1)
+    bank_journal = Journal.search([('type', '=', 'bank')], limit=1)
+    if not sales_journal or not bank_journal:
+        raise Exception("Sales and Bank journals are required. Please create them first.")
+
+    def account(code, type_code):
+        return Account.search([('code', '=', code)], limit=1) or Account.search([('account_type', '=', type_code)], limit=1)
+
+    # Account codes from custom_addons/asset_finance/data/account_chart_data.xml
+    accounts = {
+        'asset_account_id': account('2002', 'asset_receivable').id,
+        'income_account_id': account('5001', 'income').id,
+        'unearned_interest_account_id': account('2003', 'asset_current').id,
+    }
+    if not all(accounts.values()):
+        raise Exception("Missing required accounts. Please ensure the Chart of Accounts is installed.")
+
+    product = env['finance.product'].search([('name', '=', f'{prefix} Scale HP')], limit=1)
+    if not product:
+        product = env['finance.product'].create({
+            'name': f'{prefix} Scale HP',
+            'product_type': 'hp',
+            'active': True,
+            'default_int_rate': 2.5,
+            'min_months': 12,
+            'max_months': 84,
+        })
+
+    terms = env['finance.term'].search([('months', 'in', [36, 48, 60, 84])])
+    if not terms:
+        raise Exception("No finance terms (36-84 months) found. Please install the term data first.")
+
+    penalty_rule = env['finance.penalty.rule'].search([('method', '=', 'daily_percent')], limit=1)
+
+    return {
+        'sales_journal': sales_journal,
+        'bank_journal': bank_journal,
+        'accounts': accounts,
+        'product': product,
+        'terms': terms,
+        'penalty_rule': penalty_rule,
+    }
+
+
+def _create_partners(env, rng, count, prefix, batch_size):
+    Partner = env['res.partner'].with_context(**NO_TRACKING)
+    letters = 'ABCDEFGHIJZ'
+    vals_list = [{
+        'name': f'{prefix} Hirer {i:06d}',
+        'email': f'{prefix.lower()}.hirer{i}@example.com',
+        'phone': f'+65 9{rng.randint(0, 9999999):07d}',
+        'nric': f'S{i:07d}{letters[i % len(letters)]}',
+        'customer_rank': 1,
+        'is_finance_customer': True,
+    } for i in range(count)]
+    partner_ids = []
+    for batch in _batches(vals_list, batch_size):
+        partner_ids += Partner.create(batch).ids
+        env.cr.commit()
+    return partner_ids
+
+
+def _create_assets(env, rng, count, prefix, batch_size):
+    """Create one fleet vehicle and finance asset per contract"""
+    Brand = env['fleet.vehicle.model.brand']
+    Model = env['fleet.vehicle.model']
+    models_ = []
+    for make, names in MAKES.items():
+        brand = Brand.search([('name', '=', make)], limit=1) or Brand.create({'name': make})
+        for name in names:
+            model = Model.search([('brand_id', '=', brand.id), ('name', '=', name)], limit=1)
+            models_.append(model or Model.create({'brand_id': brand.id, 'name': name}))
+
+    Vehicle = env['fleet.vehicle'].with_context(**NO_TRACKING)
+    Asset = env['finance.asset'].with_context(**NO_TRACKING)
+    asset_ids = []
+    for batch in _batches(list(range(count)), batch_size):
+        vehicle_vals = []
+        for i in batch:
+            model = rng.choice(models_)
+            year = rng.randint(2018, 2025)
+            vehicle_vals.append({
+                'name': f'{prefix}{i:06d} - {model.brand_id.name} {model.name}',
+                'license_plate': f'{prefix}{i:06d}',
+                'vin_sn': f'{prefix}VIN{i:010d}',
+                'engine_no': f'{prefix}ENG{i:08d}',
+                'model_id': model.id,
+                'model_year': str(year),
+                'year_manufacture': year,
+            })
+        vehicles = Vehicle.create(vehicle_vals)
+        assets = Asset.create([{
+            'name': vehicle.name,
+            'asset_type': 'vehicle',
+            'vehicle_id': vehicle.id,
+        } for vehicle in vehicles])
+        asset_ids += assets.ids
+        env.cr.commit()
+    return asset_ids
+
+
+def _create_contracts(env, rng, setup, partner_ids, asset_ids, history_months, batch_size):
+    Contract = env['finance.contract'].with_context(**NO_TRACKING)
+    today = date.today()
+    contract_ids = []
+    patterns = {}
+    for batch in _batches(list(range(len(asset_ids))), batch_size):
+        vals_list = []
+        for i in batch:
+            agreement_date = today - relativedelta(days=rng.randint(0, history_months * 30))
+            cash_price = rng.randrange(30000, 180000, 500)
+            vals_list.append({
+                'product_id': setup['product'].id,
+                'asset_id': asset_ids[i],
+                'hirer_id': rng.choice(partner_ids),
+                'agreement_date': agreement_date,
+                'first_due_date': agreement_date + relativedelta(months=1),
+                'cash_price': cash_price,
+                'down_payment': round(cash_price * rng.choice([0.3, 0.4, 0.5])),
+                'int_rate_pa': rng.choice([2.28, 2.5, 2.78, 3.0]),
+                'no_of_inst': rng.choice(setup['terms']).id,
+                'interest_method': 'rule78',
+                'payment_scheme': 'arrears',
+                'penalty_rule_id': setup['penalty_rule'].id,
+                'journal_id': setup['sales_journal'].id,
+                **setup['accounts'],
+            })
+        contracts = Contract.create(vals_list)
+        contracts.write({'ac_status': 'active'})
+        for contract in contracts:
+            patterns[contract.id] = _pick_pattern(rng)
+        contract_ids += contracts.ids
+        env.cr.commit()
+    return contract_ids, patterns
+
+
+def _load_schedules(env, contract_ids, batch_size):
+    """Compute schedules in Python and COPY them into finance_contract_line"""
+    Contract = env['finance.contract'].with_context(**NO_TRACKING)
+    uid = env.uid
+    columns = ['contract_id', 'sequence', 'date_due', 'amount_principal', 'amount_interest',
+               'amount_total', 'interest_portion', 'penalty_applied', 'interest_recognized',
+               'create_uid', 'write_uid', 'create_date', 'write_date']
+    for batch in _batches(contract_ids, batch_size):
+        contracts = Contract.browse(batch)
+        rows = []
+        for contract in contracts:
+            for vals in contract._prepare_schedule_lines():
+                rows.append((
+                    contract.id, vals['sequence'], vals['date_due'], vals['amount_principal'],
+                    vals['amount_interest'], vals['amount_total'], vals['amount_interest'],
+                    'f', 'f', uid, uid, 'now', 'now',
+                ))
+        _copy_rows(env.cr, 'finance_contract_line', columns, rows)
+        # Stored computes depending on line_ids (overdue status, maturity, ...)
+        env.invalidate_all()
+        contracts.modified(['line_ids'])
+        env.flush_all()
+        env.cr.commit()
+
+
+def _create_invoices(env, setup, contract_ids, batch_size):
+    """Invoice every installment due up to today, as action_create_invoices does"""
+    Move = env['account.move'].with_context(**NO_TRACKING)
+    today = date.today()
+    invoice_ids = []
+    env.cr.execute("""
+        SELECT l.id FROM finance_contract_line l
+        WHERE l.contract_id = ANY(%s) AND l.invoice_id IS NULL AND l.date_due <= %s
+        ORDER BY l.contract_id, l.sequence
+    """, [contract_ids, today])
+    line_ids = [row[0] for row in env.cr.fetchall()]
+
+    for batch in _batches(line_ids, batch_size):
+        lines = env['finance.contract.line'].browse(batch)
+        vals_list = []
+        for line in lines:
+            contract = line.contract_id
+            invoice_lines = [(0, 0, {
+                'name': f"Principal Repayment (Inst #{line.sequence})",
+                'quantity': 1,
+                'price_unit': line.amount_principal,
+                'account_id': contract.asset_account_id.id,
+            })]
+            if line.amount_interest > 0:
+                invoice_lines.append((0, 0, {
+                    'name': f"Interest Charges (Inst #{line.sequence})",
+                    'quantity': 1,
+                    'price_unit': line.amount_interest,
+                    'account_id': contract.income_account_id.id,
+                    'tax_ids': [],
+                }))
+            vals_list.append({
+                'move_type': 'out_invoice',
+                'partner_id': contract.hirer_id.id,
+                'invoice_date': line.date_due,
+                'date': line.date_due,
+                'journal_id': contract.journal_id.id,
+                'invoice_origin': contract.agreement_no,
+                'payment_reference': contract.agreement_no,
+                'ref': f"Installment {line.sequence}/{contract.no_of_inst.months}",
+                'invoice_line_ids': invoice_lines,
+            })
+        invoices = Move.create(vals_list)
+        invoices.action_post()
+
+        env.cr.execute("CREATE TEMP TABLE IF NOT EXISTS scale_line_invoice (line_id int, invoice_id int) ON COMMIT DROP")
+        _copy_rows(env.cr, 'scale_line_invoice', ['line_id', 'invoice_id'], zip(batch, invoices.ids))
+        env.cr.execute("""
+            UPDATE finance_contract_line l SET invoice_id = t.invoice_id
+            FROM scale_line_invoice t WHERE l.id = t.line_id
+        """)
+        env.invalidate_all()
+        invoice_ids += invoices.ids
+        env.cr.commit()
+    return invoice_ids
+
+
+def _register_payments(env, setup, contract_ids, patterns, batch_size):
+    """Pay all invoiced installments except the most recent ones of late contracts"""
+    env.cr.execute("""
+        SELECT l.contract_id, l.invoice_id, l.date_due,
+               ROW_NUMBER() OVER (PARTITION BY l.contract_id ORDER BY l.sequence DESC) AS recent_rank
+        FROM finance_contract_line l
+        WHERE l.contract_id = ANY(%s) AND l.invoice_id IS NOT NULL
+    """, [contract_ids])
+    to_pay = {}
+    for contract_id, invoice_id, date_due, recent_rank in env.cr.fetchall():
+        if recent_rank > patterns[contract_id][1]:
+            to_pay.setdefault(date_due, []).append(invoice_id)
+
+    Payment = env['account.payment']
+    memo_field = 'memo' if 'memo' in Payment._fields else 'ref'
+    payment_count = 0
+    # One wizard run per due date so payment dates match the installments
+    for date_due, invoice_ids in sorted(to_pay.items()):
+        for batch in _batches(invoice_ids, batch_size):
+            wizard = env['account.payment.register'].with_context(
+                active_model='account.move', active_ids=batch, **NO_TRACKING
+            ).create({
+                'journal_id': setup['bank_journal'].id,
+                'payment_date': date_due,
+                'group_payment': False,
+            })
+            wizard.action_create_payments()
+            env.cr.execute("""
+                UPDATE finance_contract_line SET paid_date = date_due
+                WHERE invoice_id = ANY(%s)
+            """, [batch])
+            payment_count += len(batch)
+            env.cr.commit()
+
+    # Link payments to their contract through the agreement no. used as memo
+    env.cr.execute(f"""
+        UPDATE account_payment p SET contract_id = c.id
+        FROM finance_contract c
+        WHERE c.id = ANY(%s) AND p.contract_id IS NULL AND p.{memo_field} = c.agreement_no
+    """, [contract_ids])
+    env.invalidate_all()
+    env.cr.commit()
+    return payment_count
+
+
+def _refresh_contracts(env, contract_ids, batch_size):
+    """Recompute overdue status and paid counts after the invoice/payment SQL updates"""
+    Contract = env['finance.contract'].with_context(**NO_TRACKING)
+    for batch in _batches(contract_ids, batch_size):
+        contracts = Contract.browse(batch)
+        contracts.modified(['line_ids'])
+        env.flush_all()
+        env.invalidate_all()
+        env.cr.commit()
+
+
+def run_generator(env, contracts=100000, seed=42, batch_size=2000, history_months=6, prefix='SC'):
+    start = time.perf_counter()
+    rng = random.Random(seed)
+    env = env(context=dict(env.context, **NO_TRACKING))
+
+    print(f"\n--- GENERATING SCALE DATA: {contracts} contracts (seed {seed}) ---")
+    setup = _get_setup(env, prefix)
+
+    partner_ids = _create_partners(env, rng, max(1, int(contracts * 0.8)), prefix, batch_size)
+    _log(f"Partners: {len(partner_ids)}", start)
+
+    asset_ids = _create_assets(env, rng, contracts, prefix, batch_size)
+    _log(f"Fleet vehicles / assets: {len(asset_ids)}", start)
+
+    contract_ids, patterns = _create_contracts(env, rng, setup, partner_ids, asset_ids, history_months, batch_size)
+    _log(f"Contracts: {len(contract_ids)}", start)
+
+    _load_schedules(env, contract_ids, batch_size)
+    _log("Schedules loaded", start)
+
+    invoice_ids = _create_invoices(env, setup, contract_ids, batch_size)
+    _log(f"Invoices: {len(invoice_ids)}", start)
+
+    payment_count = _register_payments(env, setup, contract_ids, patterns, batch_size)
+    _log(f"Payments: {payment_count}", start)
+
+    _refresh_contracts(env, contract_ids, batch_size)
+    _log("Contract balances and overdue status refreshed", start)
+
+    for name, share, unpaid in OVERDUE_PATTERNS:
+        count = sum(1 for pattern in patterns.values() if pattern[0] == name)
+        print(f"  • {name}: {count} contracts ({unpaid} recent installments unpaid)")
+    print("------------------------------------------")
+
+
+if __name__ == '__main__':
+    run_generator(
+        env,
+        contracts=int(os.environ.get('SCALE_CONTRACTS', 100000)),
+        seed=int(os.environ.get('SCALE_SEED', 42)),
+        batch_size=int(os.environ.get('SCALE_BATCH', 2000)),
+        history_months=int(os.environ.get('SCALE_HISTORY_MONTHS', 6)),
+        prefix=os.environ.get('SCALE_PREFIX', 'SC'),
+    )
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------
+# LOAD TEST HARNESS FOR ASSET FINANCE
+# Drives a running Odoo over JSON-RPC with concurrent simulated staff:
+#
+#   - officers:   create contract -> generate schedule -> disburse
+#   - collectors: work the Collection Report list with muk_web_refresh
+#                 auto-reload (re-query every pager_autoload_interval)
+#                 and look accounts up with the finance quick search
+#   - managers:   load the dashboard widgets and the portfolio report
+#
+# Reports p50/p95/p99 latency per endpoint and database CPU.
+#
+# Run it from your machine against the docker-compose stack:
+#
+#   python testing/scripts/load_test.py --db odoo --officers 10 \
+#       --collectors 70 --managers 20 --duration 300 --db-container odoo-dev-db-1
+#
+# Requires users from setup_test_users.py and at least one existing
+# contract (e.g. from generate_scale_data.py) to copy master data from.
+# Only the Python standard library is used.
+# -------------------------------------------------------------------------
+import argparse
+import http.cookiejar
+import json
+import os
+import random
+import subprocess
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import defaultdict
+from datetime import date
+
+CONTRACT_TEMPLATE_FIELDS = [
+    'product_id', 'asset_id', 'hirer_id', 'no_of_inst', 'journal_id', 'asset_account_id',
+    'income_account_id', 'unearned_interest_account_id', 'interest_method', 'payment_scheme',
+]
+
+COLLECTION_SPEC = {
+    field: {} for field in [
+        'agreement_no', 'hirer_phone', 'asset_reg_no', 'total_overdue_days', 'late_status',
+        'os_balance', 'balance_late_charges', 'total_payable', 'priority_score', 'last_payment_date',
+    ]
+}
+COLLECTION_SPEC['hirer_id'] = {'fields': {'display_name': {}}}
+
+DASHBOARD_WIDGETS = ['kpis', 'mtd', 'aging', 'trend']
+
+
+class Stats:
+    """Thread-safe latency samples per endpoint"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def record(self, endpoint, seconds, ok=True):
+        with self.lock:
+            self.samples[endpoint].append(seconds)
+            if not ok:
+                self.errors[endpoint] += 1
+
+    def report(self, elapsed):
+        rows = []
+        with self.lock:
+            for endpoint, values in sorted(self.samples.items()):
+                values = sorted(values)
+                rows.append({
+                    'endpoint': endpoint,
+                    'requests': len(values),
+                    'errors': self.errors[endpoint],
+                    'rps': round(len(values) / elapsed, 2) if elapsed else 0,
+                    'p50_ms': round(_percentile(values, 50) * 1000, 1),
+                    'p95_ms': round(_percentile(values, 95) * 1000, 1),
+                    'p99_ms': round(_percentile(values, 99) * 1000, 1),
+                    'max_ms': round(values[-1] * 1000, 1),
+                })
+        return rows
+
+
+def _percentile(values, percent):
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, int(round(percent / 100.0 * len(values) + 0.5)) - 1))
+    return values[index]
+
+
+class OdooSession:
+    """One browser-like session: its own cookie jar and JSON-RPC calls"""
+
+    def __init__(self, url, db, login, password, stats, timeout=120):
+        self.url = url.rstrip('/')
+        self.db = db
+        self.login = login
+        self.password = password
+        self.stats = stats
+        self.timeout = timeout
+        self.etags = {}
+        self.session_info = {}
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar())
+        )
+
+    def _post(self, path, params, endpoint):
+        payload = json.dumps({'jsonrpc': '2.0', 'method': 'call', 'id': random.randint(0, 10 ** 9),
+                              'params': params}).encode()
+        req = urllib.request.Request(self.url + path, data=payload,
+                                     headers={'Content-Type': 'application/json'})
+        start = time.perf_counter()
+        ok = False
+        try:
+            with self.opener.open(req, timeout=self.timeout) as response:
+                body = json.loads(response.read())
+            ok = 'error' not in body
+            if not ok:
+                raise RuntimeError(body['error'].get('data', {}).get('message') or body['error'].get('message'))
+            return body['result']
+        finally:
+            self.stats.record(endpoint, time.perf_counter() - start, ok)
+
+    def authenticate(self):
+        self.session_info = self._post('/web/session/authenticate', {
+            'db': self.db, 'login': self.login, 'password': self.password,
+        }, 'session/authenticate')
+        return self.session_info
+
+    def call(self, model, method, args=None, kwargs=None):
+        return self._post(f'/web/dataset/call_kw/{model}/{method}', {
+            'model': model, 'method': method, 'args': args or [], 'kwargs': kwargs or {},
+        }, f'{model}/{method}')
+
+    def get(self, path, endpoint):
+        """GET with If-None-Match, like the dashboard client action"""
+        headers = {}
+        if path in self.etags:
+            headers['If-None-Match'] = self.etags[path]
+        req = urllib.request.Request(self.url + path, headers=headers)
+        start = time.perf_counter()
+        ok = True
+        try:
+            with self.opener.open(req, timeout=self.timeout) as response:
+                if response.headers.get('ETag'):
+                    self.etags[path] = response.headers['ETag']
+                return json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return None
+            ok = False
+            raise
+        finally:
+            self.stats.record(endpoint, time.perf_counter() - start, ok)
+
+
+# --------------------------------------------------------
+# SIMULATED USERS
+# --------------------------------------------------------
+
+def officer_flow(session, args, template, rng):
+    """Create contract -> generate schedule -> disburse"""
+    today = date.today().isoformat()
+    vals = dict(template)
+    cash_price = rng.randrange(30000, 150000, 500)
+    vals.update({
+        'agreement_date': today,
+        'cash_price': cash_price,
+        'down_payment': round(cash_price * 0.3),
+        'int_rate_pa': rng.choice([2.28, 2.5, 2.78]),
+    })
+    contract_id = session.call('finance.contract', 'create', [vals])
+    if isinstance(contract_id, list):
+        contract_id = contract_id[0]
+    session.call('finance.contract', 'web_read', [[contract_id]], {
+        'specification': {'agreement_no': {}, 'monthly_inst': {}, 'line_ids': {'fields': {'date_due': {}}}},
+    })
+    session.call('finance.contract', 'action_generate_schedule', [[contract_id]])
+    session.call('finance.contract', 'action_approve', [[contract_id]])
+
+    context = {'active_id': contract_id, 'active_model': 'finance.contract', 'default_contract_id': contract_id}
+    wizard_id = session.call('finance.disbursement.wizard', 'create', [{'journal_id': args.bank_journal_id}],
+                             {'context': context})
+    if isinstance(wizard_id, list):
+        wizard_id = wizard_id[0]
+    session.call('finance.disbursement.wizard', 'action_confirm_disbursement', [[wizard_id]],
+                 {'context': context})
+
+
+def collector_flow(session, args, template, rng):
+    """One auto-reload tick of the Collection Report list, sometimes opening a contract"""
+    result = session.call('finance.report.collection', 'web_search_read', [], {
+        'domain': [], 'specification': COLLECTION_SPEC, 'offset': 0, 'limit': 80,
+        'order': 'total_overdue_days desc, total_payable desc', 'count_limit': 10001,
+    })
+    records = result.get('records', [])
+    if records and rng.random() < args.open_rate:
+        record = rng.choice(records)
+        # Collectors usually type the last digits of the agreement number
+        term = urllib.parse.quote((record['agreement_no'] or '')[-5:])
+        session.get(f'/asset_finance/quick_search?q={term}', 'quick_search')
+        contract_ids = session.call('finance.contract', 'search', [[('agreement_no', '=', record['agreement_no'])]],
+                                    {'limit': 1})
+        if contract_ids:
+            session.call('finance.contract', 'web_read', [contract_ids], {
+                'specification': {'agreement_no': {}, 'total_overdue_days': {}, 'late_status': {},
+                                  'balance_late_charges': {}, 'line_ids': {'fields': {'date_due': {}}}},
+            })
+
+
+def manager_flow(session, args, template, rng):
+    """Load the dashboard widgets and the portfolio report"""
+    for widget in DASHBOARD_WIDGETS:
+        session.get(f'/asset_finance/dashboard/{widget}', f'dashboard/{widget}')
+    session.call('finance.report.portfolio', 'web_read_group', [], {
+        'domain': [], 'groupby': ['product_id'], 'aggregates': ['__count'],
+    })
+
+
+ROLES = {
+    'officer': officer_flow,
+    'collector': collector_flow,
+    'manager': manager_flow,
+}
+
+
+def run_user(role, index, args, template, stats, stop):
+    login, password = getattr(args, f'{role}_login'), getattr(args, f'{role}_password')
+    session = OdooSession(args.url, args.db, login, password, stats)
+    rng = random.Random(args.seed * 1000 + index)
+    try:
+        info = session.authenticate()
+    except Exception as e:
+        print(f"{role} #{index}: login failed ({e})")
+        return
+
+    if role == 'collector':
+        # Same cadence as muk_web_refresh auto-reload in the list view
+        interval = args.refresh_interval or info.get('pager_autoload_interval', 30000) / 1000.0
+    elif role == 'manager':
+        interval = args.dashboard_interval
+    else:
+        interval = args.think_time
+
+    # Ramp up so users do not all start on the same second
+    stop.wait(rng.uniform(0, args.ramp_up))
+    seen_errors = set()
+    while not stop.is_set():
+        try:
+            ROLES[role](session, args, template, rng)
+        except Exception as e:
+            # A broken flow must show up even without --verbose, once per user and message
+            if args.verbose or str(e) not in seen_errors:
+                print(f"{role} #{index}: {e}")
+            seen_errors.add(str(e))
+        stop.wait(rng.uniform(interval * 0.8, interval * 1.2))
+
+
+# --------------------------------------------------------
+# DATABASE CPU
+# --------------------------------------------------------
+
+class DbCpuSampler(threading.Thread):
+    """Sample database CPU through `docker stats` or local /proc postgres processes"""
+
+    def __init__(self, container=None, local=False, period=5.0):
+        super().__init__(daemon=True)
+        self.container = container
+        self.local = local
+        self.period = period
+        self.samples = []
+        self.stop_event = threading.Event()
+
+    def _docker_cpu(self):
+        output = subprocess.run(
+            ['docker', 'stats', '--no-stream', '--format', '{{.CPUPerc}}', self.container],
+            capture_output=True, text=True, timeout=30,
+        ).stdout.strip()
+        return float(output.rstrip('%')) if output else None
+
+    def _proc_ticks(self):
+        total = 0
+        for pid in os.listdir('/proc'):
+            if not pid.isdigit():
+                continue
+            try:
+                with open(f'/proc/{pid}/stat') as f:
+                    fields = f.read().rsplit(')', 1)
+                if 'postgres' not in fields[0]:
+                    continue
+                values = fields[1].split()
+                total += int(values[11]) + int(values[12])  # utime + stime
+            except (OSError, IndexError, ValueError):
+                continue
+        return total
+
+    def run(self):
+        ticks_per_second = os.sysconf('SC_CLK_TCK') if self.local else 0
+        last_ticks, last_time = (self._proc_ticks(), time.time()) if self.local else (0, 0)
+        while not self.stop_event.wait(self.period):
+            try:
+                if self.container:
+                    value = self._docker_cpu()
+                else:
+                    ticks, now = self._proc_ticks(), time.time()
+                    value = (ticks - last_ticks) / ticks_per_second / (now - last_time) * 100
+                    last_ticks, last_time = ticks, now
+                if value is not None:
+                    self.samples.append(value)
+            except Exception as e:
+                print(f"DB CPU sampling failed: {e}")
+                return
+
+    def report(self):
+        if not self.samples:
+            return None
+        values = sorted(self.samples)
+        return {
+            'samples': len(values),
+            'avg_percent': round(sum(values) / len(values), 1),
+            'p95_percent': round(_percentile(values, 95), 1),
+            'max_percent': round(values[-1], 1),
+        }
+
+
+# --------------------------------------------------------
+# MAIN
+# --------------------------------------------------------
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Asset Finance JSON-RPC load test")
+    parser.add_argument('--url', default='http://localhost:8069')
+    parser.add_argument('--db', required=True)
+    parser.add_argument('--officers', type=int, default=10)
+    parser.add_argument('--collectors', type=int, default=70)
+    parser.add_argument('--managers', type=int, default=20)
+    parser.add_argument('--duration', type=int, default=300, help="Seconds to run after ramp-up starts")
+    parser.add_argument('--ramp-up', type=float, default=30.0)
+    parser.add_argument('--think-time', type=float, default=20.0, help="Seconds between officer flows")
+    parser.add_argument('--refresh-interval', type=float, default=0,
+                        help="Collector reload seconds (default: pager_autoload_interval from the session)")
+    parser.add_argument('--dashboard-interval', type=float, default=60.0)
+    parser.add_argument('--open-rate', type=float, default=0.2, help="Chance a collector opens a contract per tick")
+    parser.add_argument('--seed', type=int, default=42)
+    for role, login in [('officer', 'finance.officer'), ('collector', 'collection.staff'),
+                        ('manager', 'finance.manager')]:
+        parser.add_argument(f'--{role}-login', default=login)
+        parser.add_argument(f'--{role}-password', default='test123')
+    parser.add_argument('--admin-login', default='finance.all', help="User used to read contract master data")
+    parser.add_argument('--admin-password', default='test123')
+    parser.add_argument('--db-container', help="Docker container of PostgreSQL for CPU sampling")
+    parser.add_argument('--db-local', action='store_true', help="Sample CPU of local postgres processes")
+    parser.add_argument('--output', help="Write the JSON report to this file")
+    parser.add_argument('--verbose', action='store_true')
+    return parser.parse_args()
+
+
+def load_template(args, stats):
+    """Copy master data (product, asset, accounts, ...) from an existing contract"""
+    session = OdooSession(args.url, args.db, args.admin_login, args.admin_password, stats)
+    session.authenticate()
+    contracts = session.call('finance.contract', 'search_read', [[]],
+                             {'fields': CONTRACT_TEMPLATE_FIELDS, 'limit': 1, 'order': 'id desc'})
+    if not contracts:
+        raise SystemExit("No finance.contract found: run generate_scale_data.py first.")
+    template = {
+        key: value[0] if isinstance(value, list) else value
+        for key, value in contracts[0].items() if key != 'id'
+    }
+    journals = session.call('account.journal', 'search', [[('type', '=', 'bank')]], {'limit': 1})
+    if not journals:
+        raise SystemExit("No bank journal found for disbursements.")
+    args.bank_journal_id = journals[0]
+    return template
+
+
+def main():
+    args = parse_args()
+    stats = Stats()
+    template = load_template(args, Stats())
+
+    sampler = None
+    if args.db_container or args.db_local:
+        sampler = DbCpuSampler(container=args.db_container, local=args.db_local)
+        sampler.start()
+
+    stop = threading.Event()
+    threads = []
+    for role, count in [('officer', args.officers), ('collector', args.collectors), ('manager', args.managers)]:
+        for index in range(count):
+            thread = threading.Thread(target=run_user, args=(role, index, args, template, stats, stop), daemon=True)
+            thread.start()
+            threads.append(thread)
+
+    print(f"Running {len(threads)} simulated users for {args.duration}s against {args.url} ({args.db})")
+    start = time.perf_counter()
+    try:
+        stop.wait(args.duration)
+    except KeyboardInterrupt:
+        pass
+    stop.set()
+    for thread in threads:
+        thread.join(timeout=60)
+    elapsed = time.perf_counter() - start
+
+    if sampler:
+        sampler.stop_event.set()
+
+    report = {
+        'users': {'officers': args.officers, 'collectors': args.collectors, 'managers': args.managers},
+        'duration_seconds': round(elapsed, 1),
+        'endpoints': stats.report(elapsed),
+        'db_cpu': sampler.report() if sampler else None,
+    }
+
+    print(f"\n{'Endpoint':<55}{'Reqs':>7}{'Err':>5}{'RPS':>8}{'p50':>9}{'p95':>9}{'p99':>9}")
+    for row in report['endpoints']:
+        print(f"{row['endpoint']:<55}{row['requests']:>7}{row['errors']:>5}{row['rps']:>8}"
+              f"{row['p50_ms']:>9}{row['p95_ms']:>9}{row['p99_ms']:>9}")
+    if report['db_cpu']:
+        cpu = report['db_cpu']
+        print(f"\nDatabase CPU: avg {cpu['avg_percent']}%  p95 {cpu['p95_percent']}%  max {cpu['max_percent']}%")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()